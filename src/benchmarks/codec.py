@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2026 agent <agent@local>
+
+codec.py: Benchmark packing and unpacking of binding function formats
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Usage: python codec.py
+#
+# Collects all request, response and callback format strings used by the
+# bindings and packs and unpacks each of them with the old per field
+# struct calls and with the precompiled Codec.
+
+import os
+import re
+import sys
+import glob
+import struct
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from brickv.bindings.ip_connection import get_codec, handle_deserialized_char, \
+                                          handle_deserialized_string, handle_serialized_string
+
+def collect_forms():
+    bindings_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'brickv', 'bindings')
+    request_forms = set()
+    response_forms = set()
+
+    for path in glob.glob(os.path.join(bindings_path, '*.py')):
+        with open(path, 'r') as f:
+            source = f.read()
+
+        for m in re.finditer(r"send_request\([^)]*\), '([^']*)', '([^']*)'\)", source):
+            request_forms.add(m.group(1))
+            response_forms.add(m.group(2))
+
+        for m in re.finditer(r"callback_formats\[[^]]*\] = '([^']*)'", source):
+            response_forms.add(m.group(1))
+
+    return sorted([f for f in request_forms if len(f) > 0]), \
+           sorted([f for f in response_forms if len(f) > 0])
+
+def make_values(form):
+    values = []
+
+    for f in form.split(' '):
+        count = int(f[:-1] or '1')
+
+        if 's' in f:
+            values.append('test')
+        elif 'c' in f:
+            values.append('a' if count == 1 else ['a'] * count)
+        elif '?' in f:
+            values.append(True if count == 1 else [True] * count)
+        else:
+            values.append(1 if count == 1 else [1] * count)
+
+    return values
+
+def old_serialize_data(data, form):
+    payload = bytes()
+
+    for f, d in zip(form.split(' '), data):
+        if len(f) > 1 and not 's' in f and not 'c' in f:
+            payload += struct.pack('<' + f, *d)
+        elif 's' in f:
+            payload += struct.pack('<' + f, handle_serialized_string(d))
+        elif 'c' in f:
+            if len(f) > 1:
+                for k in d:
+                    payload += struct.pack('<c', handle_serialized_string(k))
+            else:
+                payload += struct.pack('<' + f, handle_serialized_string(d))
+        else:
+            payload += struct.pack('<' + f, d)
+
+    return payload
+
+def old_deserialize_data(data, form):
+    ret = []
+
+    for f in form.split(' '):
+        f = '<' + f
+        length = struct.calcsize(f)
+
+        x = struct.unpack(f, data[:length])
+        if len(x) > 1:
+            if 'c' in f:
+                x = tuple([handle_deserialized_char(c) for c in x])
+            ret.append(x)
+        elif 'c' in f:
+            ret.append(handle_deserialized_char(x[0]))
+        elif 's' in f:
+            ret.append(handle_deserialized_string(x[0]))
+        else:
+            ret.append(x[0])
+
+        data = data[length:]
+
+    if len(ret) == 1:
+        return ret[0]
+    else:
+        return ret
+
+def main():
+    request_forms, response_forms = collect_forms()
+    requests = [(form, make_values(form)) for form in request_forms]
+    responses = [(form, b'\x00' * struct.calcsize('<' + form.replace(' ', ''))) for form in response_forms]
+
+    for form, data in responses:
+        if old_deserialize_data(data, form) != get_codec(form).unpack(data):
+            print('Codecs disagree about unpacking {0!r}'.format(form))
+            sys.exit(1)
+
+    for form, values in requests:
+        if old_serialize_data(values, form) != get_codec(form).pack(values):
+            print('Codecs disagree about packing {0!r}'.format(form))
+            sys.exit(1)
+
+    print('{0} request formats, {1} response formats'.format(len(requests), len(responses)))
+
+    def old_pack():
+        for form, values in requests:
+            old_serialize_data(values, form)
+
+    def new_pack():
+        for form, values in requests:
+            get_codec(form).pack(values)
+
+    def old_unpack():
+        for form, data in responses:
+            old_deserialize_data(data, form)
+
+    def new_unpack():
+        for form, data in responses:
+            get_codec(form).unpack(data)
+
+    for name, func, count in [('pack, per field', old_pack, len(requests)),
+                              ('pack, Codec', new_pack, len(requests)),
+                              ('unpack, per field', old_unpack, len(responses)),
+                              ('unpack, Codec', new_unpack, len(responses))]:
+        duration = min(timeit.repeat(func, number=100, repeat=5)) / 100
+
+        print('{0:>18}: {1:6.2f} us/format'.format(name, duration * 1000000 / count))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2026 agent <agent@local>
+
+receive_buffer.py: Benchmark packet framing of the IPConnection receive loop
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Usage: python receive_buffer.py [<capture-file>]
+#
+# The capture file contains the raw byte stream as received from brickd. If
+# no capture file is given then a stream of callback packets with lengths
+# between 8 and 80 bytes is generated. The stream is replayed in chunks of
+# the receive size through the old bytes slicing framer and ReceiveBuffer.
+# Both framers also parse the header fields that the receive loop needs to
+# dispatch a packet, the old framer with the old per-field functions.
+
+import os
+import sys
+import struct
+import random
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..'))
+
+from brickv.bindings.ip_connection import ReceiveBuffer
+
+def old_get_uid_from_data(data):
+    return struct.unpack('<I', data[0:4])[0]
+
+def old_get_length_from_data(data):
+    return struct.unpack('<B', data[4:5])[0]
+
+def old_get_function_id_from_data(data):
+    return struct.unpack('<B', data[5:6])[0]
+
+def old_get_sequence_number_from_data(data):
+    return (struct.unpack('<B', data[6:7])[0] >> 4) & 0x0F
+
+def generate_stream(packet_count):
+    rnd = random.Random(42)
+    packets = []
+
+    for i in range(packet_count):
+        length = rnd.choice([8, 10, 12, 16, 24, 32, 72, 80])
+        header = struct.pack('<IBBBB', rnd.randint(1, 0xFFFFFFFF), length, rnd.randint(1, 255), 0, 0)
+        packets.append(header + b'\x00' * (length - 8))
+
+    return b''.join(packets)
+
+def split_chunks(stream):
+    size = ReceiveBuffer.RECEIVE_SIZE
+
+    return [stream[i:i + size] for i in range(0, len(stream), size)]
+
+def frame_bytes(chunks):
+    pending_data = bytes()
+    count = 0
+
+    for data in chunks:
+        pending_data += data
+
+        while True:
+            if len(pending_data) < 8:
+                break
+
+            length = old_get_length_from_data(pending_data)
+
+            if len(pending_data) < length:
+                break
+
+            packet = pending_data[0:length]
+            pending_data = pending_data[length:]
+
+            function_id = old_get_function_id_from_data(packet)
+            sequence_number = old_get_sequence_number_from_data(packet)
+            uid = old_get_uid_from_data(packet)
+            count += 1
+
+    return count
+
+def frame_receive_buffer(chunks):
+    receive_buffer = ReceiveBuffer()
+    count = 0
+
+    for data in chunks:
+        receive_buffer.feed(data)
+
+        for header, packet in receive_buffer.packets():
+            uid, _, function_id, sequence_number_and_options, _ = header
+            sequence_number = (sequence_number_and_options >> 4) & 0x0F
+            count += 1
+
+    return count
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'rb') as f:
+            stream = f.read()
+    else:
+        stream = generate_stream(100000)
+
+    chunks = split_chunks(stream)
+    packet_count = frame_receive_buffer(chunks)
+
+    if frame_bytes(chunks) != packet_count:
+        print('Framers disagree about the packet count')
+        sys.exit(1)
+
+    print('{0} bytes, {1} packets, {2} chunks'.format(len(stream), packet_count, len(chunks)))
+
+    for name, framer in [('bytes slicing', frame_bytes), ('ReceiveBuffer', frame_receive_buffer)]:
+        duration = min(timeit.repeat(lambda: framer(chunks), number=1, repeat=5))
+
+        print('{0:>15}: {1:8.2f} ms, {2:6.2f} us/packet'.format(name, duration * 1000, duration * 1000000 / packet_count))
+
+if __name__ == '__main__':
+    main()
@@ -25,9 +25,11 @@ Boston, MA 02111-1307, USA.
 from PyQt4.QtGui import QApplication
 from PyQt4.QtCore import QThread, QEvent
 from threading import Lock
-from collections import namedtuple
+from collections import namedtuple, deque
 import logging
 import functools
+import sys
+import time
 from brickv.bindings import ip_connection
 
 try:
@@ -36,25 +38,182 @@ except:
     from Queue import Queue # Python 2 fallback
 
 ASYNC_EVENT = 12345
+ASYNC_WORKER_COUNT = 4
+ASYNC_EVENT_TIME_BUDGET = 0.05 # seconds
 
-async_call_queue = Queue()
 async_event_queue = Queue()
+async_event_lock = Lock()
+async_event_pending = False # protected by async_event_lock
+async_event_receiver = None
+async_event_stats = {'events_posted': 0, 'results_queued': 0, 'results_delivered': 0} # protected by async_event_lock
 async_session_lock = Lock()
 async_session_id = 1
 
-AsyncCall = namedtuple('AsyncCall', 'func_to_call parameter result_callback error_callback report_exception log_exception session_id')
+AsyncCall = namedtuple('AsyncCall', 'func_to_call parameter result_callback error_callback report_exception log_exception session_id device_key call_site enqueue_time')
+
+def async_get_device_key(func_to_call):
+    # calls for the same device are done in order, calls for different
+    # devices are done in parallel. calls that cannot be associated with a
+    # device share the None key and are done in order as well
+    while isinstance(func_to_call, functools.partial):
+        func_to_call = func_to_call.func
+
+    obj = getattr(func_to_call, '__self__', None)
+
+    # RED Brick objects and sessions refer to their Brick
+    obj = getattr(obj, '_session', obj)
+    obj = getattr(obj, '_brick', obj)
+
+    if isinstance(obj, ip_connection.Device):
+        return obj.uid
+
+    return None
+
+class AsyncCallQueue(object):
+    """
+    Holds a FIFO of pending calls per device. A device is handed to at most
+    one worker at a time, so calls for the same device stay in order.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.pending = {} # device key -> deque of AsyncCall, protected by lock
+        self.ready = Queue() # device keys with pending calls and no worker
+
+        # statistics, protected by lock
+        self.call_site_stats = {} # call site -> [count, latency sum, latency max]
+
+    def put(self, ac):
+        with self.lock:
+            calls = self.pending.get(ac.device_key)
+
+            if calls is None:
+                # no worker is busy with this device, make it ready
+                self.pending[ac.device_key] = deque([ac])
+                self.ready.put(ac.device_key)
+            else:
+                calls.append(ac)
+
+    def get(self):
+        # returns the next call of a ready device, the device stays owned
+        # by the calling worker until done is called for it
+        while True:
+            device_key = self.ready.get()
+
+            with self.lock:
+                calls = self.pending.get(device_key)
+
+                if calls is None:
+                    continue
+
+                if len(calls) == 0:
+                    del self.pending[device_key]
+                    continue
+
+                return calls.popleft()
+
+    def done(self, ac):
+        latency = time.time() - ac.enqueue_time
+
+        with self.lock:
+            stats = self.call_site_stats.get(ac.call_site)
+
+            if stats is None:
+                self.call_site_stats[ac.call_site] = [1, latency, latency]
+            else:
+                stats[0] += 1
+                stats[1] += latency
+                stats[2] = max(stats[2], latency)
+
+            calls = self.pending.get(ac.device_key)
+
+            if calls is not None:
+                if len(calls) > 0:
+                    self.ready.put(ac.device_key)
+                else:
+                    del self.pending[ac.device_key]
+
+    def clear(self, device_key=None):
+        # clears the pending calls of one device or of all devices. the
+        # deques stay in place, because workers might still own them
+        with self.lock:
+            if device_key is None:
+                for calls in self.pending.values():
+                    calls.clear()
+            elif device_key in self.pending:
+                self.pending[device_key].clear()
+
+    def get_stats(self):
+        """
+        Returns the number of pending calls per device key and the call
+        count and the average and maximum latency in seconds per call site.
+        A call site is a (filename, line number) pair.
+        """
+
+        with self.lock:
+            depths = dict([(key, len(calls)) for key, calls in self.pending.items()])
+            sites = dict([(site, {'count': stats[0],
+                                  'latency_avg': stats[1] / stats[0],
+                                  'latency_max': stats[2]})
+                          for site, stats in self.call_site_stats.items()])
+
+        return {'queue_depths': depths, 'call_sites': sites}
+
+async_call_queue = AsyncCallQueue()
 
 def async_call(func_to_call, parameter=None, result_callback=None,
                error_callback=None, report_exception=False, log_exception=False):
+    frame = sys._getframe(1)
+    call_site = (frame.f_code.co_filename, frame.f_lineno)
+    frame = None
+
     with async_session_lock:
         async_call_queue.put(AsyncCall(func_to_call, parameter, result_callback,
                                        error_callback, report_exception,
-                                       log_exception, async_session_id))
+                                       log_exception, async_session_id,
+                                       async_get_device_key(func_to_call),
+                                       call_site, time.time()))
+
+def async_post_event_unlocked():
+    # NOTE: assumes that async_event_lock is locked
+    global async_event_pending
+
+    # only one event is pending at a time, it delivers all queued results
+    if not async_event_pending and async_event_receiver != None:
+        async_event_pending = True
+        async_event_stats['events_posted'] += 1
+
+        QApplication.postEvent(async_event_receiver, QEvent(ASYNC_EVENT))
+
+def async_put_result(func):
+    async_event_queue.put(func)
+
+    with async_event_lock:
+        async_event_stats['results_queued'] += 1
+
+        async_post_event_unlocked()
 
 def async_event_handler():
+    global async_event_pending
+
+    with async_event_lock:
+        # results queued from now on need a new event
+        async_event_pending = False
+
+    start = time.time()
+    delivered = 0
+
     while not async_event_queue.empty():
+        if time.time() - start > ASYNC_EVENT_TIME_BUDGET:
+            # keep the GUI responsive, deliver the rest with the next event
+            with async_event_lock:
+                async_post_event_unlocked()
+
+            break
+
         try:
             func = async_event_queue.get(False, 0)
+            delivered += 1
 
             if func:
                 func()
@@ -63,15 +222,32 @@ def async_event_handler():
         except:
             logging.exception('Error while delivering async call result')
 
+    with async_event_lock:
+        async_event_stats['results_delivered'] += delivered
+
+def async_get_event_stats():
+    """
+    Returns the number of posted events, queued results and delivered
+    results. The difference between queued and delivered results is the
+    current backlog.
+    """
+
+    with async_event_lock:
+        return dict(async_event_stats)
+
 def async_next_session():
     with async_session_lock:
         global async_session_id
         async_session_id += 1
 
-        with async_call_queue.mutex:
-            async_call_queue.queue.clear()
+        async_call_queue.clear()
+
+def async_get_stats():
+    return async_call_queue.get_stats()
 
 def async_start_thread(parent):
+    global async_event_receiver
+
     class AsyncThread(QThread):
         def __init__(self, parent=None):
             QThread.__init__(self, parent)
@@ -80,55 +256,60 @@ def async_start_thread(parent):
             while True:
                 ac = async_call_queue.get()
 
-                if not ac.func_to_call:
-                    continue
+                try:
+                    self.handle(ac)
+                finally:
+                    async_call_queue.done(ac)
 
-                result = None
+        def handle(self, ac):
+            if not ac.func_to_call:
+                return
 
-                try:
-                    if ac.parameter == None:
-                        result = ac.func_to_call()
-                    elif isinstance(ac.parameter, tuple):
-                        result = ac.func_to_call(*ac.parameter)
-                    else:
-                        result = ac.func_to_call(ac.parameter)
-                except Exception as e:
-                    with async_session_lock:
-                        if ac.session_id != async_session_id:
-                            continue
-
-                    if ac.error_callback != None:
-                        if ac.log_exception:
-                            logging.exception('Error while doing async call')
-
-                        if ac.report_exception:
-                            async_event_queue.put(functools.partial(ac.error_callback, e))
-                        else:
-                            async_event_queue.put(ac.error_callback)
-
-                        if isinstance(e, ip_connection.Error):
-                            # clear the async call queue if an IPConnection
-                            # error occurred. in this case we assume that the
-                            # next calls will also fail
-                            with async_call_queue.mutex:
-                                async_call_queue.queue.clear()
-
-                        QApplication.postEvent(self, QEvent(ASYNC_EVENT))
-                        continue
-
-                if ac.result_callback != None:
-                    with async_session_lock:
-                        if ac.session_id != async_session_id:
-                            continue
-
-                    if result == None:
-                        async_event_queue.put(ac.result_callback)
+            result = None
+
+            try:
+                if ac.parameter == None:
+                    result = ac.func_to_call()
+                elif isinstance(ac.parameter, tuple):
+                    result = ac.func_to_call(*ac.parameter)
+                else:
+                    result = ac.func_to_call(ac.parameter)
+            except Exception as e:
+                with async_session_lock:
+                    if ac.session_id != async_session_id:
+                        return
+
+                if ac.error_callback != None:
+                    if ac.log_exception:
+                        logging.exception('Error while doing async call')
+
+                    if ac.report_exception:
+                        async_put_result(functools.partial(ac.error_callback, e))
                     else:
-                        async_event_queue.put(functools.partial(ac.result_callback, result))
+                        async_put_result(ac.error_callback)
+
+                    if isinstance(e, ip_connection.Error):
+                        # clear the async call queue of the device if an
+                        # IPConnection error occurred. in this case we assume
+                        # that the next calls for this device will also fail
+                        async_call_queue.clear(ac.device_key)
+
+                    return
+
+            if ac.result_callback != None:
+                with async_session_lock:
+                    if ac.session_id != async_session_id:
+                        return
+
+                if result == None:
+                    async_put_result(ac.result_callback)
+                else:
+                    async_put_result(functools.partial(ac.result_callback, result))
 
-                    QApplication.postEvent(self, QEvent(ASYNC_EVENT))
+    async_threads = [AsyncThread(parent) for i in range(ASYNC_WORKER_COUNT)]
+    async_event_receiver = async_threads[0]
 
-    async_thread = AsyncThread(parent)
-    async_thread.start()
+    for async_thread in async_threads:
+        async_thread.start()
 
-    return async_thread
+    return async_threads
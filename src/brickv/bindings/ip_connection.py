@@ -6,7 +6,7 @@
 # with or without modification, are permitted. See the Creative
 # Commons Zero (CC0 1.0) License for more details.
 
-from threading import Thread, Lock, Semaphore
+from threading import Thread, Lock, Semaphore, Condition
 
 # current_thread for python 2.6, currentThread for python 2.5
 try:
@@ -40,20 +40,22 @@ if sys.hexversion < 0x02060000:
 else:
     from collections import namedtuple
 
+header_struct = struct.Struct('<IBBBB')
+
 def get_uid_from_data(data):
-    return struct.unpack('<I', data[0:4])[0]
+    return struct.unpack_from('<I', data, 0)[0]
 
 def get_length_from_data(data):
-    return struct.unpack('<B', data[4:5])[0]
+    return struct.unpack_from('<B', data, 4)[0]
 
 def get_function_id_from_data(data):
-    return struct.unpack('<B', data[5:6])[0]
+    return struct.unpack_from('<B', data, 5)[0]
 
 def get_sequence_number_from_data(data):
-    return (struct.unpack('<B', data[6:7])[0] >> 4) & 0x0F
+    return (struct.unpack_from('<B', data, 6)[0] >> 4) & 0x0F
 
 def get_error_code_from_data(data):
-    return (struct.unpack('<B', data[7:8])[0] >> 6) & 0x03
+    return (struct.unpack_from('<B', data, 7)[0] >> 6) & 0x03
 
 BASE58 = '123456789abcdefghijkmnopqrstuvwxyzABCDEFGHJKLMNPQRSTUVWXYZ'
 def base58encode(value):
@@ -86,6 +88,223 @@ def uid64_to_uid32(uid64):
 
     return uid32
 
+def handle_deserialized_char(c):
+    if sys.hexversion >= 0x03000000:
+        try:
+            # c is a bytes object, try to decode it as ASCII. if it is
+            # not decodable keep it as a bytes object because there is no
+            # other option for this in Python 3
+            c = c.decode('ascii')
+        except:
+            pass
+
+    return c
+
+def handle_deserialized_string(s):
+    nul = b'\x00'
+
+    if sys.hexversion >= 0x03000000:
+        try:
+            # s is a bytes object, try to decode it as ASCII. if it is
+            # not decodable keep it as a bytes object because there is no
+            # other option for this in Python 3
+            s = s.decode('ascii')
+            nul = '\x00'
+        except:
+            pass
+
+    i = s.find(nul)
+    if i >= 0:
+        s = s[:i]
+
+    return s
+
+def handle_serialized_string(s):
+    if sys.hexversion < 0x03000000:
+        if isinstance(s, unicode):
+            return ''.join(map(chr, map(ord, s)))
+    else:
+        if isinstance(s, str):
+            return bytes(map(ord, s))
+
+    return s
+
+class Codec:
+    """
+    Packs and unpacks the values of a space separated format string such as
+    '8s 8s c 3B 3B H' with a single precompiled struct.Struct.
+    """
+
+    KIND_SCALAR = 0
+    KIND_ARRAY = 1
+    KIND_CHAR = 2
+    KIND_CHAR_ARRAY = 3
+    KIND_STRING = 4
+
+    def __init__(self, form):
+        if len(form) > 0:
+            fields = form.split(' ')
+        else:
+            fields = []
+
+        self.struct = struct.Struct('<' + ''.join(fields))
+        self.size = self.struct.size
+        self.fields = [] # (kind, count)
+
+        for f in fields:
+            if 's' in f:
+                self.fields.append((Codec.KIND_STRING, 1))
+            else:
+                count = int(f[:-1] or '1')
+
+                if 'c' in f:
+                    kind = Codec.KIND_CHAR if count == 1 else Codec.KIND_CHAR_ARRAY
+                else:
+                    kind = Codec.KIND_SCALAR if count == 1 else Codec.KIND_ARRAY
+
+                self.fields.append((kind, count))
+
+        # plain numbers can be returned as unpacked without post-processing
+        self.plain = all([kind == Codec.KIND_SCALAR for kind, _ in self.fields])
+
+    def unpack(self, data, offset=0):
+        values = self.struct.unpack_from(data, offset)
+
+        if self.plain:
+            if len(values) == 1:
+                return values[0]
+            else:
+                return list(values)
+
+        ret = []
+        i = 0
+
+        for kind, count in self.fields:
+            if kind == Codec.KIND_SCALAR:
+                ret.append(values[i])
+            elif kind == Codec.KIND_ARRAY:
+                ret.append(values[i:i + count])
+            elif kind == Codec.KIND_CHAR:
+                ret.append(handle_deserialized_char(values[i]))
+            elif kind == Codec.KIND_CHAR_ARRAY:
+                ret.append(tuple([handle_deserialized_char(c) for c in values[i:i + count]]))
+            else:
+                ret.append(handle_deserialized_string(values[i]))
+
+            i += count
+
+        if len(ret) == 1:
+            return ret[0]
+        else:
+            return ret
+
+    def pack(self, data):
+        if self.plain:
+            return self.struct.pack(*data)
+
+        values = []
+
+        for (kind, count), d in zip(self.fields, data):
+            if kind == Codec.KIND_SCALAR:
+                values.append(d)
+            elif kind == Codec.KIND_ARRAY:
+                # check each array on its own, otherwise a too short and a too
+                # long array would be packed into the wrong fields unnoticed
+                if count != len(d):
+                    raise struct.error('pack expected {0} items for packing (got {1})'.format(count, len(d)))
+
+                values.extend(d)
+            elif kind == Codec.KIND_CHAR:
+                values.append(handle_serialized_string(d))
+            elif kind == Codec.KIND_CHAR_ARRAY:
+                if count != len(d):
+                    raise ValueError('Incorrect char list length')
+
+                values.extend([handle_serialized_string(c) for c in d])
+            else:
+                values.append(handle_serialized_string(d))
+
+        return self.struct.pack(*values)
+
+codecs = {}
+
+def get_codec(form):
+    try:
+        return codecs[form]
+    except KeyError:
+        codec = Codec(form)
+        codecs[form] = codec
+
+        return codec
+
+class ReceiveBuffer:
+    RECEIVE_SIZE = 8192
+
+    def __init__(self, capacity=RECEIVE_SIZE * 2):
+        self.buffer = bytearray(capacity)
+        self.view = memoryview(self.buffer)
+        self.read_offset = 0 # start of the first incomplete packet
+        self.write_offset = 0 # end of the received data
+
+    def make_room(self, size):
+        if self.read_offset == self.write_offset:
+            self.read_offset = 0
+            self.write_offset = 0
+        elif len(self.buffer) - self.write_offset < size:
+            # move the incomplete tail packet to the front. it is shorter
+            # than 256 bytes, so this is cheap compared to the receive
+            pending = self.write_offset - self.read_offset
+
+            self.buffer[0:pending] = self.view[self.read_offset:self.write_offset]
+            self.read_offset = 0
+            self.write_offset = pending
+
+    def receive(self, sock):
+        self.make_room(ReceiveBuffer.RECEIVE_SIZE)
+
+        length = sock.recv_into(self.view[self.write_offset:self.write_offset + ReceiveBuffer.RECEIVE_SIZE])
+        self.write_offset += length
+
+        return length
+
+    def feed(self, data):
+        length = len(data)
+
+        self.make_room(length)
+
+        if len(self.buffer) - self.write_offset < length:
+            self.buffer.extend(bytearray(length))
+            self.view = memoryview(self.buffer)
+
+        self.buffer[self.write_offset:self.write_offset + length] = data
+        self.write_offset += length
+
+    def packets(self):
+        """
+        Yields the header of each complete packet as parsed by header_struct
+        and the packet itself. The header is parsed from the buffer directly,
+        the packet is copied once, because it is handed to other threads and
+        the buffer is reused by the next receive. The read offset is advanced
+        before a packet is yielded, so the caller can stop at any packet.
+        """
+
+        buffer = self.buffer
+        offset = self.read_offset
+        end = self.write_offset
+
+        while end - offset >= 8:
+            length = buffer[offset + 4]
+
+            if end - offset < length:
+                # Wait for complete packet
+                break
+
+            self.read_offset = offset + length
+
+            yield header_struct.unpack_from(buffer, offset), bytes(buffer[offset:offset + length])
+
+            offset += length
+
 class Error(Exception):
     TIMEOUT = -1
     NOT_ADDED = -6 # obsolete since v2.0
@@ -124,11 +343,14 @@ class Device:
         self.ipcon = ipcon
         self.api_version = (0, 0, 0)
         self.registered_callbacks = {}
+        self.registered_batch_callbacks = {}
         self.callback_formats = {}
         self.expected_response_function_id = None # protected by request_lock
         self.expected_response_sequence_number = None # protected by request_lock
         self.response_queue = Queue()
         self.request_lock = Lock()
+        self.pending_responses = {} # protected by pending_responses_condition
+        self.pending_responses_condition = Condition(Lock())
 
         self.response_expected = [Device.RESPONSE_EXPECTED_INVALID_FUNCTION_ID] * 256
         self.response_expected[IPConnection.FUNCTION_ENUMERATE] = Device.RESPONSE_EXPECTED_ALWAYS_FALSE
@@ -150,6 +372,21 @@ class Device:
 
         return self.api_version
 
+    def register_batch_callback(self, id, callback):
+        """
+        Registers a batch-aware callback with ID *id* to the function
+        *callback*. Instead of being called once per packet the function is
+        called with a list of all packets for this callback that arrived
+        since the last call. Each list entry is the single argument or the
+        tuple of arguments the normal callback function would have been
+        called with. Registering *None* removes the batch-aware callback.
+        """
+
+        if callback is None:
+            self.registered_batch_callbacks.pop(id, None)
+        else:
+            self.registered_batch_callbacks[id] = callback
+
     def get_response_expected(self, function_id):
         """
         Returns the response expected flag for the function specified by the
@@ -286,6 +523,12 @@ class IPConnection:
 
     DISCONNECT_PROBE_INTERVAL = 5
 
+    # maximum number of queue items the callback thread handles in one go
+    CALLBACK_BATCH_SIZE = 1000
+
+    # sequence numbers 1 to 15 are available for requests, 0 is used for callbacks
+    PIPELINE_MAX_IN_FLIGHT = 15
+
     class CallbackContext:
         def __init__(self):
             self.queue = None
@@ -293,6 +536,44 @@ class IPConnection:
             self.packet_dispatch_allowed = False
             self.lock = None
 
+    class PendingResponse:
+        def __init__(self, ipcon, device, function_id, sequence_number, form_ret, deadline):
+            self.ipcon = ipcon
+            self.device = device
+            self.function_id = function_id
+            self.sequence_number = sequence_number
+            self.form_ret = form_ret
+            self.deadline = deadline
+            self.queue = Queue()
+
+        def get(self):
+            """
+            Blocks until the response for this request arrived and returns its
+            deserialized data. Raises a timeout error if the response did not
+            arrive within the timeout of the IP Connection.
+            """
+
+            if self.device is None:
+                # response expected flag was not set, nothing to wait for
+                return None
+
+            try:
+                response = self.queue.get(True, max(self.deadline - time.time(), 0))
+            except Empty:
+                condition = self.device.pending_responses_condition
+
+                with condition:
+                    key = (self.function_id, self.sequence_number)
+
+                    if self.device.pending_responses.get(key) is self:
+                        del self.device.pending_responses[key]
+                        condition.notify()
+
+                msg = 'Did not receive response for function {0} in time'.format(self.function_id)
+                raise Error(Error.TIMEOUT, msg)
+
+            return self.ipcon.handle_request_response(response, self.function_id, self.form_ret)
+
     def __init__(self):
         """
         Creates an IP Connection object that can be used to enumerate the available
@@ -305,6 +586,7 @@ class IPConnection:
         self.auto_reconnect = True
         self.auto_reconnect_allowed = False
         self.auto_reconnect_pending = False
+        self.pipelining = False
         self.sequence_number_lock = Lock()
         self.next_sequence_number = 0 # protected by sequence_number_lock
         self.authentication_lock = Lock() # protects authentication handshake
@@ -458,6 +740,32 @@ class IPConnection:
 
         return self.auto_reconnect
 
+    def set_pipelining(self, pipelining):
+        """
+        Enables or disables request pipelining. If pipelining is enabled,
+        getters and setters with activated response expected flag don't
+        block each other anymore while waiting for their response. Up to 15
+        requests can be in flight per device at the same time and each
+        response is routed to its request by function ID and sequence number.
+
+        The getters and setters of the devices still block until their
+        response arrived. A single thread that calls them one after another
+        gains nothing, only callers that send requests to the same device
+        from several threads at once or that use send_request_pipelined
+        directly benefit. Brick Viewer itself doesn't enable pipelining.
+
+        Default value is *False*.
+        """
+
+        self.pipelining = bool(pipelining)
+
+    def get_pipelining(self):
+        """
+        Returns *true* if request pipelining is enabled, *false* otherwise.
+        """
+
+        return self.pipelining
+
     def set_timeout(self, timeout):
         """
         Sets the timeout in seconds for getters and for setters for which the
@@ -667,14 +975,11 @@ class IPConnection:
         self.socket = None
 
     def receive_loop(self, socket_id):
-        if sys.hexversion < 0x03000000:
-            pending_data = ''
-        else:
-            pending_data = bytes()
+        receive_buffer = ReceiveBuffer()
 
         while self.receive_flag:
             try:
-                data = self.socket.recv(8192)
+                length = receive_buffer.receive(self.socket)
             except socket.error:
                 if self.receive_flag:
                     e = sys.exc_info()[1]
@@ -684,28 +989,16 @@ class IPConnection:
                     self.handle_disconnect_by_peer(IPConnection.DISCONNECT_REASON_ERROR, socket_id, False)
                 break
 
-            if len(data) == 0:
+            if length == 0:
                 if self.receive_flag:
                     self.handle_disconnect_by_peer(IPConnection.DISCONNECT_REASON_SHUTDOWN, socket_id, False)
                 break
 
-            pending_data += data
-
-            while self.receive_flag:
-                if len(pending_data) < 8:
-                    # Wait for complete header
+            for header, packet in receive_buffer.packets():
+                if not self.receive_flag:
                     break
 
-                length = get_length_from_data(pending_data)
-
-                if len(pending_data) < length:
-                    # Wait for complete packet
-                    break
-
-                packet = pending_data[0:length]
-                pending_data = pending_data[length:]
-
-                self.handle_response(packet)
+                self.handle_response(header, packet)
 
     def dispatch_meta(self, function_id, parameter, socket_id):
         if function_id == IPConnection.CALLBACK_CONNECTED:
@@ -762,16 +1055,13 @@ class IPConnection:
                         time.sleep(0.1)
 
     def dispatch_packet(self, packet):
-        uid = get_uid_from_data(packet)
-        length = get_length_from_data(packet)
-        function_id = get_function_id_from_data(packet)
-        payload = packet[8:]
+        uid, _, function_id, _, _ = header_struct.unpack_from(packet)
 
         if function_id == IPConnection.CALLBACK_ENUMERATE and \
            IPConnection.CALLBACK_ENUMERATE in self.registered_callbacks:
             uid, connected_uid, position, hardware_version, \
                 firmware_version, device_identifier, enumeration_type = \
-                self.deserialize_data(payload, '8s 8s c 3B 3B H B')
+                get_codec('8s 8s c 3B 3B H B').unpack(packet, 8)
 
             cb = self.registered_callbacks[IPConnection.CALLBACK_ENUMERATE]
             cb(uid, connected_uid, position, hardware_version,
@@ -791,26 +1081,88 @@ class IPConnection:
             if len(form) == 0:
                 cb()
             elif len(form) == 1:
-                cb(self.deserialize_data(payload, form))
+                cb(get_codec(form).unpack(packet, 8))
+            else:
+                cb(*get_codec(form).unpack(packet, 8))
+
+    def dispatch_packets(self, callback, packets):
+        # packets for batch-aware callbacks are grouped per device and
+        # function, all other packets are dispatched one by one in order
+        batches = {}
+        batch_order = []
+
+        for packet in packets:
+            # don't dispatch callbacks when the receive thread isn't running
+            if not callback.packet_dispatch_allowed:
+                return
+
+            uid, _, function_id, _, _ = header_struct.unpack_from(packet)
+            device = self.devices.get(uid)
+
+            if device is None or function_id not in device.registered_batch_callbacks:
+                self.dispatch_packet(packet)
+                continue
+
+            key = (uid, function_id)
+
+            if key not in batches:
+                batches[key] = []
+                batch_order.append(key)
+
+            batches[key].append(packet)
+
+        for key in batch_order:
+            uid, function_id = key
+            device = self.devices.get(uid)
+
+            if device is None:
+                continue
+
+            cb = device.registered_batch_callbacks.get(function_id)
+
+            if cb is None:
+                continue
+
+            form = device.callback_formats[function_id]
+
+            if len(form) == 0:
+                cb([None] * len(batches[key]))
             else:
-                cb(*self.deserialize_data(payload, form))
+                codec = get_codec(form)
+                cb([codec.unpack(packet, 8) for packet in batches[key]])
 
     def callback_loop(self, callback):
         while True:
-            kind, data = callback.queue.get()
+            items = [callback.queue.get()]
+
+            # drain everything that is already pending to handle it in one go
+            try:
+                while len(items) < IPConnection.CALLBACK_BATCH_SIZE:
+                    items.append(callback.queue.get_nowait())
+            except Empty:
+                pass
+
+            packets = []
+
+            for kind, data in items:
+                # FIXME: cannot hold callback lock here because this can
+                #        deadlock due to an ordering problem with the socket lock
+                #with callback.lock:
+                if kind == IPConnection.QUEUE_PACKET:
+                    packets.append(data)
+                    continue
+
+                if len(packets) > 0:
+                    self.dispatch_packets(callback, packets)
+                    packets = []
 
-            # FIXME: cannot hold callback lock here because this can
-            #        deadlock due to an ordering problem with the socket lock
-            #with callback.lock:
-            if True:
                 if kind == IPConnection.QUEUE_EXIT:
-                    break
+                    return
                 elif kind == IPConnection.QUEUE_META:
                     self.dispatch_meta(*data)
-                elif kind == IPConnection.QUEUE_PACKET:
-                    # don't dispatch callbacks when the receive thread isn't running
-                    if callback.packet_dispatch_allowed:
-                        self.dispatch_packet(data)
+
+            if len(packets) > 0:
+                self.dispatch_packets(callback, packets)
 
     # NOTE: the disconnect probe thread is not allowed to hold the socket_lock at any
     #       time because it is created and joined while the socket_lock is locked
@@ -836,60 +1188,13 @@ class IPConnection:
                 self.disconnect_probe_flag = True
 
     def deserialize_data(self, data, form):
-        ret = []
-        for f in form.split(' '):
-            f = '<' + f
-            length = struct.calcsize(f)
-
-            x = struct.unpack(f, data[:length])
-            if len(x) > 1:
-                if 'c' in f:
-                    x = tuple([self.handle_deserialized_char(c) for c in x])
-                ret.append(x)
-            elif 'c' in f:
-                ret.append(self.handle_deserialized_char(x[0]))
-            elif 's' in f:
-                ret.append(self.handle_deserialized_string(x[0]))
-            else:
-                ret.append(x[0])
-
-            data = data[length:]
-
-        if len(ret) == 1:
-            return ret[0]
-        else:
-            return ret
+        return get_codec(form).unpack(data)
 
     def handle_deserialized_char(self, c):
-        if sys.hexversion >= 0x03000000:
-            try:
-                # c is a bytes object, try to decode it as ASCII. if it is
-                # not decodable keep it as a bytes object because there is no
-                # other option for this in Python 3
-                c = c.decode('ascii')
-            except:
-                pass
-
-        return c
+        return handle_deserialized_char(c)
 
     def handle_deserialized_string(self, s):
-        nul = b'\x00'
-
-        if sys.hexversion >= 0x03000000:
-            try:
-                # s is a bytes object, try to decode it as ASCII. if it is
-                # not decodable keep it as a bytes object because there is no
-                # other option for this in Python 3
-                s = s.decode('ascii')
-                nul = '\x00'
-            except:
-                pass
-
-        i = s.find(nul)
-        if i >= 0:
-            s = s[:i]
-
-        return s
+        return handle_deserialized_string(s)
 
     def send(self, packet):
         with self.socket_lock:
@@ -905,44 +1210,18 @@ class IPConnection:
 
             self.disconnect_probe_flag = False
 
+    def serialize_data(self, data, form):
+        return get_codec(form).pack(data)
+
     def send_request(self, device, function_id, data, form, form_ret):
-        length = 8 + struct.calcsize('<' + form)
+        if self.pipelining:
+            return self.send_request_pipelined(device, function_id, data, form, form_ret).get()
+
+        length = 8 + get_codec(form).size
         request, response_expected, sequence_number = \
             self.create_packet_header(device, length, function_id)
 
-        def pack_string(f, d):
-            if sys.hexversion < 0x03000000:
-                if isinstance(d, unicode):
-                    f = f.replace('s', 'B').replace('c', 'B')
-                    l = map(ord, d)
-                    p = f.replace('B', '')
-                    if len(p) == 0:
-                        p = '1'
-                    l += [0] * (int(p) - len(l))
-                    return struct.pack('<' + f, *l)
-                else:
-                    return struct.pack('<' + f, d)
-            else:
-                if isinstance(d, str):
-                    return struct.pack('<' + f, bytes(map(ord, d)))
-                else:
-                    return struct.pack('<' + f, d)
-
-        for f, d in zip(form.split(' '), data):
-            if len(f) > 1 and not 's' in f and not 'c' in f:
-                request += struct.pack('<' + f, *d)
-            elif 's' in f:
-                request += pack_string(f, d)
-            elif 'c' in f:
-                if len(f) > 1:
-                    if int(f.replace('c', '')) != len(d):
-                        raise ValueError('Incorrect char list length')
-                    for k in d:
-                        request += pack_string('c', k)
-                else:
-                    request += pack_string(f, d)
-            else:
-                request += struct.pack('<' + f, d)
+        request += self.serialize_data(data, form)
 
         if response_expected:
             with device.request_lock:
@@ -967,25 +1246,91 @@ class IPConnection:
                     device.expected_response_function_id = None
                     device.expected_response_sequence_number = None
 
-            error_code = get_error_code_from_data(response)
+            return self.handle_request_response(response, function_id, form_ret)
+        else:
+            self.send(request)
 
-            if error_code == 0:
-                # no error
-                pass
-            elif error_code == 1:
-                msg = 'Got invalid parameter for function {0}'.format(function_id)
-                raise Error(Error.INVALID_PARAMETER, msg)
-            elif error_code == 2:
-                msg = 'Function {0} is not supported'.format(function_id)
-                raise Error(Error.NOT_SUPPORTED, msg)
-            else:
-                msg = 'Function {0} returned an unknown error'.format(function_id)
-                raise Error(Error.UNKNOWN_ERROR_CODE, msg)
+    def send_request_pipelined(self, device, function_id, data, form, form_ret):
+        """
+        Sends a request without waiting for its response. Returns a
+        PendingResponse object, its get function blocks until the response
+        arrived and returns the same value send_request would have returned.
+
+        A single thread can send several requests this way before it waits
+        for the first response. This works independently of set_pipelining,
+        which only changes how send_request waits for its response.
+        """
+
+        length = 8 + get_codec(form).size
+        payload = self.serialize_data(data, form)
+
+        if not device.get_response_expected(function_id):
+            request, _, _ = self.create_packet_header(device, length, function_id)
+
+            self.send(request + payload)
+
+            return IPConnection.PendingResponse(self, None, function_id, 0, form_ret, 0)
+
+        condition = device.pending_responses_condition
+
+        with condition:
+            # wait for a free slot, the 4 bit sequence number limits the
+            # number of requests that can be told apart
+            while len(device.pending_responses) >= IPConnection.PIPELINE_MAX_IN_FLIGHT:
+                now = time.time()
+
+                for key, pending in list(device.pending_responses.items()):
+                    if pending.deadline <= now:
+                        del device.pending_responses[key]
 
-            if len(form_ret) > 0:
-                return self.deserialize_data(response[8:], form_ret)
+                if len(device.pending_responses) < IPConnection.PIPELINE_MAX_IN_FLIGHT:
+                    break
+
+                deadline = min([pending.deadline for pending in device.pending_responses.values()])
+                condition.wait(max(deadline - now, 0.001))
+
+            # the sequence number is shared by all devices, skip the ones that
+            # are still in use for this function of this device
+            while True:
+                request, _, sequence_number = self.create_packet_header(device, length, function_id)
+
+                if (function_id, sequence_number) not in device.pending_responses:
+                    break
+
+            pending = IPConnection.PendingResponse(self, device, function_id, sequence_number,
+                                                   form_ret, time.time() + self.timeout)
+            device.pending_responses[(function_id, sequence_number)] = pending
+
+        try:
+            self.send(request + payload)
+        except:
+            with condition:
+                if device.pending_responses.get((function_id, sequence_number)) is pending:
+                    del device.pending_responses[(function_id, sequence_number)]
+                    condition.notify()
+
+            raise
+
+        return pending
+
+    def handle_request_response(self, response, function_id, form_ret):
+        error_code = get_error_code_from_data(response)
+
+        if error_code == 0:
+            # no error
+            pass
+        elif error_code == 1:
+            msg = 'Got invalid parameter for function {0}'.format(function_id)
+            raise Error(Error.INVALID_PARAMETER, msg)
+        elif error_code == 2:
+            msg = 'Function {0} is not supported'.format(function_id)
+            raise Error(Error.NOT_SUPPORTED, msg)
         else:
-            self.send(request)
+            msg = 'Function {0} returned an unknown error'.format(function_id)
+            raise Error(Error.UNKNOWN_ERROR_CODE, msg)
+
+        if len(form_ret) > 0:
+            return self.deserialize_data(response[8:], form_ret)
 
     def get_next_sequence_number(self):
         with self.sequence_number_lock:
@@ -993,19 +1338,17 @@ class IPConnection:
             self.next_sequence_number = sequence_number % 15
             return sequence_number
 
-    def handle_response(self, packet):
+    def handle_response(self, header, packet):
         self.disconnect_probe_flag = False
 
-        function_id = get_function_id_from_data(packet)
-        sequence_number = get_sequence_number_from_data(packet)
+        uid, _, function_id, sequence_number_and_options, _ = header
+        sequence_number = (sequence_number_and_options >> 4) & 0x0F
 
         if sequence_number == 0 and function_id == IPConnection.CALLBACK_ENUMERATE:
             if IPConnection.CALLBACK_ENUMERATE in self.registered_callbacks:
                 self.callback.queue.put((IPConnection.QUEUE_PACKET, packet))
             return
 
-        uid = get_uid_from_data(packet)
-
         if not uid in self.devices:
             # Response from an unknown device, ignoring it
             return
@@ -1013,7 +1356,8 @@ class IPConnection:
         device = self.devices[uid]
 
         if sequence_number == 0:
-            if function_id in device.registered_callbacks:
+            if function_id in device.registered_callbacks or \
+               function_id in device.registered_batch_callbacks:
                 self.callback.queue.put((IPConnection.QUEUE_PACKET, packet))
             return
 
@@ -1022,6 +1366,19 @@ class IPConnection:
             device.response_queue.put(packet)
             return
 
+        if len(device.pending_responses) > 0:
+            condition = device.pending_responses_condition
+
+            with condition:
+                pending = device.pending_responses.pop((function_id, sequence_number), None)
+
+                if pending is not None:
+                    condition.notify()
+
+            if pending is not None:
+                pending.queue.put(packet)
+                return
+
         # Response seems to be OK, but can't be handled
 
     def handle_disconnect_by_peer(self, disconnect_reason, socket_id, disconnect_immediately):
@@ -1049,8 +1406,8 @@ class IPConnection:
 
         sequence_number_and_options = (sequence_number << 4) | (r_bit << 3)
 
-        return (struct.pack('<IBBBB', uid, length, function_id,
-                            sequence_number_and_options, 0),
+        return (header_struct.pack(uid, length, function_id,
+                                   sequence_number_and_options, 0),
                 bool(r_bit),
                 sequence_number)
 
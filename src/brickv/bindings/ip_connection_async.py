@@ -0,0 +1,598 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 agent <agent@local>
+#
+# Redistribution and use in source and binary forms of this file,
+# with or without modification, are permitted. See the Creative
+# Commons Zero (CC0 1.0) License for more details.
+
+# asyncio based alternative to the thread based IPConnection. This module
+# requires Python 3.7 or newer.
+#
+# The generated Device subclasses are used unchanged. Their functions are
+# made awaitable by AsyncIPConnection.call or by wrapping the device in an
+# AsyncDevice. The function ID, the formats and the result type of a request
+# are looked up in the table of ip_connection_async_functions.py, which is
+# generated from the bindings by build_async_function_table.py. The function
+# itself is never run:
+#
+#     ipcon = AsyncIPConnection()
+#     temperature = AsyncDevice(BrickletTemperature('XYZ', ipcon))
+#
+#     await ipcon.connect('localhost', 4223)
+#     print(await temperature.get_temperature())
+#
+#     await temperature.set_temperature_callback_period(1000)
+#
+#     async for value in ipcon.callbacks(temperature, BrickletTemperature.CALLBACK_TEMPERATURE):
+#         print(value)
+
+import asyncio
+import collections
+import hashlib
+import hmac
+import inspect
+import math
+import os
+import socket
+import struct
+import sys
+import time
+
+try:
+    from .ip_connection import IPConnection, BrickDaemon, Error, ReceiveBuffer, get_codec
+    from .ip_connection_async_functions import functions
+except ImportError:
+    from ip_connection import IPConnection, BrickDaemon, Error, ReceiveBuffer, get_codec
+    from ip_connection_async_functions import functions
+
+# request metadata of a generated device function:
+# function_id -- function ID of the request
+# signature   -- signature of the function, used to bind the call arguments
+# data_names  -- names of the parameters that form the request data, in order
+# form        -- format of the request data
+# form_ret    -- format of the response data
+# result_type -- name of the namedtuple the response is wrapped in or None
+FunctionSpec = collections.namedtuple('FunctionSpec',
+                                      'function_id signature data_names form form_ret result_type')
+
+function_specs = {} # (device class, function name) -> FunctionSpec or None
+
+def get_function_spec(device_class, name):
+    """
+    Returns the FunctionSpec of the function *name* of *device_class* or None
+    if the function is not a request function of the generated bindings.
+    Subclasses of generated device classes are supported.
+    """
+
+    key = (device_class, name)
+
+    try:
+        return function_specs[key]
+    except KeyError:
+        pass
+
+    spec = None
+    function = getattr(device_class, name, None)
+
+    if callable(function):
+        for cls in device_class.__mro__:
+            if name in vars(cls):
+                entry = functions.get(cls.__name__, {}).get(name)
+
+                if entry is not None:
+                    function_id, data_names, form, form_ret, result_type = entry
+                    spec = FunctionSpec(function_id, inspect.signature(function), data_names,
+                                        form, form_ret, result_type)
+
+                break
+
+    function_specs[key] = spec
+
+    return spec
+
+class IPConnectionProtocol(asyncio.Protocol):
+    def __init__(self, ipcon):
+        self.ipcon = ipcon
+        self.transport = None
+        self.receive_buffer = ReceiveBuffer()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self.receive_buffer.feed(data)
+
+        for header, packet in self.receive_buffer.packets():
+            self.ipcon.handle_response(header, packet)
+
+    def eof_received(self):
+        self.ipcon.handle_disconnect_by_peer(self, IPConnection.DISCONNECT_REASON_SHUTDOWN)
+
+        return False
+
+    def connection_lost(self, exc):
+        self.ipcon.handle_disconnect_by_peer(self, IPConnection.DISCONNECT_REASON_ERROR)
+
+class CallbackIterator:
+    def __init__(self, ipcon, key, maxsize):
+        self.ipcon = ipcon
+        self.key = key
+        self.queue = asyncio.Queue(maxsize)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.queue.get()
+
+    def put(self, value):
+        if self.queue.full():
+            # drop the oldest value, a slow consumer should see recent data
+            self.queue.get_nowait()
+
+        self.queue.put_nowait(value)
+
+    def close(self):
+        """
+        Stops delivering callbacks to this iterator.
+        """
+
+        iterators = self.ipcon.callback_iterators.get(self.key, [])
+
+        if self in iterators:
+            iterators.remove(self)
+
+class AsyncDevice:
+    """
+    Wraps a generated Device object created with an AsyncIPConnection. All
+    functions of the device become awaitable, all other attributes are
+    passed through unchanged.
+    """
+
+    def __init__(self, device):
+        self.device = device
+
+    def __getattr__(self, name):
+        attr = getattr(self.device, name)
+
+        if not callable(attr) or get_function_spec(type(self.device), name) is None:
+            return attr
+
+        def call(*args, **kwargs):
+            return self.device.ipcon.call(attr, *args, **kwargs)
+
+        return call
+
+class AsyncIPConnection:
+    def __init__(self):
+        """
+        Creates an asyncio based IP Connection object. It is used in the same
+        way as the IPConnection, but connect, disconnect and authenticate are
+        coroutines and device functions are called through call or an
+        AsyncDevice wrapper. No threads are created.
+        """
+
+        self.host = None
+        self.port = None
+        self.timeout = 2.5
+        self.auto_reconnect = True
+        self.auto_reconnect_allowed = False
+        self.auto_reconnect_task = None
+        self.next_sequence_number = 0
+        self.next_authentication_nonce = 0
+        self.devices = {}
+        self.registered_callbacks = {}
+        self.callback_iterators = {} # (uid, function_id) -> [CallbackIterator]
+        self.pending_responses = {} # (uid, function_id, sequence_number) -> Future
+        self.request_slots = {} # uid -> Semaphore
+        self.protocol = None
+        self.disconnect_probe_flag = False
+        self.disconnect_probe_task = None
+        self.brickd = BrickDaemon("2", self)
+
+    async def connect(self, host, port):
+        """
+        Creates a TCP/IP connection to the given *host* and *port*. The host
+        and port can point to a Brick Daemon or to a WIFI/Ethernet Extension.
+        """
+
+        if self.protocol is not None:
+            raise Error(Error.ALREADY_CONNECTED,
+                        'Already connected to {0}:{1}'.format(self.host, self.port))
+
+        self.host = host
+        self.port = port
+
+        await self.connect_unlocked(False)
+
+    async def disconnect(self):
+        """
+        Disconnects the TCP/IP connection from the Brick Daemon or the
+        WIFI/Ethernet Extension.
+        """
+
+        self.auto_reconnect_allowed = False
+
+        if self.auto_reconnect_task is not None:
+            # abort potentially pending auto reconnect
+            self.auto_reconnect_task.cancel()
+            self.auto_reconnect_task = None
+        else:
+            if self.protocol is None:
+                raise Error(Error.NOT_CONNECTED, 'Not connected')
+
+            self.disconnect_unlocked()
+
+        self.dispatch_meta(IPConnection.CALLBACK_DISCONNECTED, IPConnection.DISCONNECT_REASON_REQUEST)
+
+    async def authenticate(self, secret):
+        """
+        Performs an authentication handshake with the connected Brick Daemon or
+        WIFI/Ethernet Extension, see IPConnection.authenticate.
+        """
+
+        secret_bytes = secret.encode('ascii')
+
+        if self.next_authentication_nonce == 0:
+            try:
+                self.next_authentication_nonce = struct.unpack('<I', os.urandom(4))[0]
+            except NotImplementedError:
+                subseconds, seconds = math.modf(time.time())
+                seconds = int(seconds)
+                subseconds = int(subseconds * 1000000)
+                self.next_authentication_nonce = ((seconds << 26 | seconds >> 6) & 0xFFFFFFFF) + subseconds + os.getpid()
+
+        client_nonce = struct.unpack('<4B', struct.pack('<I', self.next_authentication_nonce))
+        self.next_authentication_nonce = (self.next_authentication_nonce + 1) % (1 << 32)
+
+        server_nonce = await self.call(self.brickd.get_authentication_nonce)
+
+        h = hmac.new(secret_bytes, digestmod=hashlib.sha1)
+
+        h.update(struct.pack('<4B', *server_nonce))
+        h.update(struct.pack('<4B', *client_nonce))
+
+        digest = struct.unpack('<20B', h.digest())
+        h = None
+
+        await self.call(self.brickd.authenticate, client_nonce, digest)
+
+    def get_connection_state(self):
+        """
+        Returns CONNECTION_STATE_DISCONNECTED, CONNECTION_STATE_CONNECTED or
+        CONNECTION_STATE_PENDING, see IPConnection.get_connection_state.
+        """
+
+        if self.protocol is not None:
+            return IPConnection.CONNECTION_STATE_CONNECTED
+        elif self.auto_reconnect_task is not None:
+            return IPConnection.CONNECTION_STATE_PENDING
+        else:
+            return IPConnection.CONNECTION_STATE_DISCONNECTED
+
+    def set_auto_reconnect(self, auto_reconnect):
+        """
+        Enables or disables auto-reconnect.
+
+        Default value is *True*.
+        """
+
+        self.auto_reconnect = bool(auto_reconnect)
+
+        if not self.auto_reconnect:
+            # abort potentially pending auto reconnect
+            self.auto_reconnect_allowed = False
+
+            if self.auto_reconnect_task is not None:
+                self.auto_reconnect_task.cancel()
+                self.auto_reconnect_task = None
+
+    def get_auto_reconnect(self):
+        """
+        Returns *true* if auto-reconnect is enabled, *false* otherwise.
+        """
+
+        return self.auto_reconnect
+
+    def set_timeout(self, timeout):
+        """
+        Sets the timeout in seconds for getters and for setters for which the
+        response expected flag is activated.
+
+        Default timeout is 2.5.
+        """
+
+        timeout = float(timeout)
+
+        if timeout < 0:
+            raise ValueError('Timeout cannot be negative')
+
+        self.timeout = timeout
+
+    def get_timeout(self):
+        """
+        Returns the timeout as set by set_timeout.
+        """
+
+        return self.timeout
+
+    def enumerate(self):
+        """
+        Broadcasts an enumerate request. All devices will respond with an
+        enumerate callback.
+        """
+
+        request, _, _ = self.create_packet_header(None, 8, IPConnection.FUNCTION_ENUMERATE)
+
+        self.send(request)
+
+    def register_callback(self, id, callback):
+        """
+        Registers a callback with ID *id* to the function *callback*. The
+        function can also be a coroutine function.
+        """
+
+        self.registered_callbacks[id] = callback
+
+    def callbacks(self, device, id, maxsize=0):
+        """
+        Returns an asynchronous iterator over the values of the callback with
+        ID *id* of *device*. Each value is the single argument or the tuple
+        of arguments a registered callback function would have been called
+        with. If *maxsize* is greater than 0 then at most *maxsize* values
+        are buffered and the oldest values are dropped.
+        """
+
+        if isinstance(device, AsyncDevice):
+            device = device.device
+
+        key = (device.uid, id)
+        iterator = CallbackIterator(self, key, maxsize)
+
+        self.callback_iterators.setdefault(key, []).append(iterator)
+
+        return iterator
+
+    async def call(self, function, *args, **kwargs):
+        """
+        Sends the request of the bound *function* of a device created with
+        this IP Connection and returns the same result the function would
+        have returned once the response arrived.
+        """
+
+        device = getattr(function, '__self__', None)
+        spec = None
+
+        if device is not None:
+            spec = get_function_spec(type(device), function.__name__)
+
+        if spec is None:
+            raise Error(Error.NOT_SUPPORTED,
+                        '{0} is not a request function of a device'.format(getattr(function, '__name__', function)))
+
+        arguments = spec.signature.bind(device, *args, **kwargs).arguments
+        data = tuple(arguments[name] for name in spec.data_names)
+        result = await self.send_request_async(device, spec.function_id, data, spec.form, spec.form_ret)
+
+        if spec.result_type is not None:
+            result_type = getattr(sys.modules[type(device).__module__], spec.result_type)
+
+            return result_type(*result)
+
+        return result
+
+    def send_request(self, device, function_id, data, form, form_ret):
+        raise Error(Error.NOT_SUPPORTED,
+                    'Device functions have to be called through AsyncIPConnection.call')
+
+    async def send_request_async(self, device, function_id, data, form, form_ret):
+        codec = get_codec(form)
+        payload = codec.pack(data)
+        length = 8 + codec.size
+
+        if not device.get_response_expected(function_id):
+            request, _, _ = self.create_packet_header(device, length, function_id)
+
+            self.send(request + payload)
+
+            return None
+
+        slots = self.request_slots.get(device.uid)
+
+        if slots is None:
+            slots = asyncio.Semaphore(IPConnection.PIPELINE_MAX_IN_FLIGHT)
+            self.request_slots[device.uid] = slots
+
+        async with slots:
+            # the sequence number is shared by all devices, skip the ones that
+            # are still in use for this function of this device
+            while True:
+                request, _, sequence_number = self.create_packet_header(device, length, function_id)
+                key = (device.uid, function_id, sequence_number)
+
+                if key not in self.pending_responses:
+                    break
+
+            future = asyncio.get_running_loop().create_future()
+            self.pending_responses[key] = future
+
+            try:
+                self.send(request + payload)
+
+                response = await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                msg = 'Did not receive response for function {0} in time'.format(function_id)
+                raise Error(Error.TIMEOUT, msg)
+            finally:
+                if self.pending_responses.get(key) is future:
+                    del self.pending_responses[key]
+
+        return IPConnection.handle_request_response(self, response, function_id, form_ret)
+
+    def deserialize_data(self, data, form):
+        return get_codec(form).unpack(data)
+
+    async def connect_unlocked(self, is_auto_reconnect):
+        loop = asyncio.get_running_loop()
+
+        _, protocol = await asyncio.wait_for(loop.create_connection(lambda: IPConnectionProtocol(self),
+                                                                   self.host, self.port), 5)
+
+        sock = protocol.transport.get_extra_info('socket')
+
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self.protocol = protocol
+        self.disconnect_probe_flag = True
+        self.disconnect_probe_task = loop.create_task(self.disconnect_probe_loop(protocol))
+        self.auto_reconnect_allowed = False
+
+        if is_auto_reconnect:
+            connect_reason = IPConnection.CONNECT_REASON_AUTO_RECONNECT
+        else:
+            connect_reason = IPConnection.CONNECT_REASON_REQUEST
+
+        self.dispatch_meta(IPConnection.CALLBACK_CONNECTED, connect_reason)
+
+    def disconnect_unlocked(self):
+        protocol = self.protocol
+        self.protocol = None
+
+        if self.disconnect_probe_task is not None:
+            self.disconnect_probe_task.cancel()
+            self.disconnect_probe_task = None
+
+        # the responses for pending requests cannot arrive anymore
+        pending_responses = self.pending_responses
+        self.pending_responses = {}
+
+        for future in pending_responses.values():
+            if not future.done():
+                future.set_exception(Error(Error.NOT_CONNECTED, 'Connection was closed'))
+
+        if protocol is not None and protocol.transport is not None:
+            protocol.transport.close()
+
+    async def auto_reconnect_loop(self):
+        # retry until connected, there is no callback to deliver when there
+        # is no connection
+        try:
+            while self.auto_reconnect_allowed and self.protocol is None:
+                try:
+                    await self.connect_unlocked(True)
+                except (OSError, asyncio.TimeoutError):
+                    await asyncio.sleep(0.1)
+        finally:
+            self.auto_reconnect_task = None
+
+    async def disconnect_probe_loop(self, protocol):
+        request, _, _ = self.create_packet_header(None, 8, IPConnection.FUNCTION_DISCONNECT_PROBE)
+
+        while self.protocol is protocol:
+            await asyncio.sleep(IPConnection.DISCONNECT_PROBE_INTERVAL)
+
+            if self.disconnect_probe_flag:
+                protocol.transport.write(request)
+            else:
+                self.disconnect_probe_flag = True
+
+    def handle_disconnect_by_peer(self, protocol, disconnect_reason):
+        if self.protocol is not protocol:
+            # already disconnected or reconnected in the meantime
+            return
+
+        self.auto_reconnect_allowed = True
+        self.disconnect_unlocked()
+        self.dispatch_meta(IPConnection.CALLBACK_DISCONNECTED, disconnect_reason)
+
+        if self.auto_reconnect and self.auto_reconnect_allowed and self.auto_reconnect_task is None:
+            # wait a moment before reconnecting, see IPConnection.dispatch_meta
+            async def reconnect():
+                await asyncio.sleep(0.1)
+                await self.auto_reconnect_loop()
+
+            self.auto_reconnect_task = asyncio.get_running_loop().create_task(reconnect())
+
+    def send(self, packet):
+        if self.protocol is None:
+            raise Error(Error.NOT_CONNECTED, 'Not connected')
+
+        self.protocol.transport.write(packet)
+        self.disconnect_probe_flag = False
+
+    def get_next_sequence_number(self):
+        sequence_number = self.next_sequence_number + 1
+        self.next_sequence_number = sequence_number % 15
+        return sequence_number
+
+    # the header layout is the same, the unlocked get_next_sequence_number
+    # above is used for the sequence number
+    create_packet_header = IPConnection.create_packet_header
+
+    def call_callback(self, callback, *args):
+        result = callback(*args)
+
+        if asyncio.iscoroutine(result):
+            asyncio.get_running_loop().create_task(result)
+
+    def dispatch_meta(self, function_id, parameter):
+        callback = self.registered_callbacks.get(function_id)
+
+        if callback is not None:
+            self.call_callback(callback, parameter)
+
+    def handle_response(self, header, packet):
+        self.disconnect_probe_flag = False
+
+        uid, _, function_id, sequence_number_and_options, _ = header
+        sequence_number = (sequence_number_and_options >> 4) & 0x0F
+
+        if sequence_number != 0:
+            future = self.pending_responses.pop((uid, function_id, sequence_number), None)
+
+            if future is not None and not future.done():
+                future.set_result(packet)
+
+            return
+
+        if function_id == IPConnection.CALLBACK_ENUMERATE:
+            callback = self.registered_callbacks.get(IPConnection.CALLBACK_ENUMERATE)
+
+            if callback is not None:
+                self.call_callback(callback, *get_codec('8s 8s c 3B 3B H B').unpack(packet, 8))
+
+            return
+
+        device = self.devices.get(uid)
+
+        if device is None:
+            # callback from an unknown device, ignoring it
+            return
+
+        callback = device.registered_callbacks.get(function_id)
+        iterators = self.callback_iterators.get((uid, function_id))
+
+        if callback is None and not iterators:
+            return
+
+        form = device.callback_formats[function_id]
+
+        if len(form) == 0:
+            args = ()
+            value = None
+        else:
+            value = get_codec(form).unpack(packet, 8)
+
+            if len(form) == 1:
+                args = (value,)
+            else:
+                args = tuple(value)
+                value = args
+
+        if callback is not None:
+            self.call_callback(callback, *args)
+
+        if iterators:
+            for iterator in list(iterators):
+                iterator.put(value)
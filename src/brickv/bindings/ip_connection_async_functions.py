@@ -0,0 +1,1318 @@
+# -*- coding: utf-8 -*-
+# This file was generated by build_async_function_table.py, don't edit it.
+#
+# device class name -> function name -> (function ID, names of the request
+# parameters, request format, response format, result namedtuple or None)
+
+functions = {
+    'BrickDC': {
+        'set_velocity': (1, ('velocity',), 'h', '', None),
+        'get_velocity': (2, (), '', 'h', None),
+        'get_current_velocity': (3, (), '', 'h', None),
+        'set_acceleration': (4, ('acceleration',), 'H', '', None),
+        'get_acceleration': (5, (), '', 'H', None),
+        'set_pwm_frequency': (6, ('frequency',), 'H', '', None),
+        'get_pwm_frequency': (7, (), '', 'H', None),
+        'full_brake': (8, (), '', '', None),
+        'get_stack_input_voltage': (9, (), '', 'H', None),
+        'get_external_input_voltage': (10, (), '', 'H', None),
+        'get_current_consumption': (11, (), '', 'H', None),
+        'enable': (12, (), '', '', None),
+        'disable': (13, (), '', '', None),
+        'is_enabled': (14, (), '', '?', None),
+        'set_minimum_voltage': (15, ('voltage',), 'H', '', None),
+        'get_minimum_voltage': (16, (), '', 'H', None),
+        'set_drive_mode': (17, ('mode',), 'B', '', None),
+        'get_drive_mode': (18, (), '', 'B', None),
+        'set_current_velocity_period': (19, ('period',), 'H', '', None),
+        'get_current_velocity_period': (20, (), '', 'H', None),
+        'enable_status_led': (238, (), '', '', None),
+        'disable_status_led': (239, (), '', '', None),
+        'is_status_led_enabled': (240, (), '', '?', None),
+        'get_protocol1_bricklet_name': (241, ('port',), 'c', 'B 3B 40s', 'GetProtocol1BrickletName'),
+        'get_chip_temperature': (242, (), '', 'h', None),
+        'reset': (243, (), '', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickIMU': {
+        'get_acceleration': (1, (), '', 'h h h', 'GetAcceleration'),
+        'get_magnetic_field': (2, (), '', 'h h h', 'GetMagneticField'),
+        'get_angular_velocity': (3, (), '', 'h h h', 'GetAngularVelocity'),
+        'get_all_data': (4, (), '', 'h h h h h h h h h h', 'GetAllData'),
+        'get_orientation': (5, (), '', 'h h h', 'GetOrientation'),
+        'get_quaternion': (6, (), '', 'f f f f', 'GetQuaternion'),
+        'get_imu_temperature': (7, (), '', 'h', None),
+        'leds_on': (8, (), '', '', None),
+        'leds_off': (9, (), '', '', None),
+        'are_leds_on': (10, (), '', '?', None),
+        'set_acceleration_range': (11, ('range',), 'B', '', None),
+        'get_acceleration_range': (12, (), '', 'B', None),
+        'set_magnetometer_range': (13, ('range',), 'B', '', None),
+        'get_magnetometer_range': (14, (), '', 'B', None),
+        'set_convergence_speed': (15, ('speed',), 'H', '', None),
+        'get_convergence_speed': (16, (), '', 'H', None),
+        'set_calibration': (17, ('typ', 'data'), 'B 10h', '', None),
+        'get_calibration': (18, ('typ',), 'B', '10h', None),
+        'set_acceleration_period': (19, ('period',), 'I', '', None),
+        'get_acceleration_period': (20, (), '', 'I', None),
+        'set_magnetic_field_period': (21, ('period',), 'I', '', None),
+        'get_magnetic_field_period': (22, (), '', 'I', None),
+        'set_angular_velocity_period': (23, ('period',), 'I', '', None),
+        'get_angular_velocity_period': (24, (), '', 'I', None),
+        'set_all_data_period': (25, ('period',), 'I', '', None),
+        'get_all_data_period': (26, (), '', 'I', None),
+        'set_orientation_period': (27, ('period',), 'I', '', None),
+        'get_orientation_period': (28, (), '', 'I', None),
+        'set_quaternion_period': (29, ('period',), 'I', '', None),
+        'get_quaternion_period': (30, (), '', 'I', None),
+        'orientation_calculation_on': (37, (), '', '', None),
+        'orientation_calculation_off': (38, (), '', '', None),
+        'is_orientation_calculation_on': (39, (), '', '?', None),
+        'enable_status_led': (238, (), '', '', None),
+        'disable_status_led': (239, (), '', '', None),
+        'is_status_led_enabled': (240, (), '', '?', None),
+        'get_protocol1_bricklet_name': (241, ('port',), 'c', 'B 3B 40s', 'GetProtocol1BrickletName'),
+        'get_chip_temperature': (242, (), '', 'h', None),
+        'reset': (243, (), '', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickIMUV2': {
+        'get_acceleration': (1, (), '', 'h h h', 'GetAcceleration'),
+        'get_magnetic_field': (2, (), '', 'h h h', 'GetMagneticField'),
+        'get_angular_velocity': (3, (), '', 'h h h', 'GetAngularVelocity'),
+        'get_temperature': (4, (), '', 'b', None),
+        'get_orientation': (5, (), '', 'h h h', 'GetOrientation'),
+        'get_linear_acceleration': (6, (), '', 'h h h', 'GetLinearAcceleration'),
+        'get_gravity_vector': (7, (), '', 'h h h', 'GetGravityVector'),
+        'get_quaternion': (8, (), '', 'h h h h', 'GetQuaternion'),
+        'get_all_data': (9, (), '', '3h 3h 3h 3h 4h 3h 3h b B', 'GetAllData'),
+        'leds_on': (10, (), '', '', None),
+        'leds_off': (11, (), '', '', None),
+        'are_leds_on': (12, (), '', '?', None),
+        'save_calibration': (13, (), '', '?', None),
+        'set_acceleration_period': (14, ('period',), 'I', '', None),
+        'get_acceleration_period': (15, (), '', 'I', None),
+        'set_magnetic_field_period': (16, ('period',), 'I', '', None),
+        'get_magnetic_field_period': (17, (), '', 'I', None),
+        'set_angular_velocity_period': (18, ('period',), 'I', '', None),
+        'get_angular_velocity_period': (19, (), '', 'I', None),
+        'set_temperature_period': (20, ('period',), 'I', '', None),
+        'get_temperature_period': (21, (), '', 'I', None),
+        'set_orientation_period': (22, ('period',), 'I', '', None),
+        'get_orientation_period': (23, (), '', 'I', None),
+        'set_linear_acceleration_period': (24, ('period',), 'I', '', None),
+        'get_linear_acceleration_period': (25, (), '', 'I', None),
+        'set_gravity_vector_period': (26, ('period',), 'I', '', None),
+        'get_gravity_vector_period': (27, (), '', 'I', None),
+        'set_quaternion_period': (28, ('period',), 'I', '', None),
+        'get_quaternion_period': (29, (), '', 'I', None),
+        'set_all_data_period': (30, ('period',), 'I', '', None),
+        'get_all_data_period': (31, (), '', 'I', None),
+        'enable_status_led': (238, (), '', '', None),
+        'disable_status_led': (239, (), '', '', None),
+        'is_status_led_enabled': (240, (), '', '?', None),
+        'get_protocol1_bricklet_name': (241, ('port',), 'c', 'B 3B 40s', 'GetProtocol1BrickletName'),
+        'get_chip_temperature': (242, (), '', 'h', None),
+        'reset': (243, (), '', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickMaster': {
+        'get_stack_voltage': (1, (), '', 'H', None),
+        'get_stack_current': (2, (), '', 'H', None),
+        'set_extension_type': (3, ('extension', 'exttype'), 'B I', '', None),
+        'get_extension_type': (4, ('extension',), 'B', 'I', None),
+        'is_chibi_present': (5, (), '', '?', None),
+        'set_chibi_address': (6, ('address',), 'B', '', None),
+        'get_chibi_address': (7, (), '', 'B', None),
+        'set_chibi_master_address': (8, ('address',), 'B', '', None),
+        'get_chibi_master_address': (9, (), '', 'B', None),
+        'set_chibi_slave_address': (10, ('num', 'address'), 'B B', '', None),
+        'get_chibi_slave_address': (11, ('num',), 'B', 'B', None),
+        'get_chibi_signal_strength': (12, (), '', 'B', None),
+        'get_chibi_error_log': (13, (), '', 'H H H H', 'GetChibiErrorLog'),
+        'set_chibi_frequency': (14, ('frequency',), 'B', '', None),
+        'get_chibi_frequency': (15, (), '', 'B', None),
+        'set_chibi_channel': (16, ('channel',), 'B', '', None),
+        'get_chibi_channel': (17, (), '', 'B', None),
+        'is_rs485_present': (18, (), '', '?', None),
+        'set_rs485_address': (19, ('address',), 'B', '', None),
+        'get_rs485_address': (20, (), '', 'B', None),
+        'set_rs485_slave_address': (21, ('num', 'address'), 'B B', '', None),
+        'get_rs485_slave_address': (22, ('num',), 'B', 'B', None),
+        'get_rs485_error_log': (23, (), '', 'H', None),
+        'set_rs485_configuration': (24, ('speed', 'parity', 'stopbits'), 'I c B', '', None),
+        'get_rs485_configuration': (25, (), '', 'I c B', 'GetRS485Configuration'),
+        'is_wifi_present': (26, (), '', '?', None),
+        'set_wifi_configuration': (27, ('ssid', 'connection', 'ip', 'subnet_mask', 'gateway', 'port'), '32s B 4B 4B 4B H', '', None),
+        'get_wifi_configuration': (28, (), '', '32s B 4B 4B 4B H', 'GetWifiConfiguration'),
+        'set_wifi_encryption': (29, ('encryption', 'key', 'key_index', 'eap_options', 'ca_certificate_length', 'client_certificate_length', 'private_key_length'), 'B 50s B B H H H', '', None),
+        'get_wifi_encryption': (30, (), '', 'B 50s B B H H H', 'GetWifiEncryption'),
+        'get_wifi_status': (31, (), '', '6B 6B B h 4B 4B 4B I I B', 'GetWifiStatus'),
+        'refresh_wifi_status': (32, (), '', '', None),
+        'set_wifi_certificate': (33, ('index', 'data', 'data_length'), 'H 32B B', '', None),
+        'get_wifi_certificate': (34, ('index',), 'H', '32B B', 'GetWifiCertificate'),
+        'set_wifi_power_mode': (35, ('mode',), 'B', '', None),
+        'get_wifi_power_mode': (36, (), '', 'B', None),
+        'get_wifi_buffer_info': (37, (), '', 'I H H', 'GetWifiBufferInfo'),
+        'set_wifi_regulatory_domain': (38, ('domain',), 'B', '', None),
+        'get_wifi_regulatory_domain': (39, (), '', 'B', None),
+        'get_usb_voltage': (40, (), '', 'H', None),
+        'set_long_wifi_key': (41, ('key',), '64s', '', None),
+        'get_long_wifi_key': (42, (), '', '64s', None),
+        'set_wifi_hostname': (43, ('hostname',), '16s', '', None),
+        'get_wifi_hostname': (44, (), '', '16s', None),
+        'set_stack_current_callback_period': (45, ('period',), 'I', '', None),
+        'get_stack_current_callback_period': (46, (), '', 'I', None),
+        'set_stack_voltage_callback_period': (47, ('period',), 'I', '', None),
+        'get_stack_voltage_callback_period': (48, (), '', 'I', None),
+        'set_usb_voltage_callback_period': (49, ('period',), 'I', '', None),
+        'get_usb_voltage_callback_period': (50, (), '', 'I', None),
+        'set_stack_current_callback_threshold': (51, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_stack_current_callback_threshold': (52, (), '', 'c H H', 'GetStackCurrentCallbackThreshold'),
+        'set_stack_voltage_callback_threshold': (53, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_stack_voltage_callback_threshold': (54, (), '', 'c H H', 'GetStackVoltageCallbackThreshold'),
+        'set_usb_voltage_callback_threshold': (55, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_usb_voltage_callback_threshold': (56, (), '', 'c H H', 'GetUSBVoltageCallbackThreshold'),
+        'set_debounce_period': (57, ('debounce',), 'I', '', None),
+        'get_debounce_period': (58, (), '', 'I', None),
+        'is_ethernet_present': (65, (), '', '?', None),
+        'set_ethernet_configuration': (66, ('connection', 'ip', 'subnet_mask', 'gateway', 'port'), 'B 4B 4B 4B H', '', None),
+        'get_ethernet_configuration': (67, (), '', 'B 4B 4B 4B H', 'GetEthernetConfiguration'),
+        'get_ethernet_status': (68, (), '', '6B 4B 4B 4B I I 32s', 'GetEthernetStatus'),
+        'set_ethernet_hostname': (69, ('hostname',), '32s', '', None),
+        'set_ethernet_mac_address': (70, ('mac_address',), '6B', '', None),
+        'set_ethernet_websocket_configuration': (71, ('sockets', 'port'), 'B H', '', None),
+        'get_ethernet_websocket_configuration': (72, (), '', 'B H', 'GetEthernetWebsocketConfiguration'),
+        'set_ethernet_authentication_secret': (73, ('secret',), '64s', '', None),
+        'get_ethernet_authentication_secret': (74, (), '', '64s', None),
+        'set_wifi_authentication_secret': (75, ('secret',), '64s', '', None),
+        'get_wifi_authentication_secret': (76, (), '', '64s', None),
+        'get_connection_type': (77, (), '', 'B', None),
+        'is_wifi2_present': (78, (), '', '?', None),
+        'start_wifi2_bootloader': (79, (), '', 'b', None),
+        'write_wifi2_serial_port': (80, ('data', 'length'), '60B B', 'b', None),
+        'read_wifi2_serial_port': (81, ('length',), 'B', '60B B', 'ReadWifi2SerialPort'),
+        'set_wifi2_authentication_secret': (82, ('secret',), '64s', '', None),
+        'get_wifi2_authentication_secret': (83, (), '', '64s', None),
+        'set_wifi2_configuration': (84, ('port', 'websocket_port', 'website_port', 'phy_mode', 'sleep_mode', 'website'), 'H H H B B B', '', None),
+        'get_wifi2_configuration': (85, (), '', 'H H H B B B', 'GetWifi2Configuration'),
+        'get_wifi2_status': (86, (), '', '? B 4B 4B 4B 6B I I b ? 4B 4B 4B 6B I I B', 'GetWifi2Status'),
+        'set_wifi2_client_configuration': (87, ('enable', 'ssid', 'ip', 'subnet_mask', 'gateway', 'mac_address', 'bssid'), '? 32s 4B 4B 4B 6B 6B', '', None),
+        'get_wifi2_client_configuration': (88, (), '', '? 32s 4B 4B 4B 6B 6B', 'GetWifi2ClientConfiguration'),
+        'set_wifi2_client_hostname': (89, ('hostname',), '32s', '', None),
+        'get_wifi2_client_hostname': (90, (), '', '32s', None),
+        'set_wifi2_client_password': (91, ('password',), '64s', '', None),
+        'get_wifi2_client_password': (92, (), '', '64s', None),
+        'set_wifi2_ap_configuration': (93, ('enable', 'ssid', 'ip', 'subnet_mask', 'gateway', 'encryption', 'hidden', 'channel', 'mac_address'), '? 32s 4B 4B 4B B ? B 6B', '', None),
+        'get_wifi2_ap_configuration': (94, (), '', '? 32s 4B 4B 4B B ? B 6B', 'GetWifi2APConfiguration'),
+        'set_wifi2_ap_password': (95, ('password',), '64s', '', None),
+        'get_wifi2_ap_password': (96, (), '', '64s', None),
+        'save_wifi2_configuration': (97, (), '', 'B', None),
+        'get_wifi2_firmware_version': (98, (), '', '3B', None),
+        'enable_wifi2_status_led': (99, (), '', '', None),
+        'disable_wifi2_status_led': (100, (), '', '', None),
+        'is_wifi2_status_led_enabled': (101, (), '', '?', None),
+        'enable_status_led': (238, (), '', '', None),
+        'disable_status_led': (239, (), '', '', None),
+        'is_status_led_enabled': (240, (), '', '?', None),
+        'get_protocol1_bricklet_name': (241, ('port',), 'c', 'B 3B 40s', 'GetProtocol1BrickletName'),
+        'get_chip_temperature': (242, (), '', 'h', None),
+        'reset': (243, (), '', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickRED': {
+        'create_session': (1, ('lifetime',), 'I', 'B H', 'CreateSession'),
+        'expire_session': (2, ('session_id',), 'H', 'B', None),
+        'expire_session_unchecked': (3, ('session_id',), 'H', '', None),
+        'keep_session_alive': (4, ('session_id', 'lifetime'), 'H I', 'B', None),
+        'release_object': (5, ('object_id', 'session_id'), 'H H', 'B', None),
+        'release_object_unchecked': (6, ('object_id', 'session_id'), 'H H', '', None),
+        'allocate_string': (7, ('length_to_reserve', 'buffer', 'session_id'), 'I 58s H', 'B H', 'AllocateString'),
+        'truncate_string': (8, ('string_id', 'length'), 'H I', 'B', None),
+        'get_string_length': (9, ('string_id',), 'H', 'B I', 'GetStringLength'),
+        'set_string_chunk': (10, ('string_id', 'offset', 'buffer'), 'H I 58s', 'B', None),
+        'get_string_chunk': (11, ('string_id', 'offset'), 'H I', 'B 63s', 'GetStringChunk'),
+        'allocate_list': (12, ('length_to_reserve', 'session_id'), 'H H', 'B H', 'AllocateList'),
+        'get_list_length': (13, ('list_id',), 'H', 'B H', 'GetListLength'),
+        'get_list_item': (14, ('list_id', 'index', 'session_id'), 'H H H', 'B H B', 'GetListItem'),
+        'append_to_list': (15, ('list_id', 'item_object_id'), 'H H', 'B', None),
+        'remove_from_list': (16, ('list_id', 'index'), 'H H', 'B', None),
+        'open_file': (17, ('name_string_id', 'flags', 'permissions', 'uid', 'gid', 'session_id'), 'H I H I I H', 'B H', 'OpenFile'),
+        'create_pipe': (18, ('flags', 'length', 'session_id'), 'I Q H', 'B H', 'CreatePipe'),
+        'get_file_info': (19, ('file_id', 'session_id'), 'H H', 'B B H I H I I Q Q Q Q', 'GetFileInfo'),
+        'read_file': (20, ('file_id', 'length_to_read'), 'H B', 'B 62B B', 'ReadFile'),
+        'read_file_async': (21, ('file_id', 'length_to_read'), 'H Q', '', None),
+        'abort_async_file_read': (22, ('file_id',), 'H', 'B', None),
+        'write_file': (23, ('file_id', 'buffer', 'length_to_write'), 'H 61B B', 'B B', 'WriteFile'),
+        'write_file_unchecked': (24, ('file_id', 'buffer', 'length_to_write'), 'H 61B B', '', None),
+        'write_file_async': (25, ('file_id', 'buffer', 'length_to_write'), 'H 61B B', '', None),
+        'set_file_position': (26, ('file_id', 'offset', 'origin'), 'H q B', 'B Q', 'SetFilePosition'),
+        'get_file_position': (27, ('file_id',), 'H', 'B Q', 'GetFilePosition'),
+        'set_file_events': (28, ('file_id', 'events'), 'H H', 'B', None),
+        'get_file_events': (29, ('file_id',), 'H', 'B H', 'GetFileEvents'),
+        'open_directory': (33, ('name_string_id', 'session_id'), 'H H', 'B H', 'OpenDirectory'),
+        'get_directory_name': (34, ('directory_id', 'session_id'), 'H H', 'B H', 'GetDirectoryName'),
+        'get_next_directory_entry': (35, ('directory_id', 'session_id'), 'H H', 'B H B', 'GetNextDirectoryEntry'),
+        'rewind_directory': (36, ('directory_id',), 'H', 'B', None),
+        'create_directory': (37, ('name_string_id', 'flags', 'permissions', 'uid', 'gid'), 'H I H I I', 'B', None),
+        'get_processes': (38, ('session_id',), 'H', 'B H', 'GetProcesses'),
+        'spawn_process': (39, ('executable_string_id', 'arguments_list_id', 'environment_list_id', 'working_directory_string_id', 'uid', 'gid', 'stdin_file_id', 'stdout_file_id', 'stderr_file_id', 'session_id'), 'H H H H I I H H H H', 'B H', 'SpawnProcess'),
+        'kill_process': (40, ('process_id', 'signal'), 'H B', 'B', None),
+        'get_process_command': (41, ('process_id', 'session_id'), 'H H', 'B H H H H', 'GetProcessCommand'),
+        'get_process_identity': (42, ('process_id',), 'H', 'B I I I', 'GetProcessIdentity'),
+        'get_process_stdio': (43, ('process_id', 'session_id'), 'H H', 'B H H H', 'GetProcessStdio'),
+        'get_process_state': (44, ('process_id',), 'H', 'B B Q B', 'GetProcessState'),
+        'get_programs': (46, ('session_id',), 'H', 'B H', 'GetPrograms'),
+        'define_program': (47, ('identifier_string_id', 'session_id'), 'H H', 'B H', 'DefineProgram'),
+        'purge_program': (48, ('program_id', 'cookie'), 'H I', 'B', None),
+        'get_program_identifier': (49, ('program_id', 'session_id'), 'H H', 'B H', 'GetProgramIdentifier'),
+        'get_program_root_directory': (50, ('program_id', 'session_id'), 'H H', 'B H', 'GetProgramRootDirectory'),
+        'set_program_command': (51, ('program_id', 'executable_string_id', 'arguments_list_id', 'environment_list_id', 'working_directory_string_id'), 'H H H H H', 'B', None),
+        'get_program_command': (52, ('program_id', 'session_id'), 'H H', 'B H H H H', 'GetProgramCommand'),
+        'set_program_stdio_redirection': (53, ('program_id', 'stdin_redirection', 'stdin_file_name_string_id', 'stdout_redirection', 'stdout_file_name_string_id', 'stderr_redirection', 'stderr_file_name_string_id'), 'H B H B H B H', 'B', None),
+        'get_program_stdio_redirection': (54, ('program_id', 'session_id'), 'H H', 'B B H B H B H', 'GetProgramStdioRedirection'),
+        'set_program_schedule': (55, ('program_id', 'start_mode', 'continue_after_error', 'start_interval', 'start_fields_string_id'), 'H B ? I H', 'B', None),
+        'get_program_schedule': (56, ('program_id', 'session_id'), 'H H', 'B B ? I H', 'GetProgramSchedule'),
+        'get_program_scheduler_state': (57, ('program_id', 'session_id'), 'H H', 'B B Q H', 'GetProgramSchedulerState'),
+        'continue_program_schedule': (58, ('program_id',), 'H', 'B', None),
+        'start_program': (59, ('program_id',), 'H', 'B', None),
+        'get_last_spawned_program_process': (60, ('program_id', 'session_id'), 'H H', 'B H Q', 'GetLastSpawnedProgramProcess'),
+        'get_custom_program_option_names': (61, ('program_id', 'session_id'), 'H H', 'B H', 'GetCustomProgramOptionNames'),
+        'set_custom_program_option_value': (62, ('program_id', 'name_string_id', 'value_string_id'), 'H H H', 'B', None),
+        'get_custom_program_option_value': (63, ('program_id', 'name_string_id', 'session_id'), 'H H H', 'B H', 'GetCustomProgramOptionValue'),
+        'remove_custom_program_option': (64, ('program_id', 'name_string_id'), 'H H', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickServo': {
+        'enable': (1, ('servo_num',), 'B', '', None),
+        'disable': (2, ('servo_num',), 'B', '', None),
+        'is_enabled': (3, ('servo_num',), 'B', '?', None),
+        'set_position': (4, ('servo_num', 'position'), 'B h', '', None),
+        'get_position': (5, ('servo_num',), 'B', 'h', None),
+        'get_current_position': (6, ('servo_num',), 'B', 'h', None),
+        'set_velocity': (7, ('servo_num', 'velocity'), 'B H', '', None),
+        'get_velocity': (8, ('servo_num',), 'B', 'H', None),
+        'get_current_velocity': (9, ('servo_num',), 'B', 'H', None),
+        'set_acceleration': (10, ('servo_num', 'acceleration'), 'B H', '', None),
+        'get_acceleration': (11, ('servo_num',), 'B', 'H', None),
+        'set_output_voltage': (12, ('voltage',), 'H', '', None),
+        'get_output_voltage': (13, (), '', 'H', None),
+        'set_pulse_width': (14, ('servo_num', 'min', 'max'), 'B H H', '', None),
+        'get_pulse_width': (15, ('servo_num',), 'B', 'H H', 'GetPulseWidth'),
+        'set_degree': (16, ('servo_num', 'min', 'max'), 'B h h', '', None),
+        'get_degree': (17, ('servo_num',), 'B', 'h h', 'GetDegree'),
+        'set_period': (18, ('servo_num', 'period'), 'B H', '', None),
+        'get_period': (19, ('servo_num',), 'B', 'H', None),
+        'get_servo_current': (20, ('servo_num',), 'B', 'H', None),
+        'get_overall_current': (21, (), '', 'H', None),
+        'get_stack_input_voltage': (22, (), '', 'H', None),
+        'get_external_input_voltage': (23, (), '', 'H', None),
+        'set_minimum_voltage': (24, ('voltage',), 'H', '', None),
+        'get_minimum_voltage': (25, (), '', 'H', None),
+        'enable_position_reached_callback': (29, (), '', '', None),
+        'disable_position_reached_callback': (30, (), '', '', None),
+        'is_position_reached_callback_enabled': (31, (), '', '?', None),
+        'enable_velocity_reached_callback': (32, (), '', '', None),
+        'disable_velocity_reached_callback': (33, (), '', '', None),
+        'is_velocity_reached_callback_enabled': (34, (), '', '?', None),
+        'enable_status_led': (238, (), '', '', None),
+        'disable_status_led': (239, (), '', '', None),
+        'is_status_led_enabled': (240, (), '', '?', None),
+        'get_protocol1_bricklet_name': (241, ('port',), 'c', 'B 3B 40s', 'GetProtocol1BrickletName'),
+        'get_chip_temperature': (242, (), '', 'h', None),
+        'reset': (243, (), '', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickSilentStepper': {
+        'set_max_velocity': (1, ('velocity',), 'H', '', None),
+        'get_max_velocity': (2, (), '', 'H', None),
+        'get_current_velocity': (3, (), '', 'H', None),
+        'set_speed_ramping': (4, ('acceleration', 'deacceleration'), 'H H', '', None),
+        'get_speed_ramping': (5, (), '', 'H H', 'GetSpeedRamping'),
+        'full_brake': (6, (), '', '', None),
+        'set_current_position': (7, ('position',), 'i', '', None),
+        'get_current_position': (8, (), '', 'i', None),
+        'set_target_position': (9, ('position',), 'i', '', None),
+        'get_target_position': (10, (), '', 'i', None),
+        'set_steps': (11, ('steps',), 'i', '', None),
+        'get_steps': (12, (), '', 'i', None),
+        'get_remaining_steps': (13, (), '', 'i', None),
+        'set_step_mode': (14, ('step_mode',), 'B', '', None),
+        'get_step_mode': (15, (), '', 'B', None),
+        'drive_forward': (16, (), '', '', None),
+        'drive_backward': (17, (), '', '', None),
+        'stop': (18, (), '', '', None),
+        'get_stack_input_voltage': (19, (), '', 'H', None),
+        'get_external_input_voltage': (20, (), '', 'H', None),
+        'get_current_consumption': (21, (), '', 'H', None),
+        'set_motor_current': (22, ('current',), 'H', '', None),
+        'get_motor_current': (23, (), '', 'H', None),
+        'enable': (24, (), '', '', None),
+        'disable': (25, (), '', '', None),
+        'is_enabled': (26, (), '', '?', None),
+        'set_configuration': (27, ('standstill_power_down', 'chopper_off_time', 'chopper_hysteresis', 'chopper_blank_time'), 'B B B B', '', None),
+        'get_configuration': (28, (), '', 'B B B B', 'GetConfiguration'),
+        'set_minimum_voltage': (29, ('voltage',), 'H', '', None),
+        'get_minimum_voltage': (30, (), '', 'H', None),
+        'set_time_base': (33, ('time_base',), 'I', '', None),
+        'get_time_base': (34, (), '', 'I', None),
+        'get_all_data': (35, (), '', 'H i i H H H', 'GetAllData'),
+        'set_all_data_period': (36, ('period',), 'I', '', None),
+        'get_all_data_period': (37, (), '', 'I', None),
+        'enable_status_led': (238, (), '', '', None),
+        'disable_status_led': (239, (), '', '', None),
+        'is_status_led_enabled': (240, (), '', '?', None),
+        'get_protocol1_bricklet_name': (241, ('port',), 'c', 'B 3B 40s', 'GetProtocol1BrickletName'),
+        'get_chip_temperature': (242, (), '', 'h', None),
+        'reset': (243, (), '', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickStepper': {
+        'set_max_velocity': (1, ('velocity',), 'H', '', None),
+        'get_max_velocity': (2, (), '', 'H', None),
+        'get_current_velocity': (3, (), '', 'H', None),
+        'set_speed_ramping': (4, ('acceleration', 'deacceleration'), 'H H', '', None),
+        'get_speed_ramping': (5, (), '', 'H H', 'GetSpeedRamping'),
+        'full_brake': (6, (), '', '', None),
+        'set_current_position': (7, ('position',), 'i', '', None),
+        'get_current_position': (8, (), '', 'i', None),
+        'set_target_position': (9, ('position',), 'i', '', None),
+        'get_target_position': (10, (), '', 'i', None),
+        'set_steps': (11, ('steps',), 'i', '', None),
+        'get_steps': (12, (), '', 'i', None),
+        'get_remaining_steps': (13, (), '', 'i', None),
+        'set_step_mode': (14, ('mode',), 'B', '', None),
+        'get_step_mode': (15, (), '', 'B', None),
+        'drive_forward': (16, (), '', '', None),
+        'drive_backward': (17, (), '', '', None),
+        'stop': (18, (), '', '', None),
+        'get_stack_input_voltage': (19, (), '', 'H', None),
+        'get_external_input_voltage': (20, (), '', 'H', None),
+        'get_current_consumption': (21, (), '', 'H', None),
+        'set_motor_current': (22, ('current',), 'H', '', None),
+        'get_motor_current': (23, (), '', 'H', None),
+        'enable': (24, (), '', '', None),
+        'disable': (25, (), '', '', None),
+        'is_enabled': (26, (), '', '?', None),
+        'set_decay': (27, ('decay',), 'H', '', None),
+        'get_decay': (28, (), '', 'H', None),
+        'set_minimum_voltage': (29, ('voltage',), 'H', '', None),
+        'get_minimum_voltage': (30, (), '', 'H', None),
+        'set_sync_rect': (33, ('sync_rect',), '?', '', None),
+        'is_sync_rect': (34, (), '', '?', None),
+        'set_time_base': (35, ('time_base',), 'I', '', None),
+        'get_time_base': (36, (), '', 'I', None),
+        'get_all_data': (37, (), '', 'H i i H H H', 'GetAllData'),
+        'set_all_data_period': (38, ('period',), 'I', '', None),
+        'get_all_data_period': (39, (), '', 'I', None),
+        'enable_status_led': (238, (), '', '', None),
+        'disable_status_led': (239, (), '', '', None),
+        'is_status_led_enabled': (240, (), '', '?', None),
+        'get_protocol1_bricklet_name': (241, ('port',), 'c', 'B 3B 40s', 'GetProtocol1BrickletName'),
+        'get_chip_temperature': (242, (), '', 'h', None),
+        'reset': (243, (), '', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletACCurrent': {
+        'get_current': (1, (), '', 'H', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_current_callback_period': (3, ('period',), 'I', '', None),
+        'get_current_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_current_callback_threshold': (7, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_current_callback_threshold': (8, (), '', 'c H H', 'GetCurrentCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'set_moving_average': (13, ('average',), 'B', '', None),
+        'get_moving_average': (14, (), '', 'B', None),
+        'set_configuration': (15, ('current_range',), 'B', '', None),
+        'get_configuration': (16, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletAccelerometer': {
+        'get_acceleration': (1, (), '', 'h h h', 'GetAcceleration'),
+        'set_acceleration_callback_period': (2, ('period',), 'I', '', None),
+        'get_acceleration_callback_period': (3, (), '', 'I', None),
+        'set_acceleration_callback_threshold': (4, ('option', 'min_x', 'max_x', 'min_y', 'max_y', 'min_z', 'max_z'), 'c h h h h h h', '', None),
+        'get_acceleration_callback_threshold': (5, (), '', 'c h h h h h h', 'GetAccelerationCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'get_temperature': (8, (), '', 'h', None),
+        'set_configuration': (9, ('data_rate', 'full_scale', 'filter_bandwidth'), 'B B B', '', None),
+        'get_configuration': (10, (), '', 'B B B', 'GetConfiguration'),
+        'led_on': (11, (), '', '', None),
+        'led_off': (12, (), '', '', None),
+        'is_led_on': (13, (), '', '?', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletAmbientLight': {
+        'get_illuminance': (1, (), '', 'H', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_illuminance_callback_period': (3, ('period',), 'I', '', None),
+        'get_illuminance_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_illuminance_callback_threshold': (7, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_illuminance_callback_threshold': (8, (), '', 'c H H', 'GetIlluminanceCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletAmbientLightV2': {
+        'get_illuminance': (1, (), '', 'I', None),
+        'set_illuminance_callback_period': (2, ('period',), 'I', '', None),
+        'get_illuminance_callback_period': (3, (), '', 'I', None),
+        'set_illuminance_callback_threshold': (4, ('option', 'min', 'max'), 'c I I', '', None),
+        'get_illuminance_callback_threshold': (5, (), '', 'c I I', 'GetIlluminanceCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'set_configuration': (8, ('illuminance_range', 'integration_time'), 'B B', '', None),
+        'get_configuration': (9, (), '', 'B B', 'GetConfiguration'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletAnalogIn': {
+        'get_voltage': (1, (), '', 'H', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_voltage_callback_period': (3, ('period',), 'I', '', None),
+        'get_voltage_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_voltage_callback_threshold': (7, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_voltage_callback_threshold': (8, (), '', 'c H H', 'GetVoltageCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'set_range': (17, ('range',), 'B', '', None),
+        'get_range': (18, (), '', 'B', None),
+        'set_averaging': (19, ('average',), 'B', '', None),
+        'get_averaging': (20, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletAnalogInV2': {
+        'get_voltage': (1, (), '', 'H', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_voltage_callback_period': (3, ('period',), 'I', '', None),
+        'get_voltage_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_voltage_callback_threshold': (7, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_voltage_callback_threshold': (8, (), '', 'c H H', 'GetVoltageCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'set_moving_average': (13, ('average',), 'B', '', None),
+        'get_moving_average': (14, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletAnalogOut': {
+        'set_voltage': (1, ('voltage',), 'H', '', None),
+        'get_voltage': (2, (), '', 'H', None),
+        'set_mode': (3, ('mode',), 'B', '', None),
+        'get_mode': (4, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletAnalogOutV2': {
+        'set_output_voltage': (1, ('voltage',), 'H', '', None),
+        'get_output_voltage': (2, (), '', 'H', None),
+        'get_input_voltage': (3, (), '', 'H', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletBarometer': {
+        'get_air_pressure': (1, (), '', 'i', None),
+        'get_altitude': (2, (), '', 'i', None),
+        'set_air_pressure_callback_period': (3, ('period',), 'I', '', None),
+        'get_air_pressure_callback_period': (4, (), '', 'I', None),
+        'set_altitude_callback_period': (5, ('period',), 'I', '', None),
+        'get_altitude_callback_period': (6, (), '', 'I', None),
+        'set_air_pressure_callback_threshold': (7, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_air_pressure_callback_threshold': (8, (), '', 'c i i', 'GetAirPressureCallbackThreshold'),
+        'set_altitude_callback_threshold': (9, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_altitude_callback_threshold': (10, (), '', 'c i i', 'GetAltitudeCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'set_reference_air_pressure': (13, ('air_pressure',), 'i', '', None),
+        'get_chip_temperature': (14, (), '', 'h', None),
+        'get_reference_air_pressure': (19, (), '', 'i', None),
+        'set_averaging': (20, ('moving_average_pressure', 'average_pressure', 'average_temperature'), 'B B B', '', None),
+        'get_averaging': (21, (), '', 'B B B', 'GetAveraging'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletCAN': {
+        'write_frame': (1, ('frame_type', 'identifier', 'data', 'length'), 'B I 8B B', '?', None),
+        'read_frame': (2, (), '', '? B I 8B B', 'ReadFrame'),
+        'enable_frame_read_callback': (3, (), '', '', None),
+        'disable_frame_read_callback': (4, (), '', '', None),
+        'is_frame_read_callback_enabled': (5, (), '', '?', None),
+        'set_configuration': (6, ('baud_rate', 'transceiver_mode', 'write_timeout'), 'B B i', '', None),
+        'get_configuration': (7, (), '', 'B B i', 'GetConfiguration'),
+        'set_read_filter': (8, ('mode', 'mask', 'filter1', 'filter2'), 'B I I I', '', None),
+        'get_read_filter': (9, (), '', 'B I I I', 'GetReadFilter'),
+        'get_error_log': (10, (), '', 'B B ? I I I', 'GetErrorLog'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletCO2': {
+        'get_co2_concentration': (1, (), '', 'H', None),
+        'set_co2_concentration_callback_period': (2, ('period',), 'I', '', None),
+        'get_co2_concentration_callback_period': (3, (), '', 'I', None),
+        'set_co2_concentration_callback_threshold': (4, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_co2_concentration_callback_threshold': (5, (), '', 'c H H', 'GetCO2ConcentrationCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletColor': {
+        'get_color': (1, (), '', 'H H H H', 'GetColor'),
+        'set_color_callback_period': (2, ('period',), 'I', '', None),
+        'get_color_callback_period': (3, (), '', 'I', None),
+        'set_color_callback_threshold': (4, ('option', 'min_r', 'max_r', 'min_g', 'max_g', 'min_b', 'max_b', 'min_c', 'max_c'), 'c H H H H H H H H', '', None),
+        'get_color_callback_threshold': (5, (), '', 'c H H H H H H H H', 'GetColorCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'light_on': (10, (), '', '', None),
+        'light_off': (11, (), '', '', None),
+        'is_light_on': (12, (), '', 'B', None),
+        'set_config': (13, ('gain', 'integration_time'), 'B B', '', None),
+        'get_config': (14, (), '', 'B B', 'GetConfig'),
+        'get_illuminance': (15, (), '', 'I', None),
+        'get_color_temperature': (16, (), '', 'H', None),
+        'set_illuminance_callback_period': (17, ('period',), 'I', '', None),
+        'get_illuminance_callback_period': (18, (), '', 'I', None),
+        'set_color_temperature_callback_period': (19, ('period',), 'I', '', None),
+        'get_color_temperature_callback_period': (20, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletCurrent12': {
+        'get_current': (1, (), '', 'h', None),
+        'calibrate': (2, (), '', '', None),
+        'is_over_current': (3, (), '', '?', None),
+        'get_analog_value': (4, (), '', 'H', None),
+        'set_current_callback_period': (5, ('period',), 'I', '', None),
+        'get_current_callback_period': (6, (), '', 'I', None),
+        'set_analog_value_callback_period': (7, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (8, (), '', 'I', None),
+        'set_current_callback_threshold': (9, ('option', 'min', 'max'), 'c h h', '', None),
+        'get_current_callback_threshold': (10, (), '', 'c h h', 'GetCurrentCallbackThreshold'),
+        'set_analog_value_callback_threshold': (11, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (12, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (13, ('debounce',), 'I', '', None),
+        'get_debounce_period': (14, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletCurrent25': {
+        'get_current': (1, (), '', 'h', None),
+        'calibrate': (2, (), '', '', None),
+        'is_over_current': (3, (), '', '?', None),
+        'get_analog_value': (4, (), '', 'H', None),
+        'set_current_callback_period': (5, ('period',), 'I', '', None),
+        'get_current_callback_period': (6, (), '', 'I', None),
+        'set_analog_value_callback_period': (7, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (8, (), '', 'I', None),
+        'set_current_callback_threshold': (9, ('option', 'min', 'max'), 'c h h', '', None),
+        'get_current_callback_threshold': (10, (), '', 'c h h', 'GetCurrentCallbackThreshold'),
+        'set_analog_value_callback_threshold': (11, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (12, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (13, ('debounce',), 'I', '', None),
+        'get_debounce_period': (14, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletDistanceIR': {
+        'get_distance': (1, (), '', 'H', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_sampling_point': (3, ('position', 'distance'), 'B H', '', None),
+        'get_sampling_point': (4, ('position',), 'B', 'H', None),
+        'set_distance_callback_period': (5, ('period',), 'I', '', None),
+        'get_distance_callback_period': (6, (), '', 'I', None),
+        'set_analog_value_callback_period': (7, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (8, (), '', 'I', None),
+        'set_distance_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_distance_callback_threshold': (10, (), '', 'c H H', 'GetDistanceCallbackThreshold'),
+        'set_analog_value_callback_threshold': (11, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (12, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (13, ('debounce',), 'I', '', None),
+        'get_debounce_period': (14, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletDistanceUS': {
+        'get_distance_value': (1, (), '', 'H', None),
+        'set_distance_callback_period': (2, ('period',), 'I', '', None),
+        'get_distance_callback_period': (3, (), '', 'I', None),
+        'set_distance_callback_threshold': (4, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_distance_callback_threshold': (5, (), '', 'c H H', 'GetDistanceCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'set_moving_average': (10, ('average',), 'B', '', None),
+        'get_moving_average': (11, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletDualButton': {
+        'set_led_state': (1, ('led_l', 'led_r'), 'B B', '', None),
+        'get_led_state': (2, (), '', 'B B', 'GetLEDState'),
+        'get_button_state': (3, (), '', 'B B', 'GetButtonState'),
+        'set_selected_led_state': (5, ('led', 'state'), 'B B', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletDualRelay': {
+        'set_state': (1, ('relay1', 'relay2'), '? ?', '', None),
+        'get_state': (2, (), '', '? ?', 'GetState'),
+        'set_monoflop': (3, ('relay', 'state', 'time'), 'B ? I', '', None),
+        'get_monoflop': (4, ('relay',), 'B', '? I I', 'GetMonoflop'),
+        'set_selected_state': (6, ('relay', 'state'), 'B ?', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletDustDetector': {
+        'get_dust_density': (1, (), '', 'H', None),
+        'set_dust_density_callback_period': (2, ('period',), 'I', '', None),
+        'get_dust_density_callback_period': (3, (), '', 'I', None),
+        'set_dust_density_callback_threshold': (4, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_dust_density_callback_threshold': (5, (), '', 'c H H', 'GetDustDensityCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'set_moving_average': (10, ('average',), 'B', '', None),
+        'get_moving_average': (11, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletGasDetector': {
+        'get_value': (1, (), '', 'H', None),
+        'set_value_callback_period': (2, ('period',), 'I', '', None),
+        'get_value_callback_period': (3, (), '', 'I', None),
+        'set_value_callback_threshold': (4, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_value_callback_threshold': (5, (), '', 'c H H', 'GetValueCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'set_moving_average': (8, ('average',), 'B', '', None),
+        'get_moving_average': (9, (), '', 'B', None),
+        'set_detector_type': (10, ('detector_type',), 'B', '', None),
+        'get_detector_type': (11, (), '', 'B', None),
+        'heater_on': (12, (), '', '', None),
+        'heater_off': (13, (), '', '', None),
+        'is_heater_on': (14, (), '', '?', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletGPS': {
+        'get_coordinates': (1, (), '', 'I c I c H H H H', 'GetCoordinates'),
+        'get_status': (2, (), '', 'B B B', 'GetStatus'),
+        'get_altitude': (3, (), '', 'i i', 'GetAltitude'),
+        'get_motion': (4, (), '', 'I I', 'GetMotion'),
+        'get_date_time': (5, (), '', 'I I', 'GetDateTime'),
+        'restart': (6, ('restart_type',), 'B', '', None),
+        'set_coordinates_callback_period': (7, ('period',), 'I', '', None),
+        'get_coordinates_callback_period': (8, (), '', 'I', None),
+        'set_status_callback_period': (9, ('period',), 'I', '', None),
+        'get_status_callback_period': (10, (), '', 'I', None),
+        'set_altitude_callback_period': (11, ('period',), 'I', '', None),
+        'get_altitude_callback_period': (12, (), '', 'I', None),
+        'set_motion_callback_period': (13, ('period',), 'I', '', None),
+        'get_motion_callback_period': (14, (), '', 'I', None),
+        'set_date_time_callback_period': (15, ('period',), 'I', '', None),
+        'get_date_time_callback_period': (16, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletHallEffect': {
+        'get_value': (1, (), '', '?', None),
+        'get_edge_count': (2, ('reset_counter',), '?', 'I', None),
+        'set_edge_count_config': (3, ('edge_type', 'debounce'), 'B B', '', None),
+        'get_edge_count_config': (4, (), '', 'B B', 'GetEdgeCountConfig'),
+        'set_edge_interrupt': (5, ('edges',), 'I', '', None),
+        'get_edge_interrupt': (6, (), '', 'I', None),
+        'set_edge_count_callback_period': (7, ('period',), 'I', '', None),
+        'get_edge_count_callback_period': (8, (), '', 'I', None),
+        'edge_interrupt': (9, (), '', 'I ?', 'EdgeInterrupt'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletHeartRate': {
+        'get_heart_rate': (1, (), '', 'H', None),
+        'set_heart_rate_callback_period': (2, ('period',), 'I', '', None),
+        'get_heart_rate_callback_period': (3, (), '', 'I', None),
+        'set_heart_rate_callback_threshold': (4, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_heart_rate_callback_threshold': (5, (), '', 'c H H', 'GetHeartRateCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'enable_beat_state_changed_callback': (11, (), '', '', None),
+        'disable_beat_state_changed_callback': (12, (), '', '', None),
+        'is_beat_state_changed_callback_enabled': (13, (), '', '?', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletHumidity': {
+        'get_humidity': (1, (), '', 'H', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_humidity_callback_period': (3, ('period',), 'I', '', None),
+        'get_humidity_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_humidity_callback_threshold': (7, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_humidity_callback_threshold': (8, (), '', 'c H H', 'GetHumidityCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletIndustrialAnalogOut': {
+        'enable': (1, (), '', '', None),
+        'disable': (2, (), '', '', None),
+        'is_enabled': (3, (), '', '?', None),
+        'set_voltage': (4, ('voltage',), 'H', '', None),
+        'get_voltage': (5, (), '', 'H', None),
+        'set_current': (6, ('current',), 'H', '', None),
+        'get_current': (7, (), '', 'H', None),
+        'set_configuration': (8, ('voltage_range', 'current_range'), 'B B', '', None),
+        'get_configuration': (9, (), '', 'B B', 'GetConfiguration'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletIndustrialDigitalIn4': {
+        'get_value': (1, (), '', 'H', None),
+        'set_group': (2, ('group',), '4c', '', None),
+        'get_group': (3, (), '', '4c', None),
+        'get_available_for_group': (4, (), '', 'B', None),
+        'set_debounce_period': (5, ('debounce',), 'I', '', None),
+        'get_debounce_period': (6, (), '', 'I', None),
+        'set_interrupt': (7, ('interrupt_mask',), 'H', '', None),
+        'get_interrupt': (8, (), '', 'H', None),
+        'get_edge_count': (10, ('pin', 'reset_counter'), 'B ?', 'I', None),
+        'set_edge_count_config': (11, ('selection_mask', 'edge_type', 'debounce'), 'H B B', '', None),
+        'get_edge_count_config': (12, ('pin',), 'B', 'B B', 'GetEdgeCountConfig'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletIndustrialDigitalOut4': {
+        'set_value': (1, ('value_mask',), 'H', '', None),
+        'get_value': (2, (), '', 'H', None),
+        'set_monoflop': (3, ('selection_mask', 'value_mask', 'time'), 'H H I', '', None),
+        'get_monoflop': (4, ('pin',), 'B', 'H I I', 'GetMonoflop'),
+        'set_group': (5, ('group',), '4c', '', None),
+        'get_group': (6, (), '', '4c', None),
+        'get_available_for_group': (7, (), '', 'B', None),
+        'set_selected_values': (9, ('selection_mask', 'value_mask'), 'H H', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletIndustrialDual020mA': {
+        'get_current': (1, ('sensor',), 'B', 'i', None),
+        'set_current_callback_period': (2, ('sensor', 'period'), 'B I', '', None),
+        'get_current_callback_period': (3, ('sensor',), 'B', 'I', None),
+        'set_current_callback_threshold': (4, ('sensor', 'option', 'min', 'max'), 'B c i i', '', None),
+        'get_current_callback_threshold': (5, ('sensor',), 'B', 'c i i', 'GetCurrentCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'set_sample_rate': (8, ('rate',), 'B', '', None),
+        'get_sample_rate': (9, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletIndustrialDualAnalogIn': {
+        'get_voltage': (1, ('channel',), 'B', 'i', None),
+        'set_voltage_callback_period': (2, ('channel', 'period'), 'B I', '', None),
+        'get_voltage_callback_period': (3, ('channel',), 'B', 'I', None),
+        'set_voltage_callback_threshold': (4, ('channel', 'option', 'min', 'max'), 'B c i i', '', None),
+        'get_voltage_callback_threshold': (5, ('channel',), 'B', 'c i i', 'GetVoltageCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'set_sample_rate': (8, ('rate',), 'B', '', None),
+        'get_sample_rate': (9, (), '', 'B', None),
+        'set_calibration': (10, ('offset', 'gain'), '2i 2i', '', None),
+        'get_calibration': (11, (), '', '2i 2i', 'GetCalibration'),
+        'get_adc_values': (12, (), '', '2i', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletIndustrialQuadRelay': {
+        'set_value': (1, ('value_mask',), 'H', '', None),
+        'get_value': (2, (), '', 'H', None),
+        'set_monoflop': (3, ('selection_mask', 'value_mask', 'time'), 'H H I', '', None),
+        'get_monoflop': (4, ('pin',), 'B', 'H I I', 'GetMonoflop'),
+        'set_group': (5, ('group',), '4c', '', None),
+        'get_group': (6, (), '', '4c', None),
+        'get_available_for_group': (7, (), '', 'B', None),
+        'set_selected_values': (9, ('selection_mask', 'value_mask'), 'H H', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletIO16': {
+        'set_port': (1, ('port', 'value_mask'), 'c B', '', None),
+        'get_port': (2, ('port',), 'c', 'B', None),
+        'set_port_configuration': (3, ('port', 'selection_mask', 'direction', 'value'), 'c B c ?', '', None),
+        'get_port_configuration': (4, ('port',), 'c', 'B B', 'GetPortConfiguration'),
+        'set_debounce_period': (5, ('debounce',), 'I', '', None),
+        'get_debounce_period': (6, (), '', 'I', None),
+        'set_port_interrupt': (7, ('port', 'interrupt_mask'), 'c B', '', None),
+        'get_port_interrupt': (8, ('port',), 'c', 'B', None),
+        'set_port_monoflop': (10, ('port', 'selection_mask', 'value_mask', 'time'), 'c B B I', '', None),
+        'get_port_monoflop': (11, ('port', 'pin'), 'c B', 'B I I', 'GetPortMonoflop'),
+        'set_selected_values': (13, ('port', 'selection_mask', 'value_mask'), 'c B B', '', None),
+        'get_edge_count': (14, ('pin', 'reset_counter'), 'B ?', 'I', None),
+        'set_edge_count_config': (15, ('pin', 'edge_type', 'debounce'), 'B B B', '', None),
+        'get_edge_count_config': (16, ('pin',), 'B', 'B B', 'GetEdgeCountConfig'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletIO4': {
+        'set_value': (1, ('value_mask',), 'B', '', None),
+        'get_value': (2, (), '', 'B', None),
+        'set_configuration': (3, ('selection_mask', 'direction', 'value'), 'B c ?', '', None),
+        'get_configuration': (4, (), '', 'B B', 'GetConfiguration'),
+        'set_debounce_period': (5, ('debounce',), 'I', '', None),
+        'get_debounce_period': (6, (), '', 'I', None),
+        'set_interrupt': (7, ('interrupt_mask',), 'B', '', None),
+        'get_interrupt': (8, (), '', 'B', None),
+        'set_monoflop': (10, ('selection_mask', 'value_mask', 'time'), 'B B I', '', None),
+        'get_monoflop': (11, ('pin',), 'B', 'B I I', 'GetMonoflop'),
+        'set_selected_values': (13, ('selection_mask', 'value_mask'), 'B B', '', None),
+        'get_edge_count': (14, ('pin', 'reset_counter'), 'B ?', 'I', None),
+        'set_edge_count_config': (15, ('selection_mask', 'edge_type', 'debounce'), 'B B B', '', None),
+        'get_edge_count_config': (16, ('pin',), 'B', 'B B', 'GetEdgeCountConfig'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletJoystick': {
+        'get_position': (1, (), '', 'h h', 'GetPosition'),
+        'is_pressed': (2, (), '', '?', None),
+        'get_analog_value': (3, (), '', 'H H', 'GetAnalogValue'),
+        'calibrate': (4, (), '', '', None),
+        'set_position_callback_period': (5, ('period',), 'I', '', None),
+        'get_position_callback_period': (6, (), '', 'I', None),
+        'set_analog_value_callback_period': (7, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (8, (), '', 'I', None),
+        'set_position_callback_threshold': (9, ('option', 'min_x', 'max_x', 'min_y', 'max_y'), 'c h h h h', '', None),
+        'get_position_callback_threshold': (10, (), '', 'c h h h h', 'GetPositionCallbackThreshold'),
+        'set_analog_value_callback_threshold': (11, ('option', 'min_x', 'max_x', 'min_y', 'max_y'), 'c H H H H', '', None),
+        'get_analog_value_callback_threshold': (12, (), '', 'c H H H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (13, ('debounce',), 'I', '', None),
+        'get_debounce_period': (14, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletLaserRangeFinder': {
+        'get_distance': (1, (), '', 'H', None),
+        'get_velocity': (2, (), '', 'h', None),
+        'set_distance_callback_period': (3, ('period',), 'I', '', None),
+        'get_distance_callback_period': (4, (), '', 'I', None),
+        'set_velocity_callback_period': (5, ('period',), 'I', '', None),
+        'get_velocity_callback_period': (6, (), '', 'I', None),
+        'set_distance_callback_threshold': (7, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_distance_callback_threshold': (8, (), '', 'c H H', 'GetDistanceCallbackThreshold'),
+        'set_velocity_callback_threshold': (9, ('option', 'min', 'max'), 'c h h', '', None),
+        'get_velocity_callback_threshold': (10, (), '', 'c h h', 'GetVelocityCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'set_moving_average': (13, ('distance_average_length', 'velocity_average_length'), 'B B', '', None),
+        'get_moving_average': (14, (), '', 'B B', 'GetMovingAverage'),
+        'set_mode': (15, ('mode',), 'B', '', None),
+        'get_mode': (16, (), '', 'B', None),
+        'enable_laser': (17, (), '', '', None),
+        'disable_laser': (18, (), '', '', None),
+        'is_laser_enabled': (19, (), '', '?', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletLCD16x2': {
+        'write_line': (1, ('line', 'position', 'text'), 'B B 16s', '', None),
+        'clear_display': (2, (), '', '', None),
+        'backlight_on': (3, (), '', '', None),
+        'backlight_off': (4, (), '', '', None),
+        'is_backlight_on': (5, (), '', '?', None),
+        'set_config': (6, ('cursor', 'blinking'), '? ?', '', None),
+        'get_config': (7, (), '', '? ?', 'GetConfig'),
+        'is_button_pressed': (8, ('button',), 'B', '?', None),
+        'set_custom_character': (11, ('index', 'character'), 'B 8B', '', None),
+        'get_custom_character': (12, ('index',), 'B', '8B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletLCD20x4': {
+        'write_line': (1, ('line', 'position', 'text'), 'B B 20s', '', None),
+        'clear_display': (2, (), '', '', None),
+        'backlight_on': (3, (), '', '', None),
+        'backlight_off': (4, (), '', '', None),
+        'is_backlight_on': (5, (), '', '?', None),
+        'set_config': (6, ('cursor', 'blinking'), '? ?', '', None),
+        'get_config': (7, (), '', '? ?', 'GetConfig'),
+        'is_button_pressed': (8, ('button',), 'B', '?', None),
+        'set_custom_character': (11, ('index', 'character'), 'B 8B', '', None),
+        'get_custom_character': (12, ('index',), 'B', '8B', None),
+        'set_default_text': (13, ('line', 'text'), 'B 20s', '', None),
+        'get_default_text': (14, ('line',), 'B', '20s', None),
+        'set_default_text_counter': (15, ('counter',), 'i', '', None),
+        'get_default_text_counter': (16, (), '', 'i', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletLEDStrip': {
+        'set_rgb_values': (1, ('index', 'length', 'r', 'g', 'b'), 'H B 16B 16B 16B', '', None),
+        'get_rgb_values': (2, ('index', 'length'), 'H B', '16B 16B 16B', 'GetRGBValues'),
+        'set_frame_duration': (3, ('duration',), 'H', '', None),
+        'get_frame_duration': (4, (), '', 'H', None),
+        'get_supply_voltage': (5, (), '', 'H', None),
+        'set_clock_frequency': (7, ('frequency',), 'I', '', None),
+        'get_clock_frequency': (8, (), '', 'I', None),
+        'set_chip_type': (9, ('chip',), 'H', '', None),
+        'get_chip_type': (10, (), '', 'H', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletLine': {
+        'get_reflectivity': (1, (), '', 'H', None),
+        'set_reflectivity_callback_period': (2, ('period',), 'I', '', None),
+        'get_reflectivity_callback_period': (3, (), '', 'I', None),
+        'set_reflectivity_callback_threshold': (4, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_reflectivity_callback_threshold': (5, (), '', 'c H H', 'GetReflectivityCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletLinearPoti': {
+        'get_position': (1, (), '', 'H', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_position_callback_period': (3, ('period',), 'I', '', None),
+        'get_position_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_position_callback_threshold': (7, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_position_callback_threshold': (8, (), '', 'c H H', 'GetPositionCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletLoadCell': {
+        'get_weight': (1, (), '', 'i', None),
+        'set_weight_callback_period': (2, ('period',), 'I', '', None),
+        'get_weight_callback_period': (3, (), '', 'I', None),
+        'set_weight_callback_threshold': (4, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_weight_callback_threshold': (5, (), '', 'c i i', 'GetWeightCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'set_moving_average': (8, ('average',), 'B', '', None),
+        'get_moving_average': (9, (), '', 'B', None),
+        'led_on': (10, (), '', '', None),
+        'led_off': (11, (), '', '', None),
+        'is_led_on': (12, (), '', '?', None),
+        'calibrate': (13, ('weight',), 'I', '', None),
+        'tare': (14, (), '', '', None),
+        'set_configuration': (15, ('rate', 'gain'), 'B B', '', None),
+        'get_configuration': (16, (), '', 'B B', 'GetConfiguration'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletMoisture': {
+        'get_moisture_value': (1, (), '', 'H', None),
+        'set_moisture_callback_period': (2, ('period',), 'I', '', None),
+        'get_moisture_callback_period': (3, (), '', 'I', None),
+        'set_moisture_callback_threshold': (4, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_moisture_callback_threshold': (5, (), '', 'c H H', 'GetMoistureCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'set_moving_average': (10, ('average',), 'B', '', None),
+        'get_moving_average': (11, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletMotionDetector': {
+        'get_motion_detected': (1, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletMotorizedPoti': {
+        'get_position': (1, (), '', 'H', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_position_callback_period': (3, ('period',), 'I', '', None),
+        'get_position_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_position_callback_threshold': (7, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_position_callback_threshold': (8, (), '', 'c H H', 'GetPositionCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'set_motor_position': (17, ('position', 'disable_after_reach'), 'H ?', '', None),
+        'get_motor_position': (18, (), '', 'H ?', 'GetMotorPosition'),
+        'enable_motor': (19, (), '', '', None),
+        'disable_motor': (20, (), '', '', None),
+        'is_motor_enabled': (21, (), '', '?', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletMultiTouch': {
+        'get_touch_state': (1, (), '', 'H', None),
+        'recalibrate': (2, (), '', '', None),
+        'set_electrode_config': (3, ('enabled_electrodes',), 'H', '', None),
+        'get_electrode_config': (4, (), '', 'H', None),
+        'set_electrode_sensitivity': (6, ('sensitivity',), 'B', '', None),
+        'get_electrode_sensitivity': (7, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletNFCRFID': {
+        'request_tag_id': (1, ('tag_type',), 'B', '', None),
+        'get_tag_id': (2, (), '', 'B B 7B', 'GetTagID'),
+        'get_state': (3, (), '', 'B ?', 'GetState'),
+        'authenticate_mifare_classic_page': (4, ('page', 'key_number', 'key'), 'H B 6B', '', None),
+        'write_page': (5, ('page', 'data'), 'H 16B', '', None),
+        'request_page': (6, ('page',), 'H', '', None),
+        'get_page': (7, (), '', '16B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletOLED128x64': {
+        'write': (1, ('data',), '64B', '', None),
+        'new_window': (2, ('column_from', 'column_to', 'row_from', 'row_to'), 'B B B B', '', None),
+        'clear_display': (3, (), '', '', None),
+        'set_display_configuration': (4, ('contrast', 'invert'), 'B ?', '', None),
+        'get_display_configuration': (5, (), '', 'B ?', 'GetDisplayConfiguration'),
+        'write_line': (6, ('line', 'position', 'text'), 'B B 26s', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletOLED64x48': {
+        'write': (1, ('data',), '64B', '', None),
+        'new_window': (2, ('column_from', 'column_to', 'row_from', 'row_to'), 'B B B B', '', None),
+        'clear_display': (3, (), '', '', None),
+        'set_display_configuration': (4, ('contrast', 'invert'), 'B ?', '', None),
+        'get_display_configuration': (5, (), '', 'B ?', 'GetDisplayConfiguration'),
+        'write_line': (6, ('line', 'position', 'text'), 'B B 13s', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletOzone': {
+        'get_ozone_concentration': (1, (), '', 'H', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_ozone_concentration_callback_period': (3, ('period',), 'I', '', None),
+        'get_ozone_concentration_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_ozone_concentration_callback_threshold': (7, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_ozone_concentration_callback_threshold': (8, (), '', 'c H H', 'GetOzoneConcentrationCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'set_moving_average': (13, ('average',), 'B', '', None),
+        'get_moving_average': (14, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletPiezoBuzzer': {
+        'beep': (1, ('duration',), 'I', '', None),
+        'morse_code': (2, ('morse',), '60s', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletPiezoSpeaker': {
+        'beep': (1, ('duration', 'frequency'), 'I H', '', None),
+        'morse_code': (2, ('morse', 'frequency'), '60s H', '', None),
+        'calibrate': (3, (), '', '?', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletPressure': {
+        'get_pressure': (1, (), '', 'i', None),
+        'get_analog_value': (2, (), '', 'i', None),
+        'set_pressure_callback_period': (3, ('period',), 'I', '', None),
+        'get_pressure_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_pressure_callback_threshold': (7, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_pressure_callback_threshold': (8, (), '', 'c i i', 'GetPressureCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c i i', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'set_sensor_type': (13, ('sensor',), 'B', '', None),
+        'get_sensor_type': (14, (), '', 'B', None),
+        'set_moving_average': (15, ('average',), 'B', '', None),
+        'get_moving_average': (16, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletPTC': {
+        'get_temperature': (1, (), '', 'i', None),
+        'get_resistance': (2, (), '', 'H', None),
+        'set_temperature_callback_period': (3, ('period',), 'I', '', None),
+        'get_temperature_callback_period': (4, (), '', 'I', None),
+        'set_resistance_callback_period': (5, ('period',), 'I', '', None),
+        'get_resistance_callback_period': (6, (), '', 'I', None),
+        'set_temperature_callback_threshold': (7, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_temperature_callback_threshold': (8, (), '', 'c i i', 'GetTemperatureCallbackThreshold'),
+        'set_resistance_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_resistance_callback_threshold': (10, (), '', 'c H H', 'GetResistanceCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'set_noise_rejection_filter': (17, ('filter',), 'B', '', None),
+        'get_noise_rejection_filter': (18, (), '', 'B', None),
+        'is_sensor_connected': (19, (), '', '?', None),
+        'set_wire_mode': (20, ('mode',), 'B', '', None),
+        'get_wire_mode': (21, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletRealTimeClock': {
+        'set_date_time': (1, ('year', 'month', 'day', 'hour', 'minute', 'second', 'centisecond', 'weekday'), 'H B B B B B B B', '', None),
+        'get_date_time': (2, (), '', 'H B B B B B B B', 'GetDateTime'),
+        'get_timestamp': (3, (), '', 'q', None),
+        'set_offset': (4, ('offset',), 'b', '', None),
+        'get_offset': (5, (), '', 'b', None),
+        'set_date_time_callback_period': (6, ('period',), 'I', '', None),
+        'get_date_time_callback_period': (7, (), '', 'I', None),
+        'set_alarm': (8, ('month', 'day', 'hour', 'minute', 'second', 'weekday', 'interval'), 'b b b b b b i', '', None),
+        'get_alarm': (9, (), '', 'b b b b b b i', 'GetAlarm'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletRemoteSwitch': {
+        'switch_socket': (1, ('house_code', 'receiver_code', 'switch_to'), 'B B B', '', None),
+        'get_switching_state': (2, (), '', 'B', None),
+        'set_repeats': (4, ('repeats',), 'B', '', None),
+        'get_repeats': (5, (), '', 'B', None),
+        'switch_socket_a': (6, ('house_code', 'receiver_code', 'switch_to'), 'B B B', '', None),
+        'switch_socket_b': (7, ('address', 'unit', 'switch_to'), 'I B B', '', None),
+        'dim_socket_b': (8, ('address', 'unit', 'dim_value'), 'I B B', '', None),
+        'switch_socket_c': (9, ('system_code', 'device_code', 'switch_to'), 'c B B', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletRGBLED': {
+        'set_rgb_value': (1, ('r', 'g', 'b'), 'B B B', '', None),
+        'get_rgb_value': (2, (), '', 'B B B', 'GetRGBValue'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletRotaryEncoder': {
+        'get_count': (1, ('reset',), '?', 'i', None),
+        'set_count_callback_period': (2, ('period',), 'I', '', None),
+        'get_count_callback_period': (3, (), '', 'I', None),
+        'set_count_callback_threshold': (4, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_count_callback_threshold': (5, (), '', 'c i i', 'GetCountCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'is_pressed': (10, (), '', '?', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletRotaryPoti': {
+        'get_position': (1, (), '', 'h', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_position_callback_period': (3, ('period',), 'I', '', None),
+        'get_position_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_position_callback_threshold': (7, ('option', 'min', 'max'), 'c h h', '', None),
+        'get_position_callback_threshold': (8, (), '', 'c h h', 'GetPositionCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletRS232': {
+        'write': (1, ('message', 'length'), '60c B', 'B', None),
+        'read': (2, (), '', '60c B', 'Read'),
+        'enable_read_callback': (3, (), '', '', None),
+        'disable_read_callback': (4, (), '', '', None),
+        'is_read_callback_enabled': (5, (), '', '?', None),
+        'set_configuration': (6, ('baudrate', 'parity', 'stopbits', 'wordlength', 'hardware_flowcontrol', 'software_flowcontrol'), 'B B B B B B', '', None),
+        'get_configuration': (7, (), '', 'B B B B B B', 'GetConfiguration'),
+        'set_break_condition': (10, ('break_time',), 'H', '', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletSegmentDisplay4x7': {
+        'set_segments': (1, ('segments', 'brightness', 'colon'), '4B B ?', '', None),
+        'get_segments': (2, (), '', '4B B ?', 'GetSegments'),
+        'start_counter': (3, ('value_from', 'value_to', 'increment', 'length'), 'h h h I', '', None),
+        'get_counter_value': (4, (), '', 'H', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletSolidStateRelay': {
+        'set_state': (1, ('state',), '?', '', None),
+        'get_state': (2, (), '', '?', None),
+        'set_monoflop': (3, ('state', 'time'), '? I', '', None),
+        'get_monoflop': (4, (), '', '? I I', 'GetMonoflop'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletSoundIntensity': {
+        'get_intensity': (1, (), '', 'H', None),
+        'set_intensity_callback_period': (2, ('period',), 'I', '', None),
+        'get_intensity_callback_period': (3, (), '', 'I', None),
+        'set_intensity_callback_threshold': (4, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_intensity_callback_threshold': (5, (), '', 'c H H', 'GetIntensityCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletTemperature': {
+        'get_temperature': (1, (), '', 'h', None),
+        'set_temperature_callback_period': (2, ('period',), 'I', '', None),
+        'get_temperature_callback_period': (3, (), '', 'I', None),
+        'set_temperature_callback_threshold': (4, ('option', 'min', 'max'), 'c h h', '', None),
+        'get_temperature_callback_threshold': (5, (), '', 'c h h', 'GetTemperatureCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'set_i2c_mode': (10, ('mode',), 'B', '', None),
+        'get_i2c_mode': (11, (), '', 'B', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletTemperatureIR': {
+        'get_ambient_temperature': (1, (), '', 'h', None),
+        'get_object_temperature': (2, (), '', 'h', None),
+        'set_emissivity': (3, ('emissivity',), 'H', '', None),
+        'get_emissivity': (4, (), '', 'H', None),
+        'set_ambient_temperature_callback_period': (5, ('period',), 'I', '', None),
+        'get_ambient_temperature_callback_period': (6, (), '', 'I', None),
+        'set_object_temperature_callback_period': (7, ('period',), 'I', '', None),
+        'get_object_temperature_callback_period': (8, (), '', 'I', None),
+        'set_ambient_temperature_callback_threshold': (9, ('option', 'min', 'max'), 'c h h', '', None),
+        'get_ambient_temperature_callback_threshold': (10, (), '', 'c h h', 'GetAmbientTemperatureCallbackThreshold'),
+        'set_object_temperature_callback_threshold': (11, ('option', 'min', 'max'), 'c h h', '', None),
+        'get_object_temperature_callback_threshold': (12, (), '', 'c h h', 'GetObjectTemperatureCallbackThreshold'),
+        'set_debounce_period': (13, ('debounce',), 'I', '', None),
+        'get_debounce_period': (14, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletThermocouple': {
+        'get_temperature': (1, (), '', 'i', None),
+        'set_temperature_callback_period': (2, ('period',), 'I', '', None),
+        'get_temperature_callback_period': (3, (), '', 'I', None),
+        'set_temperature_callback_threshold': (4, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_temperature_callback_threshold': (5, (), '', 'c i i', 'GetTemperatureCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'set_configuration': (10, ('averaging', 'thermocouple_type', 'filter'), 'B B B', '', None),
+        'get_configuration': (11, (), '', 'B B B', 'GetConfiguration'),
+        'get_error_state': (12, (), '', '? ?', 'GetErrorState'),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletTilt': {
+        'get_tilt_state': (1, (), '', 'B', None),
+        'enable_tilt_state_callback': (2, (), '', '', None),
+        'disable_tilt_state_callback': (3, (), '', '', None),
+        'is_tilt_state_callback_enabled': (4, (), '', '?', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletUVLight': {
+        'get_uv_light': (1, (), '', 'I', None),
+        'set_uv_light_callback_period': (2, ('period',), 'I', '', None),
+        'get_uv_light_callback_period': (3, (), '', 'I', None),
+        'set_uv_light_callback_threshold': (4, ('option', 'min', 'max'), 'c I I', '', None),
+        'get_uv_light_callback_threshold': (5, (), '', 'c I I', 'GetUVLightCallbackThreshold'),
+        'set_debounce_period': (6, ('debounce',), 'I', '', None),
+        'get_debounce_period': (7, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletVoltage': {
+        'get_voltage': (1, (), '', 'H', None),
+        'get_analog_value': (2, (), '', 'H', None),
+        'set_voltage_callback_period': (3, ('period',), 'I', '', None),
+        'get_voltage_callback_period': (4, (), '', 'I', None),
+        'set_analog_value_callback_period': (5, ('period',), 'I', '', None),
+        'get_analog_value_callback_period': (6, (), '', 'I', None),
+        'set_voltage_callback_threshold': (7, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_voltage_callback_threshold': (8, (), '', 'c H H', 'GetVoltageCallbackThreshold'),
+        'set_analog_value_callback_threshold': (9, ('option', 'min', 'max'), 'c H H', '', None),
+        'get_analog_value_callback_threshold': (10, (), '', 'c H H', 'GetAnalogValueCallbackThreshold'),
+        'set_debounce_period': (11, ('debounce',), 'I', '', None),
+        'get_debounce_period': (12, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+    'BrickletVoltageCurrent': {
+        'get_current': (1, (), '', 'i', None),
+        'get_voltage': (2, (), '', 'i', None),
+        'get_power': (3, (), '', 'i', None),
+        'set_configuration': (4, ('averaging', 'voltage_conversion_time', 'current_conversion_time'), 'B B B', '', None),
+        'get_configuration': (5, (), '', 'B B B', 'GetConfiguration'),
+        'set_calibration': (6, ('gain_multiplier', 'gain_divisor'), 'H H', '', None),
+        'get_calibration': (7, (), '', 'H H', 'GetCalibration'),
+        'set_current_callback_period': (8, ('period',), 'I', '', None),
+        'get_current_callback_period': (9, (), '', 'I', None),
+        'set_voltage_callback_period': (10, ('period',), 'I', '', None),
+        'get_voltage_callback_period': (11, (), '', 'I', None),
+        'set_power_callback_period': (12, ('period',), 'I', '', None),
+        'get_power_callback_period': (13, (), '', 'I', None),
+        'set_current_callback_threshold': (14, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_current_callback_threshold': (15, (), '', 'c i i', 'GetCurrentCallbackThreshold'),
+        'set_voltage_callback_threshold': (16, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_voltage_callback_threshold': (17, (), '', 'c i i', 'GetVoltageCallbackThreshold'),
+        'set_power_callback_threshold': (18, ('option', 'min', 'max'), 'c i i', '', None),
+        'get_power_callback_threshold': (19, (), '', 'c i i', 'GetPowerCallbackThreshold'),
+        'set_debounce_period': (20, ('debounce',), 'I', '', None),
+        'get_debounce_period': (21, (), '', 'I', None),
+        'get_identity': (255, (), '', '8s 8s c 3B 3B H', 'GetIdentity'),
+    },
+}
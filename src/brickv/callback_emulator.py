@@ -23,21 +23,216 @@ Boston, MA 02111-1307, USA.
 
 from PyQt4.QtCore import QObject, pyqtSignal
 import threading
+import heapq
+import time
+import logging
+import functools
+
+try:
+    from queue import Queue
+except:
+    from Queue import Queue # Python 2 fallback
+
+# use a monotonic clock where available, so that changes of the system time
+# don't cause bursts or stalls of emulated callbacks
+get_time = getattr(time, 'monotonic', time.time)
+
+class CallbackEmulatorScheduler(object):
+    WORKER_COUNT = 4
+    ERROR_RETRY_DELAY = 5.0 # seconds
+
+    def __init__(self):
+        self.condition = threading.Condition(threading.Lock())
+        self.heap = [] # (deadline, counter, emulator), protected by condition
+        self.counter = 0
+        self.thread = None
+        self.worker_queues = []
+        self.device_workers = {} # device key -> [worker index, number of scheduled emulators]
+        self.worker_device_counts = [0] * CallbackEmulatorScheduler.WORKER_COUNT
+
+        # statistics, protected by condition
+        self.updates = 0
+        self.missed_deadlines = 0
+        self.jitter_sum = 0.0
+        self.jitter_max = 0.0
+
+    def start_unlocked(self):
+        # NOTE: assumes that condition is locked
+        if self.thread is not None:
+            return
+
+        for i in range(CallbackEmulatorScheduler.WORKER_COUNT):
+            queue = Queue()
+            worker = threading.Thread(name='CallbackEmulator-Worker-{0}'.format(i),
+                                      target=self.worker_loop, args=(queue,))
+            worker.daemon = True
+            worker.start()
+
+            self.worker_queues.append(queue)
+
+        self.thread = threading.Thread(name='CallbackEmulator-Scheduler', target=self.loop)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def add(self, emulator, deadline):
+        # assigns a worker to the device of the emulator, a new device gets the
+        # worker with the fewest devices, so a device with a slow connection
+        # only delays the devices that share its worker
+        with self.condition:
+            entry = self.device_workers.get(emulator.device_key)
+
+            if entry is None:
+                worker = min(range(len(self.worker_device_counts)), key=self.worker_device_counts.__getitem__)
+                entry = [worker, 0]
+                self.device_workers[emulator.device_key] = entry
+                self.worker_device_counts[worker] += 1
+
+            entry[1] += 1
+            emulator.worker = entry[0]
+
+        self.schedule(emulator, deadline)
+
+    def remove(self, emulator):
+        # called for an emulator that is not scheduled anymore
+        with self.condition:
+            entry = self.device_workers[emulator.device_key]
+            entry[1] -= 1
+
+            if entry[1] == 0:
+                self.worker_device_counts[entry[0]] -= 1
+                del self.device_workers[emulator.device_key]
+
+    def schedule(self, emulator, deadline):
+        with self.condition:
+            self.start_unlocked()
+
+            self.counter += 1
+            heapq.heappush(self.heap, (deadline, self.counter, emulator))
+
+            if self.heap[0][2] is emulator:
+                # new earliest deadline, wake up the scheduler thread
+                self.condition.notify()
+
+    def get_stats(self):
+        """
+        Returns the number of updates done so far, the number of missed
+        deadlines and the average and maximum scheduling jitter in seconds.
+        """
+
+        with self.condition:
+            if self.updates > 0:
+                jitter_avg = self.jitter_sum / self.updates
+            else:
+                jitter_avg = 0.0
+
+            return {'updates': self.updates,
+                    'missed_deadlines': self.missed_deadlines,
+                    'jitter_avg': jitter_avg,
+                    'jitter_max': self.jitter_max}
+
+    def loop(self):
+        while True:
+            batches = {} # worker index -> [(deadline, emulator)]
+
+            with self.condition:
+                while len(self.heap) == 0 or self.heap[0][0] > get_time():
+                    if len(self.heap) == 0:
+                        self.condition.wait()
+                    else:
+                        self.condition.wait(self.heap[0][0] - get_time())
+
+                now = get_time()
+
+                # collect all due emulators and batch them per device
+                while len(self.heap) > 0 and self.heap[0][0] <= now:
+                    deadline, _, emulator = heapq.heappop(self.heap)
+                    batches.setdefault(emulator.worker, []).append((deadline, emulator))
+
+            # all getters of a device are done by the same worker, this keeps
+            # their order and a device with a slow connection only delays the
+            # devices that share its worker
+            for worker, batch in batches.items():
+                self.worker_queues[worker].put(batch)
+
+    def worker_loop(self, queue):
+        while True:
+            batch = queue.get()
+
+            for deadline, emulator in batch:
+                start = get_time()
+                jitter = max(start - deadline, 0)
+
+                try:
+                    delay = emulator.update()
+                except:
+                    logging.exception('Error while updating callback emulator')
+
+                    # an error in a callback must not stop the emulator,
+                    # continue with the current period or mark it as not
+                    # scheduled, so that a later set_period starts it again
+                    if emulator.period > 0:
+                        delay = emulator.period / 1000.0
+                    else:
+                        emulator.scheduled = False
+                        delay = None
+
+                now = get_time()
+
+                with self.condition:
+                    self.updates += 1
+                    self.jitter_sum += jitter
+                    self.jitter_max = max(self.jitter_max, jitter)
+
+                if delay is None:
+                    self.remove(emulator)
+                    continue
+
+                next_deadline = deadline + delay
+
+                if next_deadline < now:
+                    # don't try to catch up missed updates, continue from now
+                    with self.condition:
+                        self.missed_deadlines += 1
+
+                    next_deadline = now + delay
+
+                self.schedule(emulator, next_deadline)
+
+def get_device_key(data_getter):
+    # bound getter method or functools.partial of it
+    if isinstance(data_getter, functools.partial):
+        data_getter = data_getter.func
+
+    device = getattr(data_getter, '__self__', None)
+
+    if device is not None:
+        return id(device)
+
+    return id(data_getter)
 
 class CallbackEmulator(QObject):
     qtcb_data = pyqtSignal(object)
     qtcb_error = pyqtSignal()
 
-    def __init__(self, data_getter, data_callback, error_callback, use_data_signal=True):
+    scheduler = CallbackEmulatorScheduler()
+
+    # if a sample_queue (see plot_widget.SampleQueue) is given then every
+    # value is also put into it, timestamped with the completion time of the
+    # getter call, regardless if it changed or not
+    def __init__(self, data_getter, data_callback, error_callback, use_data_signal=True,
+                 sample_queue=None):
         QObject.__init__(self)
 
         self.period = 0 # milliseconds
-        self.timer = None
+        self.scheduled = False
         self.data_getter = data_getter
+        self.device_key = get_device_key(data_getter)
+        self.worker = None # assigned by the scheduler
         self.use_data_signal = use_data_signal
         self.data_callback = data_callback
         self.error_callback = error_callback
         self.last_data = None
+        self.sample_queue = sample_queue
 
         if self.use_data_signal:
             self.qtcb_data.connect(self.data_callback)
@@ -48,16 +243,16 @@ class CallbackEmulator(QObject):
     def set_period(self, period):
         self.period = period
 
-        if self.period > 0 and self.timer == None:
-            self.timer = threading.Timer(self.period / 1000.0, self.update)
-            self.timer.start()
+        if self.period > 0 and not self.scheduled:
+            self.scheduled = True
+            CallbackEmulator.scheduler.add(self, get_time() + self.period / 1000.0)
 
     def update(self):
-        self.timer = None
-
+        # returns the delay in seconds until the next update or None to stop
         if self.period < 1:
             # period was set to 0 in the meantime, ignore update
-            return
+            self.scheduled = False
+            return None
 
         try:
             data = self.data_getter()
@@ -67,10 +262,13 @@ class CallbackEmulator(QObject):
             # an error occurred, retry in 5 seconds if period was not set
             # to 0 in the meantime
             if self.period > 0:
-                self.timer = threading.Timer(5, self.update)
-                self.timer.start()
+                return CallbackEmulatorScheduler.ERROR_RETRY_DELAY
 
-            return
+            self.scheduled = False
+            return None
+
+        if self.sample_queue != None:
+            self.sample_queue.put(data, get_time())
 
         if self.last_data != data:
             self.last_data = data
@@ -81,5 +279,7 @@ class CallbackEmulator(QObject):
                 self.data_callback(data)
 
         if self.period > 0:
-            self.timer = threading.Timer(self.period / 1000.0, self.update)
-            self.timer.start()
+            return self.period / 1000.0
+
+        self.scheduled = False
+        return None
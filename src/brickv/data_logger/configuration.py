@@ -29,8 +29,8 @@ import json
 if 'merged_data_logger_modules' not in globals():
     from brickv.bindings.ip_connection import base58decode
     from brickv.data_logger.event_logger import EventLogger
-    from brickv.data_logger.utils import DataLoggerException, Utilities
-    from brickv.data_logger.loggable_devices import device_specs
+    from brickv.data_logger.utils import DataLoggerException, Utilities, CSVWriter, DataQueue
+    from brickv.data_logger.loggable_devices import device_specs, DeviceImpl
 else:
     from tinkerforge.ip_connection import base58decode
 
@@ -222,6 +222,8 @@ class ConfigValidator(object):
                 self._report_error('"data/time_format_strftime" is not a string')
 
         self._validate_data_csv()
+        self._validate_data_writer('binary', '.tfdl')
+        self._validate_data_writer('sqlite', '.sqlite')
 
     def _validate_data_csv(self):
         try:
@@ -250,6 +252,102 @@ class ConfigValidator(object):
             elif len(file_name) == 0:
                 self._report_error('"data/csv/file_name" is empty')
 
+        # compression (optional)
+        try:
+            compression = csv['compression']
+        except KeyError:
+            csv['compression'] = CSVWriter.COMPRESSION_NONE
+        else:
+            if not isinstance(compression, basestring):
+                self._report_error('"data/csv/compression" is not a string')
+            elif compression not in CSVWriter.COMPRESSIONS:
+                self._report_error('"data/csv/compression" is unknown: {0}'.format(compression))
+            elif not CSVWriter.is_compression_available(compression):
+                self._report_error('"data/csv/compression" is not available, the Python module for {0} is missing'
+                                   .format(compression))
+
+        self._validate_flush_policy('data/csv', csv)
+        self._validate_queue_policy('data/csv', csv)
+
+    def _validate_data_writer(self, name, default_extension):
+        # binary and sqlite (optional), disabled if missing
+        path = 'data/' + name
+
+        try:
+            section = self._config['data'][name]
+        except KeyError:
+            self._config['data'][name] = {'enabled': False, 'file_name': 'logger_data' + default_extension}
+            return
+
+        # enabled
+        try:
+            enabled = section['enabled']
+        except KeyError:
+            self._report_error('"{0}" section has no "enabled" member'.format(path))
+        else:
+            if not isinstance(enabled, bool):
+                self._report_error('"{0}/enabled" is not an bool'.format(path))
+
+        # file_name
+        try:
+            file_name = section['file_name']
+        except KeyError:
+            self._report_error('"{0}" section has no "file_name" member'.format(path))
+        else:
+            if not isinstance(file_name, basestring):
+                self._report_error('"{0}/file_name" is not an string'.format(path))
+            elif len(file_name) == 0:
+                self._report_error('"{0}/file_name" is empty'.format(path))
+
+        self._validate_flush_policy(path, section)
+        self._validate_queue_policy(path, section)
+
+    def _validate_flush_policy(self, path, section):
+        # flush_interval (optional)
+        try:
+            flush_interval = section['flush_interval']
+        except KeyError:
+            section['flush_interval'] = CSVWriter.DEFAULT_FLUSH_INTERVAL
+        else:
+            if not isinstance(flush_interval, int) and not isinstance(flush_interval, float):
+                self._report_error('"{0}/flush_interval" is not a number'.format(path))
+            elif flush_interval < 0:
+                self._report_error('"{0}/flush_interval" is negative'.format(path))
+
+        # flush_size (optional)
+        try:
+            flush_size = section['flush_size']
+        except KeyError:
+            section['flush_size'] = CSVWriter.DEFAULT_FLUSH_SIZE
+        else:
+            if not isinstance(flush_size, int):
+                self._report_error('"{0}/flush_size" is not an int'.format(path))
+            elif flush_size < 0:
+                self._report_error('"{0}/flush_size" is negative'.format(path))
+
+    def _validate_queue_policy(self, path, section):
+        # queue_size (optional)
+        try:
+            queue_size = section['queue_size']
+        except KeyError:
+            section['queue_size'] = DataQueue.DEFAULT_MAX_SIZE
+        else:
+            if not isinstance(queue_size, int):
+                self._report_error('"{0}/queue_size" is not an int'.format(path))
+            elif queue_size < 0:
+                self._report_error('"{0}/queue_size" is negative'.format(path))
+
+        # queue_policy (optional)
+        try:
+            queue_policy = section['queue_policy']
+        except KeyError:
+            section['queue_policy'] = DataQueue.DEFAULT_POLICY
+        else:
+            if not isinstance(queue_policy, basestring):
+                self._report_error('"{0}/queue_policy" is not a string'.format(path))
+            elif queue_policy not in DataQueue.POLICIES:
+                self._report_error('"{0}/queue_policy" is unknown: {1}'.format(path, queue_policy))
+
     def _validate_debug(self):
         try:
             debug = self._config['debug']
@@ -374,6 +472,17 @@ class ConfigValidator(object):
                 elif host not in self._config['hosts']:
                     self._report_error('Host of device "{0}" is unknown: {1}'.format(uid, host))
 
+            # acquisition (optional)
+            try:
+                acquisition = device['acquisition']
+            except KeyError:
+                device['acquisition'] = DeviceImpl.ACQUISITION_GETTER
+            else:
+                if not isinstance(acquisition, basestring):
+                    self._report_error('Acquisition of device "{0}" is not a string'.format(uid))
+                elif acquisition not in DeviceImpl.ACQUISITION_MODES:
+                    self._report_error('Acquisition of device "{0}" is unknown: {1}'.format(uid, acquisition))
+
             # values
             try:
                 values = device['values']
@@ -495,7 +604,8 @@ class ConfigValidator(object):
 class LogSpaceCounter(object):
     """
     This class provides functions to count the average lines per second
-    which will be written into the log file
+    which will be written into the log file. For compressed log files the
+    compression ratio seen so far is taken into account
     """
 
     def __init__(self, file_count, file_size):
@@ -507,10 +617,18 @@ class LogSpaceCounter(object):
         self.file_size = file_size
 
         self.lines_per_second = 0.0
+        self.compression_ratio = 1.0
 
     def add_lines_per_second(self, lines):
         self.lines_per_second += lines
 
+    def set_compression_ratio(self, compression_ratio):
+        """
+        compression_ratio -- uncompressed size / compressed size, see CSVWriter.get_compression_ratio()
+        """
+        if compression_ratio > 0:
+            self.compression_ratio = compression_ratio
+
     def calculate_time(self):
         """
         This function calculates the time where the logger can
@@ -521,7 +639,8 @@ class LogSpaceCounter(object):
         if self.lines_per_second <= 0 or self.file_size == 0:
             return 0, 0, 0, 0
 
-        max_available_space = (self.file_count + 1) * ((self.file_size / 1024.0) / 1024.0)
+        # file_size limits the compressed size, so more uncompressed data fits into the files
+        max_available_space = (self.file_count + 1) * ((self.file_size / 1024.0) / 1024.0) * self.compression_ratio
         seconds_for_one_MB = 18000.0 / self.lines_per_second
 
         sec = seconds_for_one_MB * max_available_space * 1.0
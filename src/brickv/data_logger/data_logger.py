@@ -31,73 +31,58 @@ import time
 if 'merged_data_logger_modules' not in globals():
     from brickv.bindings.ip_connection import IPConnection, base58decode
     from brickv.data_logger.event_logger import EventLogger
-    from brickv.data_logger.job import CSVWriterJob#, GuiDataJob
+    from brickv.data_logger.job import CSVWriterJob, BinaryWriterJob, SQLiteWriterJob#, GuiDataJob
     from brickv.data_logger.loggable_devices import DeviceImpl
-    from brickv.data_logger.utils import DataLoggerException
+    from brickv.data_logger.utils import DataLoggerException, CSVWriter, LoggerTimer, DataQueue
 else:
     from tinkerforge.ip_connection import IPConnection, base58decode
 
-class DataLogger(threading.Thread):
+class HostConnection(object):
     """
-    This class represents the data logger and an object of this class is
-    the actual instance of a logging process
+    A single IPConnection of the IPConnectionPool together with the
+    authentication secret used for its host
     """
 
-    # constructor and other functions
-    def __init__(self, config, gui_job):
-        super(DataLogger, self).__init__()
-
-        self.daemon = True
-
-        self.jobs = []  # thread hashmap for all running threads/jobs
-        self.job_exit_flag = False  # flag for stopping the thread
-        self.job_sleep = 1  # TODO: Enahncement -> use condition objects
-        self.timers = []
-        self._gui_job = gui_job
-        self.data_queue = {}  # universal data_queue hash map
-        self.host = config['hosts']['default']['name']
-        self.port = config['hosts']['default']['port']
-        self.secret = config['hosts']['default']['secret']
+    def __init__(self, pool, host, port, secret):
+        self.pool = pool
+        self.host = host
+        self.port = port
+        self.secret = secret
+        self.key = '{0}:{1}'.format(host, port)
 
         if self.secret != None:
             try:
                 self.secret = self.secret.encode('ascii')
             except:
-                EventLogger.critical('Authentication secret cannot contain non-ASCII characters')
+                EventLogger.critical('Authentication secret for {0} cannot contain non-ASCII characters'.format(self.key))
                 self.secret = None
 
-        self.loggable_devices = []
         self.ipcon = IPConnection()
 
         self.ipcon.register_callback(IPConnection.CALLBACK_CONNECTED, self.cb_connected)
         self.ipcon.register_callback(IPConnection.CALLBACK_ENUMERATE, self.cb_enumerate)
 
-        try:
-            self.ipcon.connect(self.host, self.port)  # Connect to brickd
-        except Exception as e:
-            EventLogger.critical("A critical error occur: " + str(e))
-            self.ipcon = None
-            raise DataLoggerException(DataLoggerException.DL_CRITICAL_ERROR, "A critical error occur: " + str(e))
+    def connect(self, timeout):
+        self.ipcon.connect(self.host, self.port)  # Connect to brickd
 
-        EventLogger.info("Connection to " + self.host + ":" + str(self.port) + " established.")
-        self.ipcon.set_timeout(1)  # TODO: Timeout number
-        EventLogger.debug("Set ipcon.time_out to 1.")
-        self._config = config
-        self.csv_file_name = 'logger_data_{0}.csv'.format(int(time.time()))
-        self.csv_enabled = True
-        self.stopped = False
+        EventLogger.info("Connection to " + self.key + " established.")
+        self.ipcon.set_timeout(timeout)
+        EventLogger.debug("Set ipcon.time_out of " + self.key + " to " + str(timeout) + ".")
+
+    def disconnect(self):
+        try:
+            self.ipcon.disconnect()
+        except:
+            pass
 
     def cb_connected(self, connect_reason):
         if self.secret != None:
             try:
                 secret = self.secret.encode('ascii')
             except:
-                try:
-                    self.ipcon.disconnect()
-                except:
-                    pass
+                self.disconnect()
 
-                EventLogger.critical('Authentication secret cannot contain non-ASCII characters')
+                EventLogger.critical('Authentication secret for {0} cannot contain non-ASCII characters'.format(self.key))
                 return
 
             self.ipcon.set_auto_reconnect(False) # don't auto-reconnect on authentication error
@@ -105,35 +90,144 @@ class DataLogger(threading.Thread):
             try:
                 self.ipcon.authenticate(secret)
             except:
-                try:
-                    self.ipcon.disconnect()
-                except:
-                    pass
+                self.disconnect()
 
                 if connect_reason == IPConnection.CONNECT_REASON_AUTO_RECONNECT:
                     extra = ' after auto-reconnect'
                 else:
                     extra = ''
 
-                EventLogger.critical('Could not authenticate' + extra)
+                EventLogger.critical('Could not authenticate with ' + self.key + extra)
                 return
 
             self.ipcon.set_auto_reconnect(True)
 
-            EventLogger.info("Successfully authenticated")
+            EventLogger.info("Successfully authenticated with " + self.key)
 
-        self.apply_options()
+        self.pool.options_callback(self.ipcon)
 
     def cb_enumerate(self, uid, connected_uid, position,
                      hardware_version, firmware_version,
                      device_identifier, enumeration_type):
         if enumeration_type in [IPConnection.ENUMERATION_TYPE_AVAILABLE,
                                 IPConnection.ENUMERATION_TYPE_CONNECTED]:
-            self.apply_options()
+            self.pool.options_callback(self.ipcon)
+
+class IPConnectionPool(object):
+    """
+    Owns one IPConnection per host:port pair of the hosts section of the
+    config. Host IDs that refer to the same host:port pair share the same
+    IPConnection. Auto-reconnect and authentication are handled per
+    connection, options_callback is called with the affected IPConnection
+    after each (re-)connect and enumeration.
+    """
+
+    def __init__(self, hosts, options_callback):
+        self.hosts = hosts
+        self.options_callback = options_callback
+        self.connections = {} # host:port -> HostConnection
+
+    def get_connection(self, host_id):
+        host = self.hosts[host_id]
+        key = '{0}:{1}'.format(host['name'], host['port'])
+
+        if key not in self.connections:
+            self.connections[key] = HostConnection(self, host['name'], host['port'], host['secret'])
+
+        return self.connections[key]
+
+    def connect(self, host_id, timeout):
+        connection = self.get_connection(host_id)
+
+        if connection.ipcon.get_connection_state() == IPConnection.CONNECTION_STATE_DISCONNECTED:
+            connection.connect(timeout)
+
+        return connection.ipcon
 
-    def apply_options(self):
+    def get_ipcon(self, host_id):
+        return self.get_connection(host_id).ipcon
+
+    def disconnect_all(self):
+        for connection in self.connections.values():
+            connection.disconnect()
+
+class DataLogger(threading.Thread):
+    """
+    This class represents the data logger and an object of this class is
+    the actual instance of a logging process
+    """
+
+    # constructor and other functions
+    def __init__(self, config, gui_job):
+        super(DataLogger, self).__init__()
+
+        self.daemon = True
+
+        self.jobs = []  # thread hashmap for all running threads/jobs
+        self.job_exit_flag = False  # flag for stopping the thread
+        self.timers = []
+        self._gui_job = gui_job
+        self.data_queue = {}  # universal data_queue hash map
+        self.host = config['hosts']['default']['name']
+        self.port = config['hosts']['default']['port']
+
+        self.loggable_devices = []
+        self.connection_pool = IPConnectionPool(config['hosts'], self.apply_options)
+        self.ipcon = None
+
+        # connect to the default host and to every host that has devices
+        host_ids = ['default']
+
+        for device in config['devices']:
+            if device['host'] not in host_ids:
+                host_ids.append(device['host'])
+
+        try:
+            for host_id in host_ids:
+                self.connection_pool.connect(host_id, 1)  # TODO: Timeout number
+        except Exception as e:
+            EventLogger.critical("A critical error occur: " + str(e))
+            self.connection_pool.disconnect_all()
+            raise DataLoggerException(DataLoggerException.DL_CRITICAL_ERROR, "A critical error occur: " + str(e))
+
+        self.ipcon = self.connection_pool.get_ipcon('default')
+        self._config = config
+        self.csv_file_name = 'logger_data_{0}.csv'.format(int(time.time()))
+        self.csv_enabled = True
+        self.csv_flush_interval = CSVWriter.DEFAULT_FLUSH_INTERVAL
+        self.csv_flush_size = CSVWriter.DEFAULT_FLUSH_SIZE
+        self.csv_queue_size = DataQueue.DEFAULT_MAX_SIZE
+        self.csv_queue_policy = DataQueue.DEFAULT_POLICY
+        self.csv_compression = CSVWriter.COMPRESSION_NONE
+        self.binary_file_name = 'logger_data_{0}.tfdl'.format(int(time.time()))
+        self.binary_enabled = False
+        self.binary_flush_interval = CSVWriter.DEFAULT_FLUSH_INTERVAL
+        self.binary_flush_size = CSVWriter.DEFAULT_FLUSH_SIZE
+        self.binary_queue_size = DataQueue.DEFAULT_MAX_SIZE
+        self.binary_queue_policy = DataQueue.DEFAULT_POLICY
+        self.sqlite_file_name = 'logger_data_{0}.sqlite'.format(int(time.time()))
+        self.sqlite_enabled = False
+        self.sqlite_flush_interval = CSVWriter.DEFAULT_FLUSH_INTERVAL
+        self.sqlite_flush_size = CSVWriter.DEFAULT_FLUSH_SIZE
+        self.sqlite_queue_size = DataQueue.DEFAULT_MAX_SIZE
+        self.sqlite_queue_policy = DataQueue.DEFAULT_POLICY
+        self.stopped = False
+
+    def get_ipcon(self, host_id):
+        """
+        Returns the IPConnection for the host with the ID *host_id* in the
+        hosts section of the config
+        """
+        return self.connection_pool.get_ipcon(host_id)
+
+    def apply_options(self, ipcon=None):
+        """
+        Applies the options of all devices or of the devices that are
+        connected through *ipcon*
+        """
         for loggable_device in self.loggable_devices:
-            loggable_device.apply_options()
+            if ipcon is None or loggable_device.device.ipcon is ipcon:
+                loggable_device.apply_options()
 
     def process_data_csv_section(self):
         """
@@ -143,10 +237,53 @@ class DataLogger(threading.Thread):
 
         self.csv_enabled = csv['enabled']
         self.csv_file_name = csv['file_name']
+        self.csv_flush_interval = csv.get('flush_interval', CSVWriter.DEFAULT_FLUSH_INTERVAL)
+        self.csv_flush_size = csv.get('flush_size', CSVWriter.DEFAULT_FLUSH_SIZE)
+        self.csv_queue_size = csv.get('queue_size', DataQueue.DEFAULT_MAX_SIZE)
+        self.csv_queue_policy = csv.get('queue_policy', DataQueue.DEFAULT_POLICY)
+        self.csv_compression = csv.get('compression', CSVWriter.COMPRESSION_NONE)
 
         if self.csv_enabled:
             EventLogger.info("Logging data to CSV file: " + str(self.csv_file_name))
 
+    def process_data_binary_section(self):
+        """
+        Information out of the optional data/binary section will be consumed here
+        """
+        binary = self._config['data'].get('binary')
+
+        if binary is None:
+            return
+
+        self.binary_enabled = binary['enabled']
+        self.binary_file_name = binary['file_name']
+        self.binary_flush_interval = binary.get('flush_interval', CSVWriter.DEFAULT_FLUSH_INTERVAL)
+        self.binary_flush_size = binary.get('flush_size', CSVWriter.DEFAULT_FLUSH_SIZE)
+        self.binary_queue_size = binary.get('queue_size', DataQueue.DEFAULT_MAX_SIZE)
+        self.binary_queue_policy = binary.get('queue_policy', DataQueue.DEFAULT_POLICY)
+
+        if self.binary_enabled:
+            EventLogger.info("Logging data to binary file: " + str(self.binary_file_name))
+
+    def process_data_sqlite_section(self):
+        """
+        Information out of the optional data/sqlite section will be consumed here
+        """
+        sqlite = self._config['data'].get('sqlite')
+
+        if sqlite is None:
+            return
+
+        self.sqlite_enabled = sqlite['enabled']
+        self.sqlite_file_name = sqlite['file_name']
+        self.sqlite_flush_interval = sqlite.get('flush_interval', CSVWriter.DEFAULT_FLUSH_INTERVAL)
+        self.sqlite_flush_size = sqlite.get('flush_size', CSVWriter.DEFAULT_FLUSH_SIZE)
+        self.sqlite_queue_size = sqlite.get('queue_size', DataQueue.DEFAULT_MAX_SIZE)
+        self.sqlite_queue_policy = sqlite.get('queue_policy', DataQueue.DEFAULT_POLICY)
+
+        if self.sqlite_enabled:
+            EventLogger.info("Logging data to SQLite database: " + str(self.sqlite_file_name))
+
     def initialize_loggable_devices(self):
         """
         This function creates the actual objects for each device out of the configuration
@@ -185,6 +322,8 @@ class DataLogger(threading.Thread):
         """
         self.stopped = False
         self.process_data_csv_section()
+        self.process_data_binary_section()
+        self.process_data_sqlite_section()
 
         self.initialize_loggable_devices()
 
@@ -193,6 +332,10 @@ class DataLogger(threading.Thread):
         # look which thread should be working
         if self.csv_enabled:
             self.jobs.append(CSVWriterJob(name="CSV-Writer", datalogger=self))
+        if self.binary_enabled:
+            self.jobs.append(BinaryWriterJob(name="Binary-Writer", datalogger=self))
+        if self.sqlite_enabled:
+            self.jobs.append(SQLiteWriterJob(name="SQLite-Writer", datalogger=self))
         if self._gui_job is not None:
             self._gui_job.set_datalogger(self)
             self.jobs.append(self._gui_job)
@@ -206,6 +349,12 @@ class DataLogger(threading.Thread):
             t.start()
         EventLogger.debug("Get-Timers started.")
 
+        # the period callbacks push values into the data queues, so they are
+        # enabled after the jobs created their queues
+        for loggable_device in self.loggable_devices:
+            loggable_device.start_callbacks()
+        EventLogger.debug("Period callbacks started.")
+
         """END_CONDITIONS"""
         EventLogger.info("DataLogger is running...")
         # TODO Exit condition ?
@@ -224,6 +373,10 @@ class DataLogger(threading.Thread):
         for t in self.timers:
             t.join()
         EventLogger.debug("Get-Timers[" + str(len(self.timers)) + "] stopped.")
+        LoggerTimer.scheduler.log_stats()
+
+        for loggable_device in self.loggable_devices:
+            loggable_device.stop_callbacks()
 
         # set THREAD_EXIT_FLAG for all work threads
         for job in self.jobs:
@@ -233,15 +386,24 @@ class DataLogger(threading.Thread):
             job.join()
         EventLogger.debug("Jobs[" + str(len(self.jobs)) + "] stopped.")
 
-        try:
-            self.ipcon.disconnect()
-        except:
-            pass
+        self.connection_pool.disconnect_all()
 
-        EventLogger.info("Connection closed successfully.")
+        EventLogger.info("Connections closed successfully.")
 
         self.stopped = True
 
+    def get_queue_stats(self):
+        """
+        Returns a list of (job name, enqueued, written, dropped) tuples for the
+        queues of all running jobs
+        """
+        stats = []
+
+        for name, queue in sorted(self.data_queue.items()):
+            stats.append((name,) + queue.get_stats())
+
+        return stats
+
     def add_to_queue(self, csv):
         """
         Adds logged data to all queues which are registered in 'self.data_queue'
@@ -36,9 +36,11 @@ import time
 
 if 'merged_data_logger_modules' not in globals():
     from brickv.data_logger.event_logger import EventLogger
-    from brickv.data_logger.utils import CSVWriter
+    from brickv.data_logger.utils import CSVWriter, BinaryWriter, SQLiteWriter, DataQueue
 
 class AbstractJob(threading.Thread):
+    STATS_INTERVAL = 60 # seconds between two log messages about the queue counters
+
     def __init__(self, datalogger=None, group=None, target=None, name=None, args=(), kwargs=None, verbose=None):
         threading.Thread.__init__(self, group=group, target=target, name=name, args=args, kwargs=kwargs,
                                   verbose=verbose)
@@ -47,13 +49,21 @@ class AbstractJob(threading.Thread):
         self._exit_flag = False
         self._datalogger = datalogger
         self._job_name = "[Job:" + self.name + "]"
+        self._next_stats_time = time.time() + AbstractJob.STATS_INTERVAL
 
         if self._datalogger is not None:
-            self._datalogger.data_queue[self.name] = Queue.Queue()
+            self._datalogger.data_queue[self.name] = self._create_data_queue()
 
     def stop(self):
         self._exit_flag = True
 
+        # wake up the job if it is blocked in _get_all_from_queue
+        if self._datalogger is not None and self.name in self._datalogger.data_queue:
+            self._datalogger.data_queue[self.name].wake_up()
+
+    def _create_data_queue(self):
+        return DataQueue(self.name)
+
     def _job(self):
         # check for datalogger object
         if self._datalogger is None:
@@ -66,20 +76,49 @@ class AbstractJob(threading.Thread):
             return self._datalogger.data_queue[self.name].get()
         return None
 
+    def _get_all_from_queue(self, timeout=None):
+        """
+        Blocks until data is available, the job is stopped or the timeout (in seconds) expired.
+        Returns a list of all data that is in the queue, which might be empty.
+        """
+        queue = self._datalogger.data_queue[self.name]
+        items = []
+
+        try:
+            items.append(queue.get(True, timeout))
+
+            while True:
+                items.append(queue.get_nowait())
+        except Queue.Empty:
+            pass
+
+        # the queue returns None after stop() woke up the job
+        return [item for item in items if item is not None]
+
+    def _mark_written(self, count):
+        queue = self._datalogger.data_queue[self.name]
+        queue.mark_written(count)
+
+        now = time.time()
+
+        if now >= self._next_stats_time:
+            self._next_stats_time = now + AbstractJob.STATS_INTERVAL
+            queue.log_stats()
+
     # Needs to be called when you end the job!
     def _remove_from_data_queue(self):
         try:
-            self._datalogger.data_queue.pop(self.name)
+            self._datalogger.data_queue.pop(self.name).log_stats()
         except KeyError as key_err:
             EventLogger.warning("Job:" + self.name + " was not in the DataQueue! -> " + str(key_err))
 
 
-class CSVWriterJob(AbstractJob):
+class AbstractWriterJob(AbstractJob):
     """
-    This class enables the data logger to write logged data to an CSV formatted file
+    Inheritance only class, writes the logged data with the writer returned by _create_writer()
     """
 
-    def __init__(self, datalogger=None, group=None, name="CSVWriterJob", args=(), kwargs=None, verbose=None):
+    def __init__(self, datalogger=None, group=None, name="AbstractWriterJob", args=(), kwargs=None, verbose=None):
         target = self._job
         AbstractJob.__init__(self, datalogger=datalogger, group=group, target=target, name=name, args=args,
                              kwargs=kwargs, verbose=verbose)
@@ -91,25 +130,27 @@ class CSVWriterJob(AbstractJob):
                 return
 
             EventLogger.debug(self._job_name + " Started")
-            csv_writer = CSVWriter(self._datalogger.csv_file_name)
+            writer = self._create_writer()
 
             while True:
-                if not self._datalogger.data_queue[self.name].empty():
-                    csv_data = self._get_data_from_queue()
-                    #EventLogger.debug(self._job_name + " -> " + str(csv_data))
-                    if not csv_writer.write_data_row(csv_data):
-                        EventLogger.warning(self._job_name + " Could not write csv row!")
+                # block until data arrives or the buffered rows have to be flushed
+                data_list = self._get_all_from_queue(writer.get_flush_timeout())
 
-                if not self._exit_flag and self._datalogger.data_queue[self.name].empty():
-                    time.sleep(self._datalogger.job_sleep)
+                if len(data_list) > 0:
+                    if not writer.write_data_rows(data_list):
+                        EventLogger.warning(self._job_name + " Could not write rows!")
+                    else:
+                        self._mark_written(len(data_list))
+                else:
+                    writer.flush_if_due()
 
                 if self._exit_flag and self._datalogger.data_queue[self.name].empty():
-                    exit_return_value = csv_writer.close_file()
+                    exit_return_value = writer.close_file()
                     if exit_return_value:
-                        EventLogger.debug(self._job_name + " Closed his csv_writer")
+                        EventLogger.debug(self._job_name + " Closed its writer")
                     else:
                         EventLogger.debug(
-                            self._job_name + " Could NOT close his csv_writer! EXIT_RETURN_VALUE=" + str(exit))
+                            self._job_name + " Could NOT close its writer! EXIT_RETURN_VALUE=" + str(exit_return_value))
                     EventLogger.debug(self._job_name + " Finished")
 
                     self._remove_from_data_queue()
@@ -118,6 +159,76 @@ class CSVWriterJob(AbstractJob):
         except Exception as e:
             EventLogger.critical(self._job_name + " " + str(e))
             self.stop()
+            # don't let the DataLogger block on the queue of a dead job
+            self._remove_from_data_queue()
+
+    def _create_writer(self):
+        raise NotImplementedError()
+
+
+class CSVWriterJob(AbstractWriterJob):
+    """
+    This class enables the data logger to write logged data to an CSV formatted file
+    """
+
+    def __init__(self, datalogger=None, group=None, name="CSVWriterJob", args=(), kwargs=None, verbose=None):
+        AbstractWriterJob.__init__(self, datalogger=datalogger, group=group, name=name, args=args,
+                                   kwargs=kwargs, verbose=verbose)
+
+    def _create_data_queue(self):
+        return DataQueue(self.name,
+                         max_size=self._datalogger.csv_queue_size,
+                         policy=self._datalogger.csv_queue_policy)
+
+    def _create_writer(self):
+        return CSVWriter(self._datalogger.csv_file_name,
+                         flush_interval=self._datalogger.csv_flush_interval,
+                         flush_size=self._datalogger.csv_flush_size,
+                         compression=self._datalogger.csv_compression)
+
+
+class BinaryWriterJob(AbstractWriterJob):
+    """
+    This class enables the data logger to write logged data to a file in the compact binary format of the BinaryWriter
+    """
+
+    def __init__(self, datalogger=None, group=None, name="BinaryWriterJob", args=(), kwargs=None, verbose=None):
+        AbstractWriterJob.__init__(self, datalogger=datalogger, group=group, name=name, args=args,
+                                   kwargs=kwargs, verbose=verbose)
+
+    def _create_data_queue(self):
+        return DataQueue(self.name,
+                         max_size=self._datalogger.binary_queue_size,
+                         policy=self._datalogger.binary_queue_policy)
+
+    def _create_writer(self):
+        config = self._datalogger._config['data']
+
+        return BinaryWriter(self._datalogger.binary_file_name,
+                            time_format=config['time_format'],
+                            time_format_strftime=config['time_format_strftime'],
+                            flush_interval=self._datalogger.binary_flush_interval,
+                            flush_size=self._datalogger.binary_flush_size)
+
+
+class SQLiteWriterJob(AbstractWriterJob):
+    """
+    This class enables the data logger to write logged data into a SQLite database using the SQLiteWriter
+    """
+
+    def __init__(self, datalogger=None, group=None, name="SQLiteWriterJob", args=(), kwargs=None, verbose=None):
+        AbstractWriterJob.__init__(self, datalogger=datalogger, group=group, name=name, args=args,
+                                   kwargs=kwargs, verbose=verbose)
+
+    def _create_data_queue(self):
+        return DataQueue(self.name,
+                         max_size=self._datalogger.sqlite_queue_size,
+                         policy=self._datalogger.sqlite_queue_policy)
+
+    def _create_writer(self):
+        return SQLiteWriter(self._datalogger.sqlite_file_name,
+                            flush_interval=self._datalogger.sqlite_flush_interval,
+                            flush_size=self._datalogger.sqlite_flush_size)
 
 
 class GuiDataJob(AbstractJob, QtCore.QObject):
@@ -127,6 +238,15 @@ class GuiDataJob(AbstractJob, QtCore.QObject):
 
     SIGNAL_NEW_DATA = "signalNewData"
 
+    # the collected data is emitted as one list at most every BATCH_INTERVAL
+    # seconds, so the GUI thread doesn't have to handle each CSVData separately
+    BATCH_INTERVAL = 0.1
+
+    # the table only shows the latest rows, so there is no point in keeping more
+    # than that if the GUI thread falls behind
+    QUEUE_SIZE = 10000
+    QUEUE_POLICY = DataQueue.POLICY_DROP_OLDEST
+
     def __init__(self, datalogger=None, group=None, name="GuiDataJob", args=(), kwargs=None, verbose=None):
         target = self._job
         AbstractJob.__init__(self, datalogger=datalogger, group=group, target=target, name=name, args=args,
@@ -135,7 +255,10 @@ class GuiDataJob(AbstractJob, QtCore.QObject):
 
     def set_datalogger(self, datalogger):
         self._datalogger = datalogger
-        self._datalogger.data_queue[self.name] = Queue.Queue()
+        self._datalogger.data_queue[self.name] = self._create_data_queue()
+
+    def _create_data_queue(self):
+        return DataQueue(self.name, max_size=GuiDataJob.QUEUE_SIZE, policy=GuiDataJob.QUEUE_POLICY)
 
     def _job(self):
         try:
@@ -145,22 +268,37 @@ class GuiDataJob(AbstractJob, QtCore.QObject):
 
             EventLogger.debug(self._job_name + " Started")
 
+            batch = []
+            next_emit = None
+
             while True:
-                if not self._datalogger.data_queue[self.name].empty():
-                    csv_data = self._get_data_from_queue()
-                    #EventLogger.debug(self._job_name + " -> " + str(csv_data))
-                    self.emit(QtCore.SIGNAL(GuiDataJob.SIGNAL_NEW_DATA), csv_data)
+                if next_emit is None:
+                    timeout = None
+                else:
+                    timeout = max(0, next_emit - time.time())
 
-                if not self._exit_flag and self._datalogger.data_queue[self.name].empty():
-                    time.sleep(self._datalogger.job_sleep)
+                batch += self._get_all_from_queue(timeout)
+                now = time.time()
 
-                if self._exit_flag and self._datalogger.data_queue[self.name].empty():
+                if len(batch) > 0 and next_emit is None:
+                    next_emit = now + GuiDataJob.BATCH_INTERVAL
+
+                exiting = self._exit_flag and self._datalogger.data_queue[self.name].empty()
+
+                if len(batch) > 0 and (now >= next_emit or exiting):
+                    self.emit(QtCore.SIGNAL(GuiDataJob.SIGNAL_NEW_DATA), batch)
+                    self._mark_written(len(batch))
+                    batch = []
+                    next_emit = None
+
+                if exiting:
                     self._remove_from_data_queue()
                     break
 
         except Exception as e:
             EventLogger.critical(self._job_name + " -.- " + str(e))
             self.stop()
+            self._remove_from_data_queue()
 
 
 class XivelyJob(AbstractJob):
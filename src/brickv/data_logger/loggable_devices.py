@@ -25,6 +25,8 @@ Boston, MA 02111-1307, USA.
 #### skip here for brick-logger ####
 
 import time
+import functools
+from collections import namedtuple
 
 if 'merged_data_logger_modules' not in globals():
     from brickv.bindings.bricklet_accelerometer import BrickletAccelerometer
@@ -92,12 +94,7 @@ if 'merged_data_logger_modules' not in globals():
     from brickv.bindings.brick_stepper import BrickStepper
 
     from brickv.data_logger.event_logger import EventLogger
-    from brickv.data_logger.utils import LoggerTimer, CSVData, \
-                                         timestamp_to_de, timestamp_to_us, \
-                                         timestamp_to_iso, timestamp_to_unix, \
-                                         timestamp_to_de_msec, timestamp_to_us_msec, \
-                                         timestamp_to_iso_msec, timestamp_to_unix_msec, \
-                                         timestamp_to_strftime
+    from brickv.data_logger.utils import LoggerTimer, CSVData, get_timestamp_formatter
 else:
     from tinkerforge.bricklet_accelerometer import BrickletAccelerometer
     from tinkerforge.bricklet_ambient_light import BrickletAmbientLight
@@ -277,6 +274,9 @@ def special_get_ptc_temperature(device):
     else:
         return device.get_temperature()
 
+# values can optionally declare a 'callback' and a 'callback_period_setter'
+# that are used instead of the 'getter' in callback acquisition mode. the
+# callback has to report the same values as the getter returns
 device_specs = {
     BrickletAccelerometer.DEVICE_DISPLAY_NAME: {
         'class': BrickletAccelerometer,
@@ -284,6 +284,8 @@ device_specs = {
             {
                 'name': 'Acceleration',
                 'getter': lambda device: device.get_acceleration(),
+                'callback': BrickletAccelerometer.CALLBACK_ACCELERATION,
+                'callback_period_setter': lambda device, period: device.set_acceleration_callback_period(period),
                 'subvalues': ['X', 'Y', 'Z'],
                 'unit': ['g/1000', 'g/1000', 'g/1000'],
                 'advanced': False
@@ -340,6 +342,8 @@ device_specs = {
             {
                 'name': 'Illuminance',
                 'getter': lambda device: device.get_illuminance(),
+                'callback': BrickletAmbientLight.CALLBACK_ILLUMINANCE,
+                'callback_period_setter': lambda device, period: device.set_illuminance_callback_period(period),
                 'subvalues': None,
                 'unit': 'lx/10',
                 'advanced': False
@@ -347,6 +351,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletAmbientLight.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -361,6 +367,8 @@ device_specs = {
             {
                 'name': 'Illuminance',
                 'getter': lambda device: device.get_illuminance(),
+                'callback': BrickletAmbientLightV2.CALLBACK_ILLUMINANCE,
+                'callback_period_setter': lambda device, period: device.set_illuminance_callback_period(period),
                 'subvalues': None,
                 'unit': 'lx/100',
                 'advanced': False
@@ -401,6 +409,8 @@ device_specs = {
             {
                 'name': 'Voltage',
                 'getter': lambda device: device.get_voltage(),
+                'callback': BrickletAnalogIn.CALLBACK_VOLTAGE,
+                'callback_period_setter': lambda device, period: device.set_voltage_callback_period(period),
                 'subvalues': None,
                 'unit': 'mV',
                 'advanced': False
@@ -408,6 +418,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletAnalogIn.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -442,6 +454,8 @@ device_specs = {
             {
                 'name': 'Voltage',
                 'getter': lambda device: device.get_voltage(),
+                'callback': BrickletAnalogInV2.CALLBACK_VOLTAGE,
+                'callback_period_setter': lambda device, period: device.set_voltage_callback_period(period),
                 'subvalues': None,
                 'unit': 'mV',
                 'advanced': False
@@ -449,6 +463,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletAnalogInV2.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -486,6 +502,8 @@ device_specs = {
             {
                 'name': 'Air Pressure',
                 'getter': lambda device: device.get_air_pressure(),
+                'callback': BrickletBarometer.CALLBACK_AIR_PRESSURE,
+                'callback_period_setter': lambda device, period: device.set_air_pressure_callback_period(period),
                 'subvalues': None,
                 'unit': 'mbar/1000',
                 'advanced': False
@@ -493,6 +511,8 @@ device_specs = {
             {
                 'name': 'Altitude',
                 'getter': lambda device: device.get_altitude(),
+                'callback': BrickletBarometer.CALLBACK_ALTITUDE,
+                'callback_period_setter': lambda device, period: device.set_altitude_callback_period(period),
                 'subvalues': None,
                 'unit': 'cm',
                 'advanced': False
@@ -552,6 +572,8 @@ device_specs = {
             {
                 'name': 'CO2 Concentration',
                 'getter': lambda device: device.get_co2_concentration(),
+                'callback': BrickletCO2.CALLBACK_CO2_CONCENTRATION,
+                'callback_period_setter': lambda device, period: device.set_co2_concentration_callback_period(period),
                 'subvalues': None,
                 'unit': 'ppm',
                 'advanced': False
@@ -566,6 +588,8 @@ device_specs = {
             {
                 'name': 'Color',
                 'getter': lambda device: device.get_color(),
+                'callback': BrickletColor.CALLBACK_COLOR,
+                'callback_period_setter': lambda device, period: device.set_color_callback_period(period),
                 'subvalues': ['Red', 'Green', 'Blue', 'Clear'],
                 'unit': [None, None, None, None],
                 'advanced': False
@@ -573,6 +597,8 @@ device_specs = {
             {
                 'name': 'Color Temperature',
                 'getter': lambda device: device.get_color_temperature(), # FIXME: saturation handling is missing
+                'callback': BrickletColor.CALLBACK_COLOR_TEMPERATURE,
+                'callback_period_setter': lambda device, period: device.set_color_temperature_callback_period(period),
                 'subvalues': None,
                 'unit': 'K',
                 'advanced': False
@@ -614,6 +640,8 @@ device_specs = {
             {
                 'name': 'Current',
                 'getter': lambda device: device.get_current(),
+                'callback': BrickletCurrent12.CALLBACK_CURRENT,
+                'callback_period_setter': lambda device, period: device.set_current_callback_period(period),
                 'subvalues': None,
                 'unit': 'mA',
                 'advanced': False
@@ -621,6 +649,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletCurrent12.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -635,6 +665,8 @@ device_specs = {
             {
                 'name': 'Current',
                 'getter': lambda device: device.get_current(),
+                'callback': BrickletCurrent25.CALLBACK_CURRENT,
+                'callback_period_setter': lambda device, period: device.set_current_callback_period(period),
                 'subvalues': None,
                 'unit': 'mA',
                 'advanced': False
@@ -642,6 +674,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletCurrent25.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -656,6 +690,8 @@ device_specs = {
             {
                 'name': 'Distance',
                 'getter': lambda device: device.get_distance(),
+                'callback': BrickletDistanceIR.CALLBACK_DISTANCE,
+                'callback_period_setter': lambda device, period: device.set_distance_callback_period(period),
                 'subvalues': None,
                 'unit': 'mm',
                 'advanced': False
@@ -663,6 +699,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletDistanceIR.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -721,6 +759,8 @@ device_specs = {
             {
                 'name': 'Dust Density',
                 'getter': lambda device: device.get_dust_density(),
+                'callback': BrickletDustDetector.CALLBACK_DUST_DENSITY,
+                'callback_period_setter': lambda device, period: device.set_dust_density_callback_period(period),
                 'subvalues': None,
                 'unit': 'µg/m³',
                 'advanced': False
@@ -765,6 +805,8 @@ device_specs = {
             {
                 'name': 'Date Time',
                 'getter': lambda device: device.get_date_time(),
+                'callback': BrickletGPS.CALLBACK_DATE_TIME,
+                'callback_period_setter': lambda device, period: device.set_date_time_callback_period(period),
                 'subvalues': ['Date', 'Time'],
                 'unit': ['ddmmyy', 'hhmmss|sss'],
                 'advanced': False
@@ -772,6 +814,8 @@ device_specs = {
             {
                 'name': 'Status',
                 'getter': lambda device: device.get_status(),
+                'callback': BrickletGPS.CALLBACK_STATUS,
+                'callback_period_setter': lambda device, period: device.set_status_callback_period(period),
                 'subvalues': ['Fix', 'Satellites View', 'Satellites Used'],
                 'unit': [None, None, None], # FIXME: fix constants?
                 'advanced': False
@@ -824,6 +868,8 @@ device_specs = {
             {
                 'name': 'Humidity',
                 'getter': lambda device: device.get_humidity(),
+                'callback': BrickletHumidity.CALLBACK_HUMIDITY,
+                'callback_period_setter': lambda device, period: device.set_humidity_callback_period(period),
                 'subvalues': None,
                 'unit': '%RH/10',
                 'advanced': False
@@ -831,6 +877,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletHumidity.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -1420,6 +1468,8 @@ device_specs = {
             {
                 'name': 'Position',
                 'getter': lambda device: device.get_position(),
+                'callback': BrickletJoystick.CALLBACK_POSITION,
+                'callback_period_setter': lambda device, period: device.set_position_callback_period(period),
                 'subvalues': ['X', 'Y'],
                 'unit': [None, None],
                 'advanced': False
@@ -1434,6 +1484,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletJoystick.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': ['X', 'Y'],
                 'unit': [None, None],
                 'advanced': True
@@ -1462,6 +1514,8 @@ device_specs = {
             {
                 'name': 'Reflectivity',
                 'getter': lambda device: device.get_reflectivity(),
+                'callback': BrickletLine.CALLBACK_REFLECTIVITY,
+                'callback_period_setter': lambda device, period: device.set_reflectivity_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': False
@@ -1476,6 +1530,8 @@ device_specs = {
             {
                 'name': 'Position',
                 'getter': lambda device: device.get_position(),
+                'callback': BrickletLinearPoti.CALLBACK_POSITION,
+                'callback_period_setter': lambda device, period: device.set_position_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': False
@@ -1483,6 +1539,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletLinearPoti.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -1497,6 +1555,8 @@ device_specs = {
             {
                 'name': 'Weight',
                 'getter': lambda device: device.get_weight(),
+                'callback': BrickletLoadCell.CALLBACK_WEIGHT,
+                'callback_period_setter': lambda device, period: device.set_weight_callback_period(period),
                 'subvalues': None,
                 'unit': 'gram',
                 'advanced': False
@@ -1662,6 +1722,8 @@ device_specs = {
             {
                 'name': 'Pressure',
                 'getter': lambda device: device.get_pressure(),
+                'callback': BrickletPressure.CALLBACK_PRESSURE,
+                'callback_period_setter': lambda device, period: device.set_pressure_callback_period(period),
                 'subvalues': None,
                 'unit': 'Pa',
                 'advanced': False
@@ -1669,6 +1731,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletPressure.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -1751,6 +1815,8 @@ device_specs = {
             {
                 'name': 'Position',
                 'getter': lambda device: device.get_position(),
+                'callback': BrickletRotaryPoti.CALLBACK_POSITION,
+                'callback_period_setter': lambda device, period: device.set_position_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': False
@@ -1758,6 +1824,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletRotaryPoti.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -1772,6 +1840,8 @@ device_specs = {
             {
                 'name': 'Intensity',
                 'getter': lambda device: device.get_intensity(),
+                'callback': BrickletSoundIntensity.CALLBACK_INTENSITY,
+                'callback_period_setter': lambda device, period: device.set_intensity_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': False
@@ -1786,6 +1856,8 @@ device_specs = {
             {
                 'name': 'Temperature',
                 'getter': lambda device: device.get_temperature(),
+                'callback': BrickletTemperature.CALLBACK_TEMPERATURE,
+                'callback_period_setter': lambda device, period: device.set_temperature_callback_period(period),
                 'subvalues': None,
                 'unit': '°C/100',
                 'advanced': False
@@ -1808,6 +1880,8 @@ device_specs = {
             {
                 'name': 'Temperature',
                 'getter': lambda device: device.get_temperature(),
+                'callback': BrickletThermocouple.CALLBACK_TEMPERATURE,
+                'callback_period_setter': lambda device, period: device.set_temperature_callback_period(period),
                 'subvalues': None,
                 'unit': '°C/100',
                 'advanced': False
@@ -1863,6 +1937,8 @@ device_specs = {
             {
                 'name': 'Ambient Temperature',
                 'getter': lambda device: device.get_ambient_temperature(),
+                'callback': BrickletTemperatureIR.CALLBACK_AMBIENT_TEMPERATURE,
+                'callback_period_setter': lambda device, period: device.set_ambient_temperature_callback_period(period),
                 'subvalues': None,
                 'unit': '°C/10',
                 'advanced': False
@@ -1870,6 +1946,8 @@ device_specs = {
             {
                 'name': 'Object Temperature',
                 'getter': lambda device: device.get_object_temperature(),
+                'callback': BrickletTemperatureIR.CALLBACK_OBJECT_TEMPERATURE,
+                'callback_period_setter': lambda device, period: device.set_object_temperature_callback_period(period),
                 'subvalues': None,
                 'unit': '°C/10',
                 'advanced': False
@@ -1907,6 +1985,8 @@ device_specs = {
             {
                 'name': 'UV Light',
                 'getter': lambda device: device.get_uv_light(),
+                'callback': BrickletUVLight.CALLBACK_UV_LIGHT,
+                'callback_period_setter': lambda device, period: device.set_uv_light_callback_period(period),
                 'subvalues': None,
                 'unit': 'µW/cm²',
                 'advanced': False
@@ -1921,6 +2001,8 @@ device_specs = {
             {
                 'name': 'Voltage',
                 'getter': lambda device: device.get_voltage(),
+                'callback': BrickletVoltage.CALLBACK_VOLTAGE,
+                'callback_period_setter': lambda device, period: device.set_voltage_callback_period(period),
                 'subvalues': None,
                 'unit': 'mV',
                 'advanced': False
@@ -1928,6 +2010,8 @@ device_specs = {
             {
                 'name': 'Analog Value',
                 'getter': lambda device: device.get_analog_value(),
+                'callback': BrickletVoltage.CALLBACK_ANALOG_VALUE,
+                'callback_period_setter': lambda device, period: device.set_analog_value_callback_period(period),
                 'subvalues': None,
                 'unit': None,
                 'advanced': True
@@ -1942,6 +2026,8 @@ device_specs = {
             {
                 'name': 'Voltage',
                 'getter': lambda device: device.get_voltage(),
+                'callback': BrickletVoltageCurrent.CALLBACK_VOLTAGE,
+                'callback_period_setter': lambda device, period: device.set_voltage_callback_period(period),
                 'subvalues': None,
                 'unit': 'mV',
                 'advanced': False
@@ -1949,6 +2035,8 @@ device_specs = {
             {
                 'name': 'Current',
                 'getter': lambda device: device.get_current(),
+                'callback': BrickletVoltageCurrent.CALLBACK_CURRENT,
+                'callback_period_setter': lambda device, period: device.set_current_callback_period(period),
                 'subvalues': None,
                 'unit': 'mA',
                 'advanced': False
@@ -1956,6 +2044,8 @@ device_specs = {
             {
                 'name': 'Power',
                 'getter': lambda device: device.get_power(),
+                'callback': BrickletVoltageCurrent.CALLBACK_POWER,
+                'callback_period_setter': lambda device, period: device.set_power_callback_period(period),
                 'subvalues': None,
                 'unit': 'mW',
                 'advanced': False
@@ -2187,6 +2277,8 @@ device_specs = {
             {
                 'name': 'Stack Voltage',
                 'getter': lambda device: device.get_stack_voltage(),
+                'callback': BrickMaster.CALLBACK_STACK_VOLTAGE,
+                'callback_period_setter': lambda device, period: device.set_stack_voltage_callback_period(period),
                 'subvalues': None,
                 'unit': 'mV',
                 'advanced': False
@@ -2194,6 +2286,8 @@ device_specs = {
             {
                 'name': 'Stack Current',
                 'getter': lambda device: device.get_stack_current(),
+                'callback': BrickMaster.CALLBACK_STACK_CURRENT,
+                'callback_period_setter': lambda device, period: device.set_stack_current_callback_period(period),
                 'subvalues': None,
                 'unit': 'mA',
                 'advanced': False
@@ -2386,11 +2480,28 @@ class AbstractDevice(object):
  ---------------------------------------------------------------------------*/
  '''
 
+# immutable description of how a configured value is sampled:
+# var_name  -- name of the value
+# getter    -- getter bound to the device
+# formatter -- function that formats the timestamp according to the time format
+# columns   -- tuple of (index path into the getter result, column name, unit)
+SamplingPlan = namedtuple('SamplingPlan', 'var_name getter formatter columns')
+
 class DeviceImpl(AbstractDevice):
     """
     A SimpleDevice is every device, which only has funtion with one return value.
+
+    In callback acquisition mode the device pushes its values by period callbacks
+    instead of being polled by getters. Values without a period callback are
+    still polled. Note that most period callbacks are only triggered if the
+    value has changed since the last triggering, so unchanged values are not
+    logged again in this mode.
     """
 
+    ACQUISITION_GETTER = 'getter'
+    ACQUISITION_CALLBACK = 'callback'
+    ACQUISITION_MODES = [ACQUISITION_GETTER, ACQUISITION_CALLBACK]
+
     def __init__(self, data, datalogger):
         AbstractDevice.__init__(self, data, datalogger)
 
@@ -2398,7 +2509,11 @@ class DeviceImpl(AbstractDevice):
         self.device_uid = self.data['uid']
         self.device_spec = device_specs[self.device_name]
         device_class = self.device_spec['class']
-        self.device = device_class(self.device_uid, self.datalogger.ipcon)
+        self.device = device_class(self.device_uid, self.datalogger.get_ipcon(self.data['host']))
+        self.sampling_plans = {}
+        self.acquisition = self.data.get('acquisition', DeviceImpl.ACQUISITION_GETTER)
+        self.callback_periods = {} # var_name -> (callback ID, period setter bound to the device, period in ms)
+        self.callbacks_started = False
 
         self.__name__ = "devices:" + str(self.device_name)
 
@@ -2410,8 +2525,39 @@ class DeviceImpl(AbstractDevice):
             func_name = "_timer"
             var_name = value
 
+            self.sampling_plans[var_name] = self._create_sampling_plan(var_name)
+
+            if self.acquisition == DeviceImpl.ACQUISITION_CALLBACK and interval > 0 and \
+               self._register_period_callback(var_name, interval):
+                continue
+
             self.datalogger.timers.append(LoggerTimer(interval, func_name, var_name, self))
 
+    def start_callbacks(self):
+        """
+        Registers and enables the period callbacks that were configured by
+        start_timer. Has to be called after the jobs were started, otherwise
+        the first values would arrive before there is a queue to put them in.
+        """
+        for var_name, (callback_id, period_setter, period) in self.callback_periods.items():
+            self.device.register_callback(callback_id, functools.partial(self._callback, var_name))
+
+        self.callbacks_started = True
+        self._apply_callback_periods()
+
+    def stop_callbacks(self):
+        """
+        Turns off all period callbacks that were configured by start_timer.
+        """
+        self.callbacks_started = False
+
+        for var_name, (callback_id, period_setter, period) in self.callback_periods.items():
+            try:
+                period_setter(0)
+            except Exception as e:
+                EventLogger.debug('Could not disable callback of "{0}" for "{1}" with UID "{2}": {3}'
+                                  .format(var_name, self.device_name, self.device_uid, e))
+
     def apply_options(self):
         options_setter = self.device_spec['options_setter']
         option_specs = self.device_spec['options']
@@ -2441,124 +2587,142 @@ class DeviceImpl(AbstractDevice):
                 EventLogger.warning('Could not apply options for "{0}" with UID "{1}": {2}'
                                     .format(self.device_name, self.device_uid, e))
 
-    def _timer(self, var_name):
-        """
-        This function is used by the LoggerTimer to get the variable values from the brickd.
-        In SimpleDevices the get-functions only return one value.
-        """
+        # the callback periods are lost if the device was reset, apply them
+        # again on each (re-)connect and enumeration
+        if self.callbacks_started:
+            self._apply_callback_periods()
 
+    def _apply_callback_periods(self):
+        for var_name, (callback_id, period_setter, period) in self.callback_periods.items():
+            try:
+                period_setter(period)
+            except Exception as e:
+                EventLogger.warning('Could not set callback period of "{0}" for "{1}" with UID "{2}": {3}'
+                                    .format(var_name, self.device_name, self.device_uid, e))
+
+    def _get_value_spec(self, var_name):
         for value_spec in self.device_spec['values']:
             if value_spec['name'] == var_name:
-                break
+                return value_spec
+
+        raise Exception('Unknown value "{0}" for "{1}"'.format(var_name, self.device_name))
+
+    def _register_period_callback(self, var_name, interval):
+        """
+        Configures the period callback of a value instead of a LoggerTimer. The
+        callback is registered and its period is set by start_callbacks. Returns
+        False if the value has no period callback and has to be polled by its
+        getter instead.
+        """
+        value_spec = self._get_value_spec(var_name)
+        callback_id = value_spec.get('callback')
+
+        if callback_id is None:
+            EventLogger.debug('Value "{0}" of "{1}" has no period callback, falling back to getter'
+                              .format(var_name, self.device_name))
+            return False
+
+        period = max(1, int(round(interval * 1000)))
+
+        self.callback_periods[var_name] = (callback_id, functools.partial(value_spec['callback_period_setter'], self.device),
+                                           period)
+
+        return True
 
-        getter = value_spec['getter']
+    def _create_sampling_plan(self, var_name):
+        """
+        Compiles the spec and config of a value into a SamplingPlan, so that _timer
+        doesn't have to look them up again for every sample.
+        """
+        value_spec = self._get_value_spec(var_name)
         subvalue_names = value_spec['subvalues']
         unit = value_spec['unit']
-        now = time.time()
-        time_format = self.datalogger._config['data']['time_format']
-        time_format_strftime = self.datalogger._config['data']['time_format_strftime']
-
-        if time_format == 'de':
-            timestamp = timestamp_to_de(now)
-        elif time_format == 'de-msec':
-            timestamp = timestamp_to_de_msec(now)
-        elif time_format == 'us':
-            timestamp = timestamp_to_us(now)
-        elif time_format == 'us-msec':
-            timestamp = timestamp_to_us_msec(now)
-        elif time_format == 'iso':
-            timestamp = timestamp_to_iso(now)
-        elif time_format == 'iso-msec':
-            timestamp = timestamp_to_iso_msec(now)
-        elif time_format == 'unix':
-            timestamp = timestamp_to_unix(now)
-        elif time_format == 'unix-msec':
-            timestamp = timestamp_to_unix_msec(now)
-        elif time_format == 'strftime':
-            timestamp = timestamp_to_strftime(now, time_format_strftime)
+        columns = []
+
+        if subvalue_names is None:
+            columns.append(((), var_name, unit if unit != None else ''))
         else:
-            timestamp = timestamp_to_unix(now)
+            subvalue_bool = self.data['values'][var_name]['subvalues']
+
+            for i in range(len(subvalue_names)):
+                if not isinstance(subvalue_names[i], list):
+                    if subvalue_bool[subvalue_names[i]]:
+                        columns.append(((i,), str(var_name) + "-" + str(subvalue_names[i]),
+                                        unit[i] if unit[i] != None else ''))
+                else:
+                    for k in range(len(subvalue_names[i])):
+                        if subvalue_bool[subvalue_names[i][k]]:
+                            columns.append(((i, k), str(var_name) + "-" + str(subvalue_names[i][k]),
+                                            unit[i][k] if unit[i][k] != None else ''))
+
+        config = self.datalogger._config['data']
+
+        return SamplingPlan(var_name,
+                            functools.partial(value_spec['getter'], self.device),
+                            get_timestamp_formatter(config['time_format'], config['time_format_strftime']),
+                            tuple(columns))
+
+    def _timer(self, var_name):
+        """
+        This function is used by the LoggerTimer to get the variable values from the brickd.
+        In SimpleDevices the get-functions only return one value.
+        """
+        plan = self.sampling_plans[var_name]
+        now = time.time()
+        timestamp = plan.formatter(now)
 
         try:
-            value = getter(self.device)
+            value = plan.getter()
         except Exception as e:
-            value = self._exception_msg(str(self.device_name) + "-" + str(var_name), e)
             self.datalogger.add_to_queue(CSVData(timestamp,
                                                  self.device_name,
                                                  self.device_uid,
                                                  var_name,
-                                                 value,
-                                                 ''))
-            # log_exception(timestamp, value_name, e)
+                                                 self._exception_msg(str(self.device_name) + "-" + str(var_name), e),
+                                                 '',
+                                                 now))
             return
 
-        try:
-            if subvalue_names is None:
-                if unit == None:
-                    unit_str = ''
-                else:
-                    unit_str = unit
+        self._log_value(plan, timestamp, now, value)
+
+    def _callback(self, var_name, *args):
+        """
+        This function is registered as period callback of a value, the callback
+        arguments are the same values that the getter would return.
+        """
+        plan = self.sampling_plans[var_name]
+        now = time.time()
+
+        if len(args) == 1:
+            value = args[0]
+        else:
+            value = args
+
+        self._log_value(plan, plan.formatter(now), now, value)
 
-                # log_value(value_name, value)
+    def _log_value(self, plan, timestamp, now, value):
+        var_name = plan.var_name
+
+        for index_path, column_name, unit_str in plan.columns:
+            column_value = value
+
+            try:
+                for index in index_path:
+                    column_value = column_value[index]
+            except Exception as e:
                 self.datalogger.add_to_queue(CSVData(timestamp,
                                                      self.device_name,
                                                      self.device_uid,
-                                                     var_name,
-                                                     value,
-                                                     unit_str))
-            else:
-                subvalue_bool = self.data['values'][var_name]['subvalues']
-                for i in range(len(subvalue_names)):
-                    if not isinstance(subvalue_names[i], list):
-                        try:
-                            if subvalue_bool[subvalue_names[i]]:
-                                if unit[i] == None:
-                                    unit_str = ''
-                                else:
-                                    unit_str = unit[i]
-                                self.datalogger.add_to_queue(CSVData(timestamp,
-                                                                     self.device_name,
-                                                                     self.device_uid,
-                                                                     str(var_name) + "-" + str(subvalue_names[i]),
-                                                                     value[i],
-                                                                     unit_str))
-                        except Exception as e:
-                            value = self._exception_msg(str(self.device_name) + "-" + str(var_name), e)
-                            self.datalogger.add_to_queue(CSVData(timestamp,
-                                                                 self.device_name,
-                                                                 self.device_uid,
-                                                                 str(var_name) + "-" + str(subvalue_names[i]),
-                                                                 value[i],
-                                                                 ''))
-                            return
-                    else:
-                        for k in range(len(subvalue_names[i])):
-                            try:
-                                if subvalue_bool[subvalue_names[i][k]]:
-                                    if unit[i][k] == None:
-                                        unit_str = ''
-                                    else:
-                                        unit_str = unit[i][k]
-                                    self.datalogger.add_to_queue(CSVData(timestamp,
-                                                                         self.device_name,
-                                                                         self.device_uid,
-                                                                         str(var_name) + "-" + str(subvalue_names[i][k]),
-                                                                         value[i][k],
-                                                                         unit_str))
-                            except Exception as e:
-                                value = self._exception_msg(str(self.device_name) + "-" + str(var_name), e)
-                                self.datalogger.add_to_queue(CSVData(timestamp,
-                                                                     self.device_name,
-                                                                     self.device_uid,
-                                                                     str(var_name) + "-" + str(subvalue_names[i][k]),
-                                                                     value[i][k],
-                                                                     ''))
-                                return
-        except Exception as e:
-            value = self._exception_msg(str(self.device_name) + "-" + str(var_name), e)
+                                                     column_name,
+                                                     self._exception_msg(str(self.device_name) + "-" + str(var_name), e),
+                                                     '',
+                                                     now))
+                return
+
             self.datalogger.add_to_queue(CSVData(timestamp,
                                                  self.device_name,
                                                  self.device_uid,
-                                                 var_name,
-                                                 value,
-                                                 ''))
+                                                 column_name,
+                                                 column_value,
+                                                 unit_str,
+                                                 now))
@@ -40,7 +40,7 @@ import locale
 if 'merged_data_logger_modules' not in globals():
     from brickv.data_logger.data_logger import DataLogger
     from brickv.data_logger.event_logger import ConsoleLogger, FileLogger, EventLogger
-    from brickv.data_logger.utils import DataLoggerException
+    from brickv.data_logger.utils import DataLoggerException, convert_binary_to_csv
     from brickv.data_logger.configuration import load_and_validate_config
 
 def signal_handler(interrupted_ref, signum, frame):
@@ -133,7 +133,20 @@ if __name__ == '__main__':
             print(data_logger_version)
             sys.exit(0)
 
+    class ConvertBinaryAction(argparse.Action):
+        def __call__(self, parser, namespace, values, option_string=None):
+            try:
+                row_count = convert_binary_to_csv(values[0], values[1])
+            except Exception as e:
+                print('Could not convert binary file: {0}'.format(e))
+                sys.exit(DataLoggerException.DL_CRITICAL_ERROR)
+
+            print('Converted {0} rows'.format(row_count))
+            sys.exit(0)
+
     parser.add_argument('-v', '--version', action=VersionAction, nargs=0, help='show version and exit')
+    parser.add_argument('--convert-binary-to-csv', action=ConvertBinaryAction, nargs=2, metavar=('BINARY', 'CSV'),
+                        help='convert a binary data file to a CSV file and exit')
     parser.add_argument('config', help='config file location', metavar='CONFIG')
     parser.add_argument('--console-log-level', choices=['none', 'debug', 'info', 'warning', 'error', 'critical'],
                         default='info', help='change console log level (default: info)')
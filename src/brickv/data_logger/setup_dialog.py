@@ -31,7 +31,7 @@ import logging
 from datetime import datetime
 
 from PyQt4 import QtGui, QtCore
-from PyQt4.QtCore import Qt, QRegExp
+from PyQt4.QtCore import Qt, QRegExp, QAbstractTableModel, QModelIndex
 from PyQt4.QtGui import QDialog, QMessageBox, QPalette, QStandardItemModel, \
                         QStandardItem, QLineEdit, QSpinBox, QCheckBox, QComboBox, \
                         QHBoxLayout, QRegExpValidator, QTextCursor, QIcon, QColor, \
@@ -88,6 +88,120 @@ class IntervalWidget(QWidget):
         else:
             return self.spinbox.value() / 1000.0
 
+class DataTableModel(QAbstractTableModel):
+    """
+    Table model over a fixed-size ring buffer of the last *capacity* CSVData
+    rows. Cell texts are only created for the rows the view actually asks for.
+    """
+
+    COLUMN_LABELS = ['Time', 'Name', 'UID', 'Var', 'Raw', 'Unit']
+
+    def __init__(self, parent=None, capacity=1000):
+        QAbstractTableModel.__init__(self, parent)
+
+        self.capacity = capacity
+        self.rows = [None] * capacity
+        self.head = 0 # index of the first row in self.rows
+        self.count = 0
+        self.total_count = 0 # number of rows ever added, used to number the rows
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return self.count
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return len(DataTableModel.COLUMN_LABELS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+
+        row = index.row()
+
+        if row < 0 or row >= self.count:
+            return None
+
+        csv_data = self.rows[(self.head + row) % self.capacity]
+        column = index.column()
+
+        if column == 0:
+            return csv_data.timestamp.decode('utf-8')
+        elif column == 1:
+            return csv_data.name
+        elif column == 2:
+            return csv_data.uid
+        elif column == 3:
+            return csv_data.var_name
+        elif column == 4:
+            return str(csv_data.raw_data)
+        elif column == 5:
+            return csv_data.var_unit.decode('utf-8')
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+
+        if orientation == Qt.Horizontal:
+            if section < len(DataTableModel.COLUMN_LABELS):
+                return DataTableModel.COLUMN_LABELS[section]
+
+            return None
+
+        return str(self.total_count - self.count + section + 1)
+
+    def add_rows(self, csv_data_list):
+        """
+        Appends a batch of CSVData to the table, the oldest rows are removed
+        if the table would hold more than *capacity* rows.
+        """
+        if len(csv_data_list) == 0:
+            return
+
+        self.total_count += len(csv_data_list)
+
+        if len(csv_data_list) >= self.capacity:
+            self.beginResetModel()
+            self.rows = list(csv_data_list[-self.capacity:])
+            self.head = 0
+            self.count = self.capacity
+            self.endResetModel()
+            return
+
+        overflow = self.count + len(csv_data_list) - self.capacity
+
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+
+            for i in range(overflow):
+                self.rows[(self.head + i) % self.capacity] = None
+
+            self.head = (self.head + overflow) % self.capacity
+            self.count -= overflow
+            self.endRemoveRows()
+
+        self.beginInsertRows(QModelIndex(), self.count, self.count + len(csv_data_list) - 1)
+
+        for csv_data in csv_data_list:
+            self.rows[(self.head + self.count) % self.capacity] = csv_data
+            self.count += 1
+
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.rows = [None] * self.capacity
+        self.head = 0
+        self.count = 0
+        self.total_count = 0
+        self.endResetModel()
+
 # noinspection PyProtectedMember,PyCallByClass
 class SetupDialog(QDialog, Ui_SetupDialog):
     """
@@ -108,8 +222,7 @@ class SetupDialog(QDialog, Ui_SetupDialog):
 
         self.setupUi(self)
 
-        self.model_data = QStandardItemModel(self)
-        self.model_data.setHorizontalHeaderLabels(['Time', 'Name', 'UID', 'Var', 'Raw', 'Unit'])
+        self.model_data = DataTableModel(self)
         self.table_data.setModel(self.model_data)
         self.table_data.setColumnWidth(0, 160)
         self.table_data.setColumnWidth(1, 170)
@@ -251,7 +364,7 @@ class SetupDialog(QDialog, Ui_SetupDialog):
             from brickv.data_logger import main
 
             self._gui_job = GuiDataJob(name="GuiData-Writer")
-            self.connect(self._gui_job, QtCore.SIGNAL(GuiDataJob.SIGNAL_NEW_DATA), self.table_add_row)
+            self.connect(self._gui_job, QtCore.SIGNAL(GuiDataJob.SIGNAL_NEW_DATA), self.table_add_rows)
 
             self.data_logger_thread = main.main(None, GuiConfigHandler.create_config(self), self._gui_job, None, None, None)
 
@@ -269,7 +382,7 @@ class SetupDialog(QDialog, Ui_SetupDialog):
         self.btn_start_logging.setText("Start Logging")
         self.btn_start_logging.setIcon(QIcon(load_pixmap('data_logger/start-icon.png')))
 
-        self.disconnect(self._gui_job, QtCore.SIGNAL(GuiDataJob.SIGNAL_NEW_DATA), self.table_add_row)
+        self.disconnect(self._gui_job, QtCore.SIGNAL(GuiDataJob.SIGNAL_NEW_DATA), self.table_add_rows)
         self.data_logger_thread = None
         self._gui_job = None
 
@@ -396,7 +509,7 @@ class SetupDialog(QDialog, Ui_SetupDialog):
         self.model_devices.removeRows(0, self.model_devices.rowCount())
 
     def btn_clear_data_clicked(self):
-        self.model_data.removeRows(0, self.model_data.rowCount())
+        self.model_data.clear()
 
     def tab_reset_warning(self):
         """
@@ -596,34 +709,16 @@ class SetupDialog(QDialog, Ui_SetupDialog):
             self.tab_set(self.tab_widget.indexOf(self.tab_debug), QColor(255, 0, 0),
                          os.path.join(get_resources_path(), "warning-icon.png"))
 
-    def table_add_row(self, csv_data):
+    def table_add_rows(self, csv_data_list):
         """
             SIGNAL function:
-            Adds new CSV Data into the Table.
+            Adds a batch of new CSV Data into the Table.
         """
-        rows = self.model_data.rowCount()
-
-        while rows >= 1000:
-            self.model_data.removeRow(0)
-            rows = self.model_data.rowCount()
-
-        row_number = None
-
-        if rows > 0:
-            try:
-                row_number = int(self.model_data.headerData(rows - 1, Qt.Vertical))
-            except ValueError:
-                pass
-
-        self.model_data.appendRow([QStandardItem(csv_data.timestamp.decode('utf-8')),
-                                   QStandardItem(csv_data.name),
-                                   QStandardItem(csv_data.uid),
-                                   QStandardItem(csv_data.var_name),
-                                   QStandardItem(str(csv_data.raw_data)),
-                                   QStandardItem(csv_data.var_unit.decode('utf-8'))])
-
-        if row_number != None:
-            self.model_data.setHeaderData(rows, Qt.Vertical, str(row_number + 1))
+        self.model_data.add_rows(csv_data_list)
 
         if self.checkbox_data_auto_scroll.isChecked():
             self.table_data.scrollToBottom()
+
+        if self.data_logger_thread is not None:
+            self.label_queue_stats.setText(', '.join(['{0}: {1} enqueued, {2} written, {3} dropped'.format(*stats)
+                                                      for stats in self.data_logger_thread.get_queue_stats()]))
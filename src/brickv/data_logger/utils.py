@@ -26,13 +26,34 @@ Boston, MA 02111-1307, USA.
 
 import csv  # CSV_Writer
 from datetime import datetime  # CSV_Data
+import io  # CSV_Writer
 import os  # CSV_Writer
-from shutil import copyfile
+import errno
 import sys  # CSV_Writer
-from threading import Timer
+from threading import Thread, Lock, Condition
+import heapq
+import Queue
+import tempfile
+import cPickle as pickle
 import time  # Writer Thread
 import math
 import locale
+import struct
+import sqlite3
+import zlib
+import ctypes
+
+try:
+    import zstandard
+    has_zstd = True
+except ImportError:
+    has_zstd = False
+
+try:
+    import lz4.frame
+    has_lz4 = True
+except ImportError:
+    has_lz4 = False
 
 if 'merged_data_logger_modules' not in globals():
     from brickv.data_logger.event_logger import EventLogger
@@ -101,6 +122,29 @@ def timestamp_to_strftime(timestamp, time_format):
     except Exception as e:
         return 'Error: ' + str(e).replace('\n', ' ')
 
+TIMESTAMP_FORMATTERS = {
+    'de': timestamp_to_de,
+    'de-msec': timestamp_to_de_msec,
+    'us': timestamp_to_us,
+    'us-msec': timestamp_to_us_msec,
+    'iso': timestamp_to_iso,
+    'iso-msec': timestamp_to_iso_msec,
+    'unix': timestamp_to_unix,
+    'unix-msec': timestamp_to_unix_msec
+}
+
+def get_timestamp_formatter(time_format, time_format_strftime):
+    """
+    Returns a function that formats a timestamp according to the time format
+    """
+    if time_format == 'strftime':
+        return lambda timestamp: timestamp_to_strftime(timestamp, time_format_strftime)
+
+    return TIMESTAMP_FORMATTERS.get(time_format, timestamp_to_unix)
+
+def format_timestamp(timestamp, time_format, time_format_strftime):
+    return get_timestamp_formatter(time_format, time_format_strftime)(timestamp)
+
 class DataLoggerException(Exception):
     # Error Codes
     DL_MISSING_ARGUMENT = -1  # Missing Arguments in Config File
@@ -127,16 +171,18 @@ class CSVData(object):
     This class is used as a temporary save spot for all csv relevant data.
     """
 
-    def __init__(self, timestamp, name, uid, var_name, raw_data, var_unit):
+    def __init__(self, timestamp, name, uid, var_name, raw_data, var_unit, unix_timestamp=None):
         """
-        timestamp -- time data was
-        name      -- display name of Brick(let)
-        uid       -- UID of Brick(let)
-        var_name  -- name of logged value
-        raw_data  -- logged value
-        var_unit  -- unit of logged value
+        timestamp      -- time data was
+        name           -- display name of Brick(let)
+        uid            -- UID of Brick(let)
+        var_name       -- name of logged value
+        raw_data       -- logged value
+        var_unit       -- unit of logged value
+        unix_timestamp -- time data was, in seconds since the epoch
         """
         self.timestamp = timestamp # datatime object
+        self.unix_timestamp = unix_timestamp
         self.name = name
         self.uid = uid
         self.var_name = var_name
@@ -154,6 +200,194 @@ class CSVData(object):
                ";RAW=" + str(self.raw_data) + \
                ";UNIT=" + str(self.var_unit) + "]"
 
+'''
+/*---------------------------------------------------------------------------
+                                DataQueue
+ ---------------------------------------------------------------------------*/
+ '''
+
+
+class DataQueue(Queue.Queue):
+    """
+    Queue between the DataLogger and one of its jobs. The queue holds at most
+    max_size items in memory (0 means unbounded), the policy decides what
+    happens to new items if the queue is full:
+
+    block       -- put blocks until the job took items out of the queue
+    drop-oldest -- the oldest item in the queue is dropped
+    drop-newest -- the new item is dropped
+    spill       -- the new item is written to a temporary file and read back
+                   once the job caught up
+    """
+
+    POLICY_BLOCK = 'block'
+    POLICY_DROP_OLDEST = 'drop-oldest'
+    POLICY_DROP_NEWEST = 'drop-newest'
+    POLICY_SPILL = 'spill'
+    POLICIES = [POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_DROP_NEWEST, POLICY_SPILL]
+
+    DEFAULT_MAX_SIZE = 100000
+    DEFAULT_POLICY = POLICY_BLOCK
+
+    def __init__(self, name, max_size=DEFAULT_MAX_SIZE, policy=DEFAULT_POLICY):
+        if policy not in DataQueue.POLICIES:
+            raise ValueError('Unknown queue policy: {0}'.format(policy))
+
+        # only the block policy makes use of the bound of Queue.Queue, all other
+        # policies enforce the bound in put themselves
+        if policy == DataQueue.POLICY_BLOCK:
+            Queue.Queue.__init__(self, max_size)
+        else:
+            Queue.Queue.__init__(self, 0)
+
+        self.name = name
+        self.max_size = max_size
+        self.policy = policy
+
+        self.enqueued_count = 0
+        self.written_count = 0
+        self.dropped_count = 0
+        self.spilled_count = 0
+
+        self._spill_file = None
+        self._spill_read_offset = 0
+        self._spill_length = 0 # number of items in the spill file
+
+        self._woken_up = False # protected by mutex
+
+    def put(self, item, block=True, timeout=None):
+        if self.policy == DataQueue.POLICY_BLOCK or self.max_size <= 0:
+            Queue.Queue.put(self, item, block, timeout)
+
+            with self.mutex:
+                self.enqueued_count += 1
+
+            return
+
+        with self.mutex:
+            if len(self.queue) >= self.max_size:
+                if self.policy == DataQueue.POLICY_DROP_OLDEST:
+                    self.queue.popleft()
+                    self.unfinished_tasks -= 1
+                    self.dropped_count += 1
+                elif self.policy == DataQueue.POLICY_DROP_NEWEST:
+                    self.dropped_count += 1
+                    return
+
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.enqueued_count += 1
+            self.not_empty.notify()
+
+    def get(self, block=True, timeout=None):
+        """
+        Like Queue.get, but after wake_up() a blocking get on an empty queue
+        returns None instead of waiting. A non-blocking get raises Queue.Empty
+        as usual.
+        """
+        with self.not_empty:
+            if timeout is not None:
+                if timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+
+                end_time = time.time() + timeout
+
+            while not self._qsize():
+                if not block:
+                    raise Queue.Empty
+
+                if self._woken_up:
+                    return None
+
+                if timeout is None:
+                    self.not_empty.wait()
+                else:
+                    remaining = end_time - time.time()
+
+                    if remaining <= 0.0:
+                        raise Queue.Empty
+
+                    self.not_empty.wait(remaining)
+
+            item = self._get()
+            self.not_full.notify()
+
+            return item
+
+    def wake_up(self):
+        """
+        Wakes up a job that is blocked in get, independent of the bound and
+        policy of the queue. The wake-up is a flag and not an item in the
+        queue, so the drop-oldest policy cannot drop it. From now on the job
+        gets None instead of blocking on an empty queue.
+        """
+        with self.mutex:
+            self._woken_up = True
+            self.not_empty.notify_all()
+
+    def mark_written(self, count):
+        """
+        Called by the job after it has processed *count* items.
+        """
+        with self.mutex:
+            self.written_count += count
+
+    def get_stats(self):
+        with self.mutex:
+            return self.enqueued_count, self.written_count, self.dropped_count
+
+    def log_stats(self):
+        enqueued_count, written_count, dropped_count = self.get_stats()
+        msg = 'Queue of {0}: {1} enqueued, {2} written, {3} dropped'.format(self.name, enqueued_count,
+                                                                            written_count, dropped_count)
+
+        if self.spilled_count > 0:
+            msg += ', {0} spilled to disk'.format(self.spilled_count)
+
+        if dropped_count > 0:
+            EventLogger.warning(msg)
+        else:
+            EventLogger.info(msg)
+
+    # the following methods are called by Queue.Queue with the mutex locked
+    def _qsize(self, len=len):
+        return len(self.queue) + self._spill_length
+
+    def _put(self, item):
+        if self.policy != DataQueue.POLICY_SPILL or self.max_size <= 0 or \
+           (len(self.queue) < self.max_size and self._spill_length == 0):
+            self.queue.append(item)
+            return
+
+        # keep the order of the items: once spilling started, all new items go
+        # to the spill file until the job read all of them back
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix='brick-logger-spill-')
+
+        self._spill_file.seek(0, os.SEEK_END)
+        pickle.dump(item, self._spill_file, pickle.HIGHEST_PROTOCOL)
+        self._spill_length += 1
+        self.spilled_count += 1
+
+    def _get(self):
+        item = self.queue.popleft()
+
+        if self._spill_length > 0:
+            self._spill_file.seek(self._spill_read_offset)
+
+            while self._spill_length > 0 and len(self.queue) < self.max_size:
+                self.queue.append(pickle.load(self._spill_file))
+                self._spill_length -= 1
+
+            self._spill_read_offset = self._spill_file.tell()
+
+            if self._spill_length == 0:
+                self._spill_file.seek(0)
+                self._spill_file.truncate()
+                self._spill_read_offset = 0
+
+        return item
+
 '''
 /*---------------------------------------------------------------------------
                                 LoggerTimer
@@ -161,8 +395,302 @@ class CSVData(object):
  '''
 
 
+def get_monotonic_time_function():
+    """
+    Returns a function that returns the time in seconds of a monotonic clock, so that changes of the system time
+    don't cause bursts or stalls of the sampling. Python 2 has no time.monotonic, there the clock of the OS is used
+    by ctypes. Falls back to time.time if no monotonic clock is available.
+    """
+    if hasattr(time, 'monotonic'):
+        return time.monotonic
+
+    try:
+        if sys.platform == 'win32':
+            get_tick_count_64 = ctypes.windll.kernel32.GetTickCount64
+            get_tick_count_64.restype = ctypes.c_ulonglong
+            get_tick_count_64.argtypes = []
+
+            return lambda: get_tick_count_64() / 1000.0
+        elif sys.platform == 'darwin':
+            class MachTimebaseInfo(ctypes.Structure):
+                _fields_ = [('numer', ctypes.c_uint32), ('denom', ctypes.c_uint32)]
+
+            libc = ctypes.CDLL('/usr/lib/libc.dylib')
+            mach_absolute_time = libc.mach_absolute_time
+            mach_absolute_time.restype = ctypes.c_uint64
+            mach_absolute_time.argtypes = []
+            timebase = MachTimebaseInfo()
+
+            if libc.mach_timebase_info(ctypes.byref(timebase)) != 0 or timebase.denom == 0:
+                raise OSError('mach_timebase_info failed')
+
+            factor = timebase.numer / float(timebase.denom) / 1e9
+
+            return lambda: mach_absolute_time() * factor
+        elif sys.platform.startswith('linux'):
+            class Timespec(ctypes.Structure):
+                _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+            CLOCK_MONOTONIC = 1
+
+            try:
+                clock_gettime = ctypes.CDLL('librt.so.1', use_errno=True).clock_gettime
+            except OSError:
+                clock_gettime = ctypes.CDLL('libc.so.6', use_errno=True).clock_gettime
+
+            clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(Timespec)]
+            timespec = Timespec()
+
+            if clock_gettime(CLOCK_MONOTONIC, ctypes.byref(timespec)) != 0:
+                raise OSError(ctypes.get_errno(), 'clock_gettime failed')
+
+            def get_time():
+                value = Timespec()
+                clock_gettime(CLOCK_MONOTONIC, ctypes.byref(value))
+
+                return value.tv_sec + value.tv_nsec / 1e9
+
+            return get_time
+    except (AttributeError, OSError):
+        pass
+
+    # FIXME: no monotonic clock available on this platform, changes of the system time affect the sampling
+    return time.time
+
+
+get_time = get_monotonic_time_function()
+
+
+class LoggerTimerGroup(object):
+    """All started LoggerTimers of a device that share the same interval, they are fired together"""
+
+    def __init__(self, device, interval, worker):
+        self.device = device
+        self.interval = interval # in seconds
+        self.worker = worker # index of the worker that runs the getters of the device
+        self.timers = []
+        self.cancelled = False
+
+
+class LoggerScheduler(object):
+    """
+    This class runs all LoggerTimers from one scheduler thread. The timer groups are kept in a heap ordered by their
+    monotonic deadlines. Due groups are handed to a small worker pool, all groups of the same device are handled by
+    the same worker, so the getters of a device never run concurrently. Missed deadlines and the scheduling jitter
+    are reported through the EventLogger.
+    """
+
+    WORKER_COUNT = 4
+    STATS_INTERVAL = 60.0 # seconds
+
+    def __init__(self):
+        self._lock = Lock()
+        self._condition = Condition(self._lock) # wakes up the scheduler thread
+        self._done_condition = Condition(self._lock) # signals finished groups to join()
+        self._heap = [] # (deadline, counter, group)
+        self._counter = 0
+        self._groups = {} # (device id, interval) -> LoggerTimerGroup
+        self._device_workers = {} # device id -> [worker index, number of groups]
+        self._worker_device_counts = [0] * LoggerScheduler.WORKER_COUNT
+        self._running_groups = set()
+        self._thread = None
+        self._worker_queues = []
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._samples = 0
+        self._missed_deadlines = 0
+        self._jitter_sum = 0.0
+        self._jitter_max = 0.0
+        self._stats_time = get_time()
+
+    def _start_unlocked(self):
+        if self._thread is not None:
+            return
+
+        for i in range(LoggerScheduler.WORKER_COUNT):
+            queue = Queue.Queue()
+            worker = Thread(name='LoggerScheduler-Worker-{0}'.format(i), target=self._worker_loop, args=(queue,))
+            worker.daemon = True
+            worker.start()
+
+            self._worker_queues.append(queue)
+
+        self._thread = Thread(name='LoggerScheduler', target=self._loop)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _push_unlocked(self, group, deadline):
+        self._counter += 1
+        heapq.heappush(self._heap, (deadline, self._counter, group))
+
+        if self._heap[0][2] is group:
+            # new earliest deadline, wake up the scheduler thread
+            self._condition.notify()
+
+    def add(self, timer):
+        with self._lock:
+            self._start_unlocked()
+
+            key = (id(timer._device), timer._interval)
+            group = self._groups.get(key)
+
+            if group is None:
+                group = LoggerTimerGroup(timer._device, timer._interval, self._acquire_worker_unlocked(timer._device))
+                self._groups[key] = group
+                self._push_unlocked(group, get_time() + timer._interval)
+
+            group.timers.append(timer)
+
+    def remove(self, timer):
+        with self._lock:
+            key = (id(timer._device), timer._interval)
+            group = self._groups.get(key)
+
+            if group is None or timer not in group.timers:
+                return
+
+            group.timers.remove(timer)
+
+            if len(group.timers) == 0:
+                # the heap entry is dropped when it becomes due
+                group.cancelled = True
+                del self._groups[key]
+                self._release_worker_unlocked(timer._device)
+
+    def _acquire_worker_unlocked(self, device):
+        """
+        Returns the worker index of the device. A new device is assigned to the worker with the fewest devices, so
+        a device that blocks in its getters only delays the devices that share its worker.
+        """
+        entry = self._device_workers.get(id(device))
+
+        if entry is None:
+            worker = min(range(len(self._worker_device_counts)), key=self._worker_device_counts.__getitem__)
+            entry = [worker, 0]
+            self._device_workers[id(device)] = entry
+            self._worker_device_counts[worker] += 1
+
+        entry[1] += 1
+
+        return entry[0]
+
+    def _release_worker_unlocked(self, device):
+        entry = self._device_workers[id(device)]
+        entry[1] -= 1
+
+        if entry[1] == 0:
+            self._worker_device_counts[entry[0]] -= 1
+            del self._device_workers[id(device)]
+
+    def join(self, timer):
+        """Waits until the getters of the group of the timer are not running anymore"""
+        with self._lock:
+            while any(group.device is timer._device and group.interval == timer._interval
+                      for group in self._running_groups):
+                self._done_condition.wait()
+
+    def log_stats(self):
+        with self._lock:
+            self._log_stats_unlocked()
+
+    def _log_stats_unlocked(self):
+        if self._samples == 0:
+            return
+
+        message = "LoggerScheduler: {0} samples in {1:.0f}s, {2} missed deadlines, jitter avg {3:.1f}ms max {4:.1f}ms" \
+                  .format(self._samples, get_time() - self._stats_time, self._missed_deadlines,
+                          self._jitter_sum / self._samples * 1000.0, self._jitter_max * 1000.0)
+
+        if self._missed_deadlines > 0:
+            EventLogger.warning(message)
+        else:
+            EventLogger.debug(message)
+
+        self._reset_stats()
+
+    def _loop(self):
+        while True:
+            batches = {} # worker index -> [(deadline, group)]
+
+            with self._lock:
+                while True:
+                    now = get_time()
+
+                    if now - self._stats_time >= LoggerScheduler.STATS_INTERVAL:
+                        self._log_stats_unlocked()
+
+                    if len(self._heap) > 0 and self._heap[0][0] <= now:
+                        break
+
+                    timeout = self._stats_time + LoggerScheduler.STATS_INTERVAL - now
+
+                    if len(self._heap) > 0:
+                        timeout = min(timeout, self._heap[0][0] - now)
+
+                    self._condition.wait(max(timeout, 0))
+
+                # collect all due groups and batch them per device
+                while len(self._heap) > 0 and self._heap[0][0] <= now:
+                    deadline, _, group = heapq.heappop(self._heap)
+
+                    if group.cancelled:
+                        continue
+
+                    self._running_groups.add(group)
+                    batches.setdefault(group.worker, []).append((deadline, group))
+
+            for worker, batch in batches.items():
+                self._worker_queues[worker].put(batch)
+
+    def _worker_loop(self, queue):
+        while True:
+            batch = queue.get()
+
+            for deadline, group in batch:
+                start = get_time()
+                jitter = max(start - deadline, 0)
+
+                with self._lock:
+                    timers = list(group.timers)
+
+                for timer in timers:
+                    if timer.exit_flag:
+                        continue
+
+                    try:
+                        getattr(timer._device, timer._func_name)(timer._var_name)
+                    except Exception as e:
+                        EventLogger.error("LoggerScheduler: error while sampling " + str(timer._var_name) + ": " + str(e))
+
+                now = get_time()
+
+                with self._lock:
+                    self._running_groups.discard(group)
+                    self._done_condition.notify_all()
+
+                    self._samples += len(timers)
+                    self._jitter_sum += jitter * len(timers)
+                    self._jitter_max = max(self._jitter_max, jitter)
+
+                    if group.cancelled:
+                        continue
+
+                    # count every tick that passed while the group was running or waiting for its
+                    # worker, but don't try to catch up the missed samples
+                    missed = int((now - deadline) // group.interval) if group.interval > 0 else 0
+
+                    self._missed_deadlines += missed
+                    next_deadline = deadline + (missed + 1) * group.interval
+
+                    self._push_unlocked(group, next_deadline)
+
+
 class LoggerTimer(object):
-    """This class provides a timer with a repeat functionality based on a interval"""
+    """This class provides a timer with a repeat functionality based on a interval. All timers are run by the
+       LoggerScheduler, timers of the same device with the same interval are fired together"""
+
+    scheduler = LoggerScheduler()
 
     def __init__(self, interval, func_name, var_name, device):
         """
@@ -178,43 +706,30 @@ class LoggerTimer(object):
         self._var_name = var_name
         self._device = device
         self._was_started = False
-        self._t = Timer(self._interval, self._loop)
-
-    def _loop(self):
-        """Runs the <self._func_name> function every <self._interval> seconds"""
-        start = time.time() # FIXME: use time.monotonic() in Python 3
-        getattr(self._device, self._func_name)(self._var_name)
-        elapsed = max(time.time() - start, 0) # FIXME: use time.monotonic() in Python 3
-        self.cancel()
-        if self.exit_flag:
-            return
-        self._t = Timer(max(self._interval - elapsed, 0), self._loop)
-        self.start()
 
     def start(self):
         """Starts the timer if <self._interval> is not 0 otherwise the
            timer will be canceled
         """
         if self._interval == 0:
-            self.cancel()
             return
 
-        self._t.start()
+        LoggerTimer.scheduler.add(self)
         self._was_started = True
 
     def stop(self):
         self.exit_flag = True
-        self._was_started = False
+
+        if self._was_started:
+            LoggerTimer.scheduler.remove(self)
 
     def cancel(self):
-        self._t.cancel()
+        self.stop()
 
     def join(self):
-        if self._interval == 0:  # quick fix for no timer.start()
-            return
-
         if self._was_started:
-            self._t.join()
+            LoggerTimer.scheduler.join(self)
+            self._was_started = False
 
 
 """
@@ -312,16 +827,102 @@ class Utilities(object):
  '''
 
 
-class CSVWriter(object):
+class BufferedWriter(object):
+    """
+    Base class of the writers that collect rows in a memory buffer. The buffer is written if it holds more than
+    flush_size bytes or if its oldest row is older than flush_interval seconds. Subclasses call _buffer_rows() before
+    they add rows to the buffer and implement _write_buffer().
+    """
+
+    DEFAULT_FLUSH_INTERVAL = 0.5 # seconds
+    DEFAULT_FLUSH_SIZE = 64 * 1024 # bytes
+
+    def __init__(self, flush_interval=DEFAULT_FLUSH_INTERVAL, flush_size=DEFAULT_FLUSH_SIZE):
+        self._flush_interval = max(flush_interval, 0)
+        self._flush_size = max(flush_size, 0)
+        self._buffer_time = None # time of the oldest buffered row
+
+    def _buffer_rows(self):
+        """Has to be called before rows are added to the buffer"""
+        if self._buffer_time is None:
+            self._buffer_time = time.time()
+
+    def _flush_if_needed(self, buffer_size):
+        """Flushes the buffer if it holds buffer_size >= flush_size bytes or if it is due"""
+        if buffer_size >= self._flush_size:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def get_flush_timeout(self):
+        """
+        Returns the time in seconds until the buffer has to be flushed or None if the buffer is empty
+        """
+        if self._buffer_time is None:
+            return None
+
+        return max(self._buffer_time + self._flush_interval - time.time(), 0)
+
+    def flush_if_due(self):
+        timeout = self.get_flush_timeout()
+
+        if timeout is not None and timeout <= 0:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered rows, does nothing if the buffer is empty"""
+        if self._buffer_time is None:
+            return
+
+        # reset first, _write_buffer() of the CSVWriter can roll the file and flush again
+        self._buffer_time = None
+        self._write_buffer()
+
+    def _write_buffer(self):
+        """Has to be implemented by the subclasses, writes the buffered rows and empties the buffer"""
+        raise NotImplementedError()
+
+
+class CSVWriter(BufferedWriter):
     """
     This class provides the actual open/write functions, which are used by the CSVWriterJob class to write logged data into
     a CSV formatted file.
+
+    Rows are collected in a memory buffer. The buffer is written to the file if it holds more than flush_size bytes or
+    if its oldest row is older than flush_interval seconds. The file size for rolling is tracked in memory.
+
+    With compression the file is written as a gzip, zstd or lz4 stream and every flush ends a compressed block, so a
+    crash loses at most the rows of the last flush interval. The file size for rolling is the compressed size.
     """
 
-    def __init__(self, file_path, max_file_count=1, max_file_size=0):
+    COMPRESSION_NONE = 'none'
+    COMPRESSION_GZIP = 'gzip'
+    COMPRESSION_ZSTD = 'zstd'
+    COMPRESSION_LZ4 = 'lz4'
+    COMPRESSIONS = [COMPRESSION_NONE, COMPRESSION_GZIP, COMPRESSION_ZSTD, COMPRESSION_LZ4]
+    COMPRESSION_EXTENSIONS = {COMPRESSION_NONE: '', COMPRESSION_GZIP: '.gz', COMPRESSION_ZSTD: '.zst',
+                              COMPRESSION_LZ4: '.lz4'}
+
+    def __init__(self, file_path, max_file_count=1, max_file_size=0,
+                 flush_interval=BufferedWriter.DEFAULT_FLUSH_INTERVAL, flush_size=BufferedWriter.DEFAULT_FLUSH_SIZE,
+                 compression=COMPRESSION_NONE):
         """
-        file_path = Path to the csv file
+        file_path = Path to the csv file, the extension of the compression is appended if missing
+        flush_interval = Maximum time in seconds that rows are buffered before they are written
+        flush_size = Maximum number of bytes that are buffered before they are written
+        compression = One of COMPRESSIONS, see is_compression_available()
         """
+        BufferedWriter.__init__(self, flush_interval, flush_size)
+
+        if not CSVWriter.is_compression_available(compression):
+            raise Exception("Compression not available! -> " + str(compression))
+
+        self._compression = compression
+        self._extension = CSVWriter.COMPRESSION_EXTENSIONS[compression]
+
+        if not file_path.endswith(self._extension):
+            file_path += self._extension
+
         self._file_path = file_path
         # check if file path exists
         if not Utilities.check_file_path_exists(self._file_path):
@@ -340,18 +941,48 @@ class CSVWriter(object):
 
         self._file_count = max_file_count
 
+        self._buffer = None
+        self._current_file_size = 0
+        self._compressor = None
+        self._uncompressed_bytes = 0 # written since the writer was created, used for the compression ratio
+        self._compressed_bytes = 0
+        self._obsolete_file_count = 0
+
         self._open_file_A()
 
+    @staticmethod
+    def is_compression_available(compression):
+        if compression == CSVWriter.COMPRESSION_ZSTD:
+            return has_zstd
+        elif compression == CSVWriter.COMPRESSION_LZ4:
+            return has_lz4
+
+        return compression in CSVWriter.COMPRESSIONS
+
     def _open_file_A(self):
         """Opens a file in append mode."""
 
-        # newline problem solved + import sys
+        # the file is written in binary mode, so the rows keep their \r\n line endings and the file
+        # size is counted in bytes. the csv module writes str, under Python 3 it is encoded on flush
+        self._raw_file = open(self._file_path, 'ab')
+
         if sys.version_info >= (3, 0, 0):
-            self._raw_file = open(self._file_path, 'a', newline='')  # FIXME append or write?!
+            self._buffer = io.StringIO()
         else:
-            self._raw_file = open(self._file_path, 'ab')
+            self._buffer = io.BytesIO()
+
+        if self._compression != CSVWriter.COMPRESSION_NONE:
+            # appending starts a new gzip member or zstd/lz4 frame, concatenated streams are valid
+            self._compressor = StreamCompressor(self._compression)
+
+        self._buffer_time = None
+
+        try:
+            self._current_file_size = os.path.getsize(self._file_path)
+        except OSError:
+            self._current_file_size = 0
 
-        self._csv_file = csv.writer(self._raw_file, delimiter=";", quotechar='"', quoting=csv.QUOTE_MINIMAL)
+        self._csv_file = csv.writer(self._buffer, delimiter=";", quotechar='"', quoting=csv.QUOTE_MINIMAL)
 
         # if the file is empty, create a csv header
         if self._file_is_empty():
@@ -364,13 +995,7 @@ class CSVWriter(object):
             True  - File is empty or missing
             False - File is not empty
         """
-        try:
-            if os.stat(self._file_path).st_size > 0:
-                return False
-            else:
-                return True
-        except OSError:
-            return True
+        return self._current_file_size == 0 and self._buffer.tell() == 0
 
     def _write_header(self):
         """Writes a csv header into the file"""
@@ -379,8 +1004,9 @@ class CSVWriter(object):
             return
 
         EventLogger.debug("CSVWriter._write_header() - done")
+        self._buffer_rows()
         self._csv_file.writerow(["TIME"] + ["NAME"] + ["UID"] + ["VAR"] + ["RAW"] + ["UNIT"])
-        self._raw_file.flush()
+        self.flush()
 
     def write_data_row(self, csv_data):
         """
@@ -389,16 +1015,60 @@ class CSVWriter(object):
             True  - Row was written into thee file
             False - Row was not written into the File
         """
+        return self.write_data_rows([csv_data])
+
+    def write_data_rows(self, csv_data_list):
+        """
+        Write rows into the csv file. The rows are buffered and written to the file according to the flush policy.
+        Return:
+            True  - Rows were written into the file
+            False - Rows were not written into the File
+        """
         if self._raw_file is None or self._csv_file is None:
             return False
 
-        self._csv_file.writerow([csv_data.timestamp] + [csv_data.name] + [csv_data.uid] + [csv_data.var_name] + [str(csv_data.raw_data)] + [csv_data.var_unit])
+        self._buffer_rows()
+        self._csv_file.writerows([[csv_data.timestamp, csv_data.name, csv_data.uid, csv_data.var_name,
+                                   str(csv_data.raw_data), csv_data.var_unit] for csv_data in csv_data_list])
+        self._flush_if_needed(self._buffer.tell())
+
+        return True
+
+    def _write_buffer(self):
+        """Writes the buffered rows into the file"""
+        if self._raw_file is None or self._buffer.tell() == 0:
+            return
+
+        data = self._buffer.getvalue()
+
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+        if sys.version_info >= (3, 0, 0):
+            data = data.encode('utf-8')
+
+        if self._compressor is not None:
+            self._uncompressed_bytes += len(data)
+            data = self._compressor.compress_block(data)
+            self._compressed_bytes += len(data)
+
+        self._raw_file.write(data)
         self._raw_file.flush()
 
+        self._current_file_size += len(data)
+
         if self._file_size > 0:
             self._rolling_file()
 
-        return True
+    def get_compression_ratio(self):
+        """
+        Returns the ratio of uncompressed to compressed size of the data written so far, 1.0 without compression
+        or if nothing was written yet
+        """
+        if self._compressed_bytes == 0:
+            return 1.0
+
+        return self._uncompressed_bytes / float(self._compressed_bytes)
 
     def set_file_path(self, new_file_path):
         """
@@ -437,6 +1107,16 @@ class CSVWriter(object):
         if self._raw_file is None or self._csv_file is None:
             return False
         try:
+            self.flush()
+
+            if self._compressor is not None:
+                trailer = self._compressor.finish()
+                self._compressor = None
+
+                self._raw_file.write(trailer)
+                self._current_file_size += len(trailer)
+                self._compressed_bytes += len(trailer)
+
             self._raw_file.close()
             self._csv_file = None
             self._raw_file = None
@@ -446,42 +1126,524 @@ class CSVWriter(object):
             return False
 
     def _rolling_file(self):
-        f_size = os.path.getsize(self._file_path)
-        if f_size > self._file_size:
+        if self._current_file_size > self._file_size:
             # self.set_file_path(self._create_new_file_name(self._file_path))
             EventLogger.info(
                 "Max Filesize(" + "%.3f" % (self._file_size / 1024.0 / 1024.0) + " MB) reached! Rolling Files...")
             self._roll_files()
 
-    # FIXME: only files with a . are working!
-    def _roll_files(self):
-        i = self._file_count
+    def _get_rolled_file_path(self, i):
+        """
+        Returns the path of the i-th historic file. The number is inserted in front of the extension of the file name
+        ("data.csv" -> "data(1).csv", "data.csv.gz" -> "data(1).csv.gz") or appended if the file name has no
+        extension ("data" -> "data(1)").
+        """
+        directory, file_name = os.path.split(self._file_path)
+
+        if len(self._extension) > 0:
+            file_name = file_name[:-len(self._extension)]
 
+        root, extension = os.path.splitext(file_name)
+
+        return os.path.join(directory, root + "(" + str(i) + ")" + extension + self._extension)
+
+    def _roll_files(self):
+        """
+        Rotates the files by renaming them, the data in the files is never copied. The oldest file is renamed first
+        and then removed by a background thread, so deleting a large file doesn't block the writer.
+        """
         self.close_file()
 
+        obsolete_file_path = None
+
+        try:
+            oldest_file_path = self._get_rolled_file_path(self._file_count)
+
+            if os.path.exists(oldest_file_path):
+                # every obsolete file gets its own name, so this can't collide with the removal of the previous one
+                self._obsolete_file_count += 1
+                obsolete_file_path = oldest_file_path + "." + str(self._obsolete_file_count) + ".obsolete"
+
+                # a file with the same name might be left over from an earlier run
+                try:
+                    os.remove(obsolete_file_path)
+                except OSError as e:
+                    if e.errno != errno.ENOENT:
+                        raise
+
+                os.rename(oldest_file_path, obsolete_file_path)
+
+            for i in range(self._file_count - 1, 0, -1):
+                tmp_file_path = self._get_rolled_file_path(i)
+
+                if os.path.exists(tmp_file_path):
+                    os.rename(tmp_file_path, self._get_rolled_file_path(i + 1))
+                    EventLogger.debug("Rolling Files... renamed File(" + str(i) + ") to (" + str(i + 1) + ")")
+
+            os.rename(self._file_path, self._get_rolled_file_path(1))
+            EventLogger.debug("Rolling Files... renamed original File to File(1)")
+        except OSError as e:
+            EventLogger.error("Rolling Files... failed: " + str(e))
+
+        self._open_file_A()
+
+        if obsolete_file_path is not None:
+            thread = Thread(target=self._remove_obsolete_file, args=(obsolete_file_path,))
+            thread.daemon = True
+            thread.start()
+
+    def _remove_obsolete_file(self, file_path):
+        try:
+            os.remove(file_path)
+            EventLogger.debug("Rolling Files... removed obsolete File " + str(file_path))
+        except OSError as e:
+            EventLogger.error("Rolling Files... could not remove obsolete File " + str(file_path) + ": " + str(e))
+
+class StreamCompressor(object):
+    """
+    Compresses the data of a CSVWriter block by block. Each block ends with a flush of the compressor, so everything
+    up to the last block can be decompressed even if the stream was not finished, e.g. after a crash.
+    """
+
+    def __init__(self, compression):
+        self._compression = compression
+
+        if compression == CSVWriter.COMPRESSION_GZIP:
+            self._compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) # 16 selects the gzip format
+        elif compression == CSVWriter.COMPRESSION_ZSTD:
+            self._compressor = zstandard.ZstdCompressor(level=3).compressobj()
+        elif compression == CSVWriter.COMPRESSION_LZ4:
+            self._compressor = None # every block is a complete lz4 frame
+        else:
+            raise Exception("Unknown compression! -> " + str(compression))
+
+    def compress_block(self, data):
+        if self._compression == CSVWriter.COMPRESSION_GZIP:
+            return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        elif self._compression == CSVWriter.COMPRESSION_ZSTD:
+            return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        else:
+            return lz4.frame.compress(data)
+
+    def finish(self):
+        """Returns the trailer of the stream, the compressor cannot be used afterwards"""
+        if self._compression == CSVWriter.COMPRESSION_GZIP:
+            return self._compressor.flush(zlib.Z_FINISH)
+        elif self._compression == CSVWriter.COMPRESSION_ZSTD:
+            return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+        else:
+            return b''
+
+'''
+/*---------------------------------------------------------------------------
+                                BinaryWriter
+ ---------------------------------------------------------------------------*/
+ '''
+
+
+class BinaryWriter(BufferedWriter):
+    """
+    This class writes logged data in a compact chunked binary format, which is used by the BinaryWriterJob class. Each
+    series of values (device name, UID, variable name and unit) is described once and its data is stored as an int64
+    timestamp array (microseconds since the epoch) and a typed value array. convert_binary_to_csv() converts such a
+    file back into the CSV layout of the CSVWriter.
+
+    File layout, all numbers are little-endian:
+        MAGIC
+        chunk*  -- chunk type (1 byte), payload length (uint32), payload
+
+    Chunk types:
+        H -- session start: time format, strftime time format. series IDs are only valid within a session
+        S -- series: series ID (uint32), value type (1 byte: q = int64, d = float64, ? = bool, s = string),
+             device name, UID, variable name, unit
+        D -- data: series ID (uint32), count (uint32), count int64 timestamps, count values
+        B -- batch end: the data chunks of one batch are sorted by time to restore the row order
+
+    Strings are UTF-8 with an uint16 length prefix, string values have an uint32 length prefix.
+    """
+
+    MAGIC = b'TFDL\x01'
+
+    def __init__(self, file_path, time_format='unix', time_format_strftime='',
+                 flush_interval=BufferedWriter.DEFAULT_FLUSH_INTERVAL, flush_size=BufferedWriter.DEFAULT_FLUSH_SIZE):
+        BufferedWriter.__init__(self, flush_interval, flush_size)
+
+        self._file_path = file_path
+        # check if file path exists
+        if not Utilities.check_file_path_exists(self._file_path):
+            raise Exception("File Path not found! -> " + str(self._file_path))
+
+        self._time_format = time_format
+        self._time_format_strftime = time_format_strftime
+        self._raw_file = None
+        self._series = {} # (name, uid, var_name, unit, value type) -> [series ID, timestamps, values]
+        self._buffer_size = 0 # estimated
+
+        self._open_file_A()
+
+    def _open_file_A(self):
+        """Opens a file in append mode and starts a new session."""
+        self._raw_file = open(self._file_path, 'ab')
+        self._series = {}
+
+        if self._raw_file.tell() == 0:
+            self._raw_file.write(BinaryWriter.MAGIC)
+
+        self._write_chunk(b'H', pack_string(self._time_format) + pack_string(self._time_format_strftime))
+        self._raw_file.flush()
+
+    def _write_chunk(self, chunk_type, payload):
+        self._raw_file.write(chunk_type + struct.pack('<I', len(payload)) + payload)
+
+    def write_data_row(self, csv_data):
+        return self.write_data_rows([csv_data])
+
+    def write_data_rows(self, csv_data_list):
+        """
+        Buffers the values of the rows, they are written according to the flush policy.
+        Return:
+            True  - Rows were written into the file
+            False - Rows were not written into the File
+        """
+        if self._raw_file is None:
+            return False
+
+        self._buffer_rows()
+
+        for csv_data in csv_data_list:
+            value = csv_data.raw_data
+
+            if isinstance(value, bool):
+                value_type = b'?'
+            elif isinstance(value, (int, long)) and -2 ** 63 <= value < 2 ** 63:
+                value_type = b'q'
+            elif isinstance(value, float):
+                value_type = b'd'
+            else:
+                value_type = b's'
+                value = str(value)
+
+            key = (csv_data.name, csv_data.uid, csv_data.var_name, csv_data.var_unit, value_type)
+
+            try:
+                series = self._series[key]
+            except KeyError:
+                series = [len(self._series), [], []]
+                self._series[key] = series
+
+                self._write_chunk(b'S', struct.pack('<I', series[0]) + value_type +
+                                        b''.join([pack_string(s) for s in key[:4]]))
+
+            if csv_data.unix_timestamp is None:
+                unix_timestamp = time.time()
+            else:
+                unix_timestamp = csv_data.unix_timestamp
+
+            series[1].append(int(round(unix_timestamp * 1000000)))
+            series[2].append(value)
+
+            self._buffer_size += 16
+
+        self._flush_if_needed(self._buffer_size)
+
+        return True
+
+    def _write_buffer(self):
+        """Writes the buffered values into the file"""
+        if self._raw_file is None:
+            return
+
+        # write the series in the order of their IDs, which is the order in which they were
+        # first logged. the stable sort in the converter keeps this order for equal timestamps
+        for key, series in sorted(self._series.items(), key=lambda item: item[1][0]):
+            series_id, timestamps, values = series
+            count = len(timestamps)
+
+            if count == 0:
+                continue
+
+            value_type = key[4]
+
+            if value_type == b's':
+                packed_values = b''.join([struct.pack('<I', len(value)) + value for value in values])
+            else:
+                packed_values = struct.pack('<' + str(count) + value_type, *values)
+
+            self._write_chunk(b'D', struct.pack('<II', series_id, count) +
+                                    struct.pack('<' + str(count) + 'q', *timestamps) + packed_values)
+
+            series[1] = []
+            series[2] = []
+
+        self._write_chunk(b'B', b'')
+        self._raw_file.flush()
+
+        self._buffer_size = 0
+
+    def close_file(self):
+        """
+        Tries to close the current file.
+        Return:
+            True  - File was close
+            False - File could not be closed
+        """
+        if self._raw_file is None:
+            return False
+
+        try:
+            self.flush()
+            self._raw_file.close()
+            self._raw_file = None
+            return True
+        except ValueError:
+            return False
+
+
+def pack_string(s):
+    if not isinstance(s, bytes):
+        s = s.encode('utf-8')
+
+    return struct.pack('<H', len(s)) + s
+
+
+def unpack_string(data, offset):
+    length = struct.unpack_from('<H', data, offset)[0]
+    offset += 2
+
+    return data[offset:offset + length], offset + length
+
+
+def convert_binary_to_csv(binary_file_path, csv_file_path, time_format=None, time_format_strftime=None):
+    """
+    Converts a file written by the BinaryWriter into the CSV layout of the CSVWriter. If no time format is given then
+    the time format stored in the binary file is used.
+    Return:
+        Number of converted rows
+    """
+    csv_writer = CSVWriter(csv_file_path)
+    row_count = 0
+    series = {}
+    batch = []
+
+    with open(binary_file_path, 'rb') as f:
+        if f.read(len(BinaryWriter.MAGIC)) != BinaryWriter.MAGIC:
+            csv_writer.close_file()
+            raise Exception("Not a binary data logger file: " + str(binary_file_path))
+
+        session_time_format = 'unix'
+        session_time_format_strftime = ''
+
         while True:
-            if i == 0:
-                # first file reached
+            header = f.read(5)
+
+            if len(header) < 5: # end of file, a truncated chunk is ignored
                 break
 
-            tmp_file_name = Utilities.replace_right(self._file_path, ".", "(" + str(i) + ").", 1)
+            chunk_type = header[0:1]
+            length = struct.unpack('<I', header[1:5])[0]
+            payload = f.read(length)
 
-            if os.path.exists(tmp_file_name):
-                if i == self._file_count:
-                    # max file count -> delete
-                    os.remove(tmp_file_name)
-                    EventLogger.debug("Rolling Files... removed File(" + str(i) + ")")
+            if len(payload) < length:
+                break
 
+            if chunk_type == b'H':
+                session_time_format, offset = unpack_string(payload, 0)
+                session_time_format_strftime, offset = unpack_string(payload, offset)
+                series = {}
+            elif chunk_type == b'S':
+                series_id = struct.unpack_from('<I', payload, 0)[0]
+                value_type = payload[4:5]
+                strings = []
+                offset = 5
+
+                for i in range(4):
+                    s, offset = unpack_string(payload, offset)
+                    strings.append(s)
+
+                series[series_id] = (value_type, strings)
+            elif chunk_type == b'D':
+                series_id, count = struct.unpack_from('<II', payload, 0)
+                value_type, strings = series[series_id]
+                timestamps = struct.unpack_from('<' + str(count) + 'q', payload, 8)
+                offset = 8 + count * 8
+
+                if value_type == b's':
+                    values = []
+
+                    for i in range(count):
+                        value_length = struct.unpack_from('<I', payload, offset)[0]
+                        offset += 4
+                        values.append(payload[offset:offset + value_length])
+                        offset += value_length
                 else:
-                    # copy file and remove old
-                    copyfile(tmp_file_name, Utilities.replace_right(self._file_path, ".", "(" + str(i + 1) + ").", 1))
-                    EventLogger.debug("Rolling Files... copied File(" + str(i) + ") into (" + str(i + 1) + ")")
-                    os.remove(tmp_file_name)
+                    values = struct.unpack_from('<' + str(count) + value_type, payload, offset)
 
-            i -= 1
+                for i in range(count):
+                    batch.append((timestamps[i], strings, values[i]))
+            elif chunk_type == b'B':
+                row_count += write_binary_batch_to_csv(csv_writer, batch,
+                                                       time_format or session_time_format,
+                                                       time_format_strftime or session_time_format_strftime)
+                batch = []
 
-        if self._file_count != 0:
-            copyfile(self._file_path, Utilities.replace_right(self._file_path, ".", "(" + str(1) + ").", 1))
-            EventLogger.debug("Rolling Files... copied original File into File(1)")
-        os.remove(self._file_path)
-        self._open_file_A()
+    row_count += write_binary_batch_to_csv(csv_writer, batch,
+                                           time_format or session_time_format,
+                                           time_format_strftime or session_time_format_strftime)
+    csv_writer.close_file()
+
+    return row_count
+
+
+def write_binary_batch_to_csv(csv_writer, batch, time_format, time_format_strftime):
+    batch.sort(key=lambda row: row[0])
+
+    csv_writer.write_data_rows([CSVData(format_timestamp(timestamp / 1000000.0, time_format, time_format_strftime),
+                                        strings[0], strings[1], strings[2], value, strings[3])
+                                for timestamp, strings, value in batch])
+
+    return len(batch)
+
+'''
+/*---------------------------------------------------------------------------
+                                SQLiteWriter
+ ---------------------------------------------------------------------------*/
+ '''
+
+
+class SQLiteWriter(BufferedWriter):
+    """
+    This class writes logged data into a SQLite database, which is used by the SQLiteWriterJob class. Each series of
+    values (device name, UID, variable name and unit) is stored once in the series table, the samples table only
+    holds the series ID, the time in microseconds since the epoch and the value. The samples are indexed by series
+    and time, so range queries for a device and variable are index lookups. The data view joins both tables.
+
+    The database uses WAL mode and the buffered rows are inserted in one transaction per flush.
+    """
+
+    SCHEMA = [
+        'CREATE TABLE IF NOT EXISTS series (id INTEGER PRIMARY KEY, name TEXT NOT NULL, uid TEXT NOT NULL, '
+        'var_name TEXT NOT NULL, unit TEXT NOT NULL, UNIQUE (name, uid, var_name, unit))',
+        'CREATE TABLE IF NOT EXISTS samples (series_id INTEGER NOT NULL REFERENCES series (id), '
+        'time INTEGER NOT NULL, value)',
+        'CREATE INDEX IF NOT EXISTS samples_series_time ON samples (series_id, time)',
+        'CREATE VIEW IF NOT EXISTS data AS SELECT samples.time AS time, series.name AS name, series.uid AS uid, '
+        'series.var_name AS var_name, samples.value AS value, series.unit AS unit '
+        'FROM samples JOIN series ON samples.series_id = series.id'
+    ]
+
+    def __init__(self, file_path, flush_interval=BufferedWriter.DEFAULT_FLUSH_INTERVAL,
+                 flush_size=BufferedWriter.DEFAULT_FLUSH_SIZE):
+        BufferedWriter.__init__(self, flush_interval, flush_size)
+
+        self._file_path = file_path
+        # check if file path exists
+        if not Utilities.check_file_path_exists(self._file_path):
+            raise Exception("File Path not found! -> " + str(self._file_path))
+
+        self._connection = None
+        self._series = {} # (name, uid, var_name, unit) -> series ID
+        self._rows = [] # (series ID, time, value) tuples
+        self._buffer_size = 0 # estimated
+
+        self._open_database()
+
+    def _open_database(self):
+        # the connection is created in the thread of the job and only used there
+        self._connection = sqlite3.connect(self._file_path)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        # in WAL mode this can only lose the latest transactions on power loss, but never corrupts the database
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+
+        with self._connection:
+            for statement in SQLiteWriter.SCHEMA:
+                self._connection.execute(statement)
+
+    def _get_series_id(self, key):
+        try:
+            return self._series[key]
+        except KeyError:
+            pass
+
+        with self._connection:
+            self._connection.execute('INSERT OR IGNORE INTO series (name, uid, var_name, unit) VALUES (?, ?, ?, ?)',
+                                     key)
+            series_id = self._connection.execute('SELECT id FROM series WHERE name = ? AND uid = ? AND '
+                                                 'var_name = ? AND unit = ?', key).fetchone()[0]
+
+        self._series[key] = series_id
+
+        return series_id
+
+    def write_data_row(self, csv_data):
+        return self.write_data_rows([csv_data])
+
+    def write_data_rows(self, csv_data_list):
+        """
+        Buffers the rows, they are inserted according to the flush policy.
+        Return:
+            True  - Rows were written into the database
+            False - Rows were not written into the database
+        """
+        if self._connection is None:
+            return False
+
+        self._buffer_rows()
+
+        for csv_data in csv_data_list:
+            value = csv_data.raw_data
+
+            if isinstance(value, bool):
+                value = int(value)
+            elif not isinstance(value, (int, long, float)):
+                value = to_unicode(str(value))
+
+            key = (to_unicode(csv_data.name), to_unicode(csv_data.uid),
+                   to_unicode(csv_data.var_name), to_unicode(csv_data.var_unit))
+
+            if csv_data.unix_timestamp is None:
+                unix_timestamp = time.time()
+            else:
+                unix_timestamp = csv_data.unix_timestamp
+
+            self._rows.append((self._get_series_id(key), int(round(unix_timestamp * 1000000)), value))
+            self._buffer_size += 24
+
+        self._flush_if_needed(self._buffer_size)
+
+        return True
+
+    def _write_buffer(self):
+        """Inserts the buffered rows in one transaction"""
+        if self._connection is None:
+            return
+
+        with self._connection:
+            self._connection.executemany('INSERT INTO samples (series_id, time, value) VALUES (?, ?, ?)', self._rows)
+
+        self._rows = []
+        self._buffer_size = 0
+
+    def close_file(self):
+        """
+        Tries to close the database.
+        Return:
+            True  - Database was closed
+            False - Database could not be closed
+        """
+        if self._connection is None:
+            return False
+
+        try:
+            self.flush()
+            self._connection.close()
+            self._connection = None
+            return True
+        except sqlite3.Error:
+            return False
+
+
+def to_unicode(s):
+    if isinstance(s, bytes):
+        return s.decode('utf-8')
+
+    return s
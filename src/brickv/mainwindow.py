@@ -59,7 +59,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         signal.signal(signal.SIGINT, self.exit_brickv)
         signal.signal(signal.SIGTERM, self.exit_brickv)
 
-        self.async_thread = async_start_thread(self)
+        self.async_threads = async_start_thread(self)
 
         self.setWindowTitle("Brick Viewer " + config.BRICKV_VERSION)
 
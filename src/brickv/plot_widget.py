@@ -25,14 +25,30 @@ Boston, MA 02111-1307, USA.
 import sys
 import math
 import functools
-import bisect
+import weakref
+import struct
+import csv
+import tempfile
+from array import array
+from collections import deque
+
+try:
+    import numpy
+    has_numpy = True
+except ImportError:
+    has_numpy = False
 
 from PyQt4.QtGui import QVBoxLayout, QHBoxLayout, QWidget, QToolButton, \
                         QPainter, QSizePolicy, QFontMetrics, QPixmap, \
-                        QIcon, QColor, QPainterPath, QLabel, QTransform
-from PyQt4.QtCore import QTimer, Qt, QSize, QRectF, QLineF
+                        QIcon, QColor, QPainterPath, QLabel, QTransform, \
+                        QAction, QMessageBox
+from PyQt4.QtCore import QObject, QTimer, Qt, QSize
+
+from brickv.callback_emulator import get_time
+from brickv.utils import get_save_file_name, get_main_window, get_home_path
 
 EPSILON = 0.000001
+NAN = float('nan')
 DEBUG = False
 
 def istr(i):
@@ -55,6 +71,397 @@ def fuzzy_leq(a, b):
 def fuzzy_geq(a, b):
     return a > b or fuzzy_eq(a, b)
 
+class RingBuffer(object):
+    """
+    Circular buffer for a fixed number of float columns with a fixed
+    capacity. If the buffer is full then appending a value overwrites the
+    oldest one. Values are addressed by their absolute index since the last
+    clear. Appending and dropping values is O(1). A slice of a column is
+    only copied if it wraps around the end of the storage.
+    """
+
+    def __init__(self, column_count, capacity):
+        self.column_count = column_count
+        self.capacity = max(capacity, 1)
+        self.columns = [self.allocate(self.capacity) for i in range(column_count)]
+        self.start = 0 # absolute index of the first value
+        self.end = 0 # absolute index after the last value
+
+    def allocate(self, capacity):
+        if has_numpy:
+            return numpy.zeros(capacity, dtype=float)
+        else:
+            return array('d', [0.0]) * capacity
+
+    def __len__(self):
+        return self.end - self.start
+
+    def append(self, *values):
+        if self.end - self.start == self.capacity:
+            self.start += 1
+
+        k = self.end % self.capacity
+
+        for column, value in zip(self.columns, values):
+            column[k] = value
+
+        self.end += 1
+
+    def drop_front(self, start):
+        self.start = max(self.start, min(start, self.end))
+
+    # returns the values of column i from absolute index start to end
+    def column(self, i, start=None, end=None):
+        if start == None:
+            start = self.start
+        else:
+            start = max(self.start, min(start, self.end))
+
+        if end == None:
+            end = self.end
+        else:
+            end = max(start, min(end, self.end))
+
+        column = self.columns[i]
+        k = start % self.capacity
+        n = end - start
+
+        if k + n <= self.capacity:
+            return column[k:k + n]
+
+        if has_numpy:
+            return numpy.concatenate((column[k:], column[:k + n - self.capacity]))
+        else:
+            return column[k:] + column[:k + n - self.capacity]
+
+    def get(self, i, index):
+        return float(self.columns[i][index % self.capacity])
+
+class CurveBuffer(object):
+    """
+    Stores the x and y values of a curve. A NaN y value marks a gap in the
+    curve. The minimum and maximum y value of the current window are tracked
+    with monotonic deques. At most capacity values are kept, if the buffer is
+    full then the oldest value is overwritten.
+
+    Additionally a pyramid of min/max decimation levels is maintained. An
+    entry at level k covers 2^k consecutive values, starting at absolute
+    index j * 2^k, and stores the first x value and the minimum and maximum
+    y value of them. This allows to draw long histories with a number of
+    line segments that is proportional to the width of the plot instead of
+    the number of values. An entry that only covers gaps is a gap itself.
+    """
+
+    LEVEL_COUNT = 16 # coarsest level covers 2^16 values per entry
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.clear()
+
+    def clear(self):
+        self.values = RingBuffer(2, self.capacity) # x, y
+        self.min_deque = deque() # (index, y) with increasing y
+        self.max_deque = deque() # (index, y) with decreasing y
+        # +2 for the entries that partially cover dropped values
+        self.levels = [RingBuffer(3, (self.capacity >> (k + 1)) + 2) # x, y-min, y-max
+                       for k in range(CurveBuffer.LEVEL_COUNT)]
+        self.pending = [None] * CurveBuffer.LEVEL_COUNT # incomplete entry per level
+
+    def __len__(self):
+        return len(self.values)
+
+    def free_capacity(self):
+        return self.capacity - len(self.values)
+
+    def append(self, x, y):
+        index = self.values.end
+        start = self.values.start
+
+        self.values.append(x, y)
+
+        if self.values.start != start:
+            self.drop_outdated()
+
+        if y == y: # not NaN
+            while len(self.min_deque) > 0 and self.min_deque[-1][1] >= y:
+                self.min_deque.pop()
+
+            while len(self.max_deque) > 0 and self.max_deque[-1][1] <= y:
+                self.max_deque.pop()
+
+            self.min_deque.append((index, y))
+            self.max_deque.append((index, y))
+
+        # propagate the value up the decimation levels, an entry of a level
+        # is complete after two entries of the level below were merged into it
+        entry = (x, y, y)
+
+        for k in range(CurveBuffer.LEVEL_COUNT):
+            pending = self.pending[k]
+
+            if pending == None:
+                self.pending[k] = entry
+                break
+
+            if pending[1] != pending[1]: # NaN
+                entry = (pending[0], entry[1], entry[2])
+            elif entry[1] == entry[1]: # not NaN
+                entry = (pending[0], min(pending[1], entry[1]), max(pending[2], entry[2]))
+            else:
+                entry = pending
+
+            self.pending[k] = None
+            self.levels[k].append(*entry)
+
+    def drop_front(self, count):
+        start = self.values.start + count
+
+        self.values.drop_front(start)
+        self.drop_outdated()
+
+    def drop_outdated(self):
+        while len(self.min_deque) > 0 and self.min_deque[0][0] < self.values.start:
+            self.min_deque.popleft()
+
+        while len(self.max_deque) > 0 and self.max_deque[0][0] < self.values.start:
+            self.max_deque.popleft()
+
+        # keep level entries that cover the first remaining value
+        for k, level in enumerate(self.levels):
+            level.drop_front(self.values.start >> (k + 1))
+
+    # start and end are absolute indexes
+    def x_values(self, start=None, end=None):
+        return self.values.column(0, start, end)
+
+    def y_values(self, start=None, end=None):
+        return self.values.column(1, start, end)
+
+    def first_x(self):
+        if len(self.values) == 0:
+            return None
+
+        return self.values.get(0, self.values.start)
+
+    def last_x(self):
+        if len(self.values) == 0:
+            return None
+
+        return self.values.get(0, self.values.end - 1)
+
+    def y_min(self):
+        if len(self.min_deque) == 0:
+            return None
+
+        return self.min_deque[0][1]
+
+    def y_max(self):
+        if len(self.max_deque) == 0:
+            return None
+
+        return self.max_deque[0][1]
+
+    def level_for(self, values_per_pixel):
+        # pick the coarsest level that still has at least one entry per pixel
+        k = 0
+
+        while k < CurveBuffer.LEVEL_COUNT and 2 ** (k + 1) <= values_per_pixel and len(self.levels[k]) > 0:
+            k += 1
+
+        return k
+
+    def decimated_values(self, k):
+        """
+        Returns the x, y-min and y-max values of decimation level k and the
+        x and y values that are not yet covered by a complete entry of it.
+        Level 0 is the undecimated data.
+        """
+
+        if k == 0:
+            return None, None, None, self.x_values(), self.y_values()
+
+        level = self.levels[k - 1]
+        tail_start = level.end << k
+
+        return level.column(0), level.column(1), level.column(2), \
+               self.x_values(tail_start), self.y_values(tail_start)
+
+def append_to_path(path, curve_x, curve_y):
+    # NaN y values break the line
+    connected = False
+
+    for i in xrange(len(curve_x)):
+        y = curve_y[i]
+
+        if y != y:
+            connected = False
+        elif connected:
+            path.lineTo(curve_x[i], y)
+        else:
+            path.moveTo(curve_x[i], y)
+            connected = True
+
+    return connected
+
+def append_level_to_path(path, level_x, level_y_min, level_y_max):
+    # draws the min/max envelope, gap entries break the line
+    connected = False
+
+    for i in xrange(len(level_x)):
+        y_min = level_y_min[i]
+
+        if y_min != y_min:
+            connected = False
+            continue
+
+        if connected:
+            path.lineTo(level_x[i], y_min)
+        else:
+            path.moveTo(level_x[i], y_min)
+            connected = True
+
+        path.lineTo(level_x[i], level_y_max[i])
+
+def to_list(values):
+    if has_numpy and isinstance(values, numpy.ndarray):
+        return values.tolist()
+
+    return values
+
+class HistorySpill(object):
+    """
+    Bounded on-disk store for values that dropped out of the plot history.
+    The values are appended as (curve, x, y) records to a temporary segment
+    file. If the current segment reaches half of max_size the previous one
+    is discarded and a new segment is started, so that at most max_size
+    bytes are kept on disk.
+    """
+
+    RECORD = struct.Struct('<Hdd')
+
+    def __init__(self, max_size):
+        self.segment_size = max(max_size // 2, HistorySpill.RECORD.size)
+        self.segments = [] # temporary files, oldest first
+        self.counts = [] # per segment record count
+
+    def __len__(self):
+        return sum(self.counts)
+
+    def put(self, c, curve_x, curve_y):
+        if len(self.segments) == 0 or self.segments[-1].tell() >= self.segment_size:
+            if len(self.segments) == 2:
+                self.segments.pop(0).close()
+                self.counts.pop(0)
+
+            self.segments.append(tempfile.TemporaryFile())
+            self.counts.append(0)
+
+        pack = HistorySpill.RECORD.pack
+        curve_x = to_list(curve_x)
+        curve_y = to_list(curve_y)
+
+        self.segments[-1].write(b''.join([pack(c, curve_x[i], curve_y[i]) for i in xrange(len(curve_x))]))
+        self.counts[-1] += len(curve_x)
+
+    # yields (c, curve_x, curve_y) tuples in the order the values were put
+    def iterate(self, chunk_size):
+        record_size = HistorySpill.RECORD.size
+        unpack_from = HistorySpill.RECORD.unpack_from
+
+        for f in self.segments:
+            end = f.tell()
+
+            f.seek(0)
+
+            try:
+                while f.tell() < end:
+                    data = f.read(min(chunk_size * record_size, end - f.tell()))
+                    last_c = None
+
+                    for offset in xrange(0, len(data) - record_size + 1, record_size):
+                        c, x, y = unpack_from(data, offset)
+
+                        if c != last_c:
+                            if last_c != None:
+                                yield last_c, curve_x, curve_y
+
+                            last_c = c
+                            curve_x = []
+                            curve_y = []
+
+                        curve_x.append(x)
+                        curve_y.append(y)
+
+                    if last_c != None:
+                        yield last_c, curve_x, curve_y
+            finally:
+                f.seek(end)
+
+    def clear(self):
+        for f in self.segments:
+            f.close()
+
+        self.segments = []
+        self.counts = []
+
+def values_to_bytes(values):
+    # little-endian float64
+    if has_numpy:
+        values = numpy.asarray(values, dtype='<f8')
+    else:
+        values = array('d', values)
+
+        if sys.byteorder == 'big':
+            values.byteswap()
+
+    return getattr(values, 'tobytes', getattr(values, 'tostring', None))()
+
+def export_csv(f, names, chunks):
+    writer = csv.writer(f)
+
+    writer.writerow(['Curve', 'Time [s]', 'Value'])
+
+    for c, curve_x, curve_y in chunks:
+        name = names[c]
+        curve_x = to_list(curve_x)
+        curve_y = to_list(curve_y)
+
+        # NaN values mark gaps and are not exported
+        writer.writerows([(name, '{0:.6f}'.format(curve_x[i]), repr(curve_y[i]))
+                          for i in xrange(len(curve_x)) if curve_y[i] == curve_y[i]])
+
+def export_npy(f, count, chunks):
+    # NPY format version 1.0 with a (curve, x, y) record per value
+    header = "{{'descr': [('curve', '<u2'), ('x', '<f8'), ('y', '<f8')], 'fortran_order': False, 'shape': ({0},), }}".format(count)
+    header += ' ' * (15 - (10 + len(header)) % 16) + '\n'
+
+    f.write(b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode('ascii'))
+
+    pack = HistorySpill.RECORD.pack
+
+    for c, curve_x, curve_y in chunks:
+        curve_x = to_list(curve_x)
+        curve_y = to_list(curve_y)
+
+        f.write(b''.join([pack(c, curve_x[i], curve_y[i]) for i in xrange(len(curve_x))]))
+
+def export_binary(f, names, chunks):
+    # header: 'BVPH', version, curve count and length prefixed UTF-8 curve
+    # names. followed by blocks: curve, value count, x values, y values.
+    # all numbers are little-endian, x and y values are float64
+    f.write(b'BVPH' + struct.pack('<HH', 1, len(names)))
+
+    for name in names:
+        if not isinstance(name, bytes):
+            name = name.encode('utf-8')
+
+        f.write(struct.pack('<H', len(name)) + name)
+
+    for c, curve_x, curve_y in chunks:
+        f.write(struct.pack('<HI', c, len(curve_x)))
+        f.write(values_to_bytes(curve_x))
+        f.write(values_to_bytes(curve_y))
+
 class Scale(object):
     def __init__(self, tick_text_font, title_text_font):
         self.axis_line_thickness = 1 # px, fixed
@@ -309,28 +716,42 @@ class YScale(Scale):
         painter.restore()
 
 class CurveArea(QWidget):
+    """
+    Draws the curves into a backing pixmap. If the plot moves on, the
+    pixmap is scrolled to the left by the moved distance and only the newly
+    added line segments are drawn. The pixmap is fully redrawn only if its
+    size, the y-scale or the curve visibility changes.
+    """
+
     def __init__(self, plot):
         QWidget.__init__(self, plot)
 
         self.plot = plot
+        self.pixmap = None
+        self.pixmap_state = None # (width, height, y-min-scale, y-max-scale, curves-visible)
+        self.pixmap_anchor_x = None # x value that maps to the left pixmap border
+        self.drawn_ends = [] # per curve absolute index after the last drawn value
 
         # FIXME: need to enable opaque painting to avoid that updates of other
         #        widgets trigger a full update of the curve
         self.setAttribute(Qt.WA_OpaquePaintEvent, True)
 
+    def invalidate(self):
+        self.pixmap_state = None
+
     # override QWidget.paintEvent
     def paintEvent(self, event):
+        self.update_pixmap()
+
         painter = QPainter(self)
+        painter.drawPixmap(event.rect(), self.pixmap, event.rect())
+
+    def update_pixmap(self):
         width = self.width()
         height = self.height()
-
-        if DEBUG:
-            painter.fillRect(0, 0, width, height, Qt.blue)
-        else:
-            painter.fillRect(event.rect(), self.plot.canvas_color)
-
         y_min_scale = self.plot.y_scale.value_min
         y_max_scale = self.plot.y_scale.value_max
+        state = (width, height, y_min_scale, y_max_scale, tuple(self.plot.curves_visible))
 
         factor_x = float(width) / self.plot.history_length_x
         factor_y = float(height - 1) / max(y_max_scale - y_min_scale, EPSILON) # -1 to accommodate the 1px width of the curve
@@ -340,59 +761,121 @@ class CurveArea(QWidget):
             x_max = self.plot.x_max
 
             if self.plot.curve_start == 'left':
-                curve_x_offset = 0
+                anchor_x = x_min
             else:
-                curve_x_offset = round((self.plot.history_length_x - (x_max - x_min)) * factor_x)
+                anchor_x = x_min - round((self.plot.history_length_x - (x_max - x_min)) * factor_x) / factor_x
+        else:
+            anchor_x = None
+
+        if self.pixmap == None or state != self.pixmap_state or anchor_x == None or self.pixmap_anchor_x == None:
+            self.redraw_pixmap(state, anchor_x, factor_x, factor_y)
+            return
 
-            transform = QTransform()
+        shift = int(round((anchor_x - self.pixmap_anchor_x) * factor_x))
 
-            transform.translate(curve_x_offset,
-                                height - 1 + self.plot.curve_y_offset) # -1 to accommodate the 1px width of the curve
-            transform.scale(factor_x, -factor_y)
-            transform.translate(-x_min, -y_min_scale)
+        if shift < 0 or shift >= width:
+            self.redraw_pixmap(state, anchor_x, factor_x, factor_y)
+            return
 
-            if self.plot.curve_motion_granularity > 1:
-                self.plot.partial_update_width = math.ceil(transform.map(QLineF(0, 0, 1.5, 0)).length())
-                inverted_event_rect = transform.inverted()[0].mapRect(QRectF(event.rect()))
+        if shift > 0:
+            self.pixmap.scroll(-shift, 0, self.pixmap.rect())
+            self.pixmap_anchor_x += shift / factor_x
 
-            painter.save()
-            painter.setTransform(transform)
+            painter = QPainter(self.pixmap)
+            painter.fillRect(width - shift, 0, shift, height, self.plot.canvas_color)
+        else:
+            painter = QPainter(self.pixmap)
 
-            for c in range(len(self.plot.curves_x)):
-                if not self.plot.curves_visible[c]:
-                    continue
+        painter.setTransform(self.get_transform(factor_x, factor_y))
 
-                curve_x = self.plot.curves_x[c]
-                curve_y = self.plot.curves_y[c]
-                path = QPainterPath()
-                lineTo = path.lineTo
+        for c in range(len(self.plot.curves)):
+            curve = self.plot.curves[c]
+            values = curve.values
+            start = max(self.drawn_ends[c] - 1, values.start)
 
-                if self.plot.curve_motion_granularity > 1:
-                    start = max(min(bisect.bisect_left(curve_x, inverted_event_rect.left()), len(curve_x) - 1) - 1, 0)
-                else:
-                    start = 0
+            self.drawn_ends[c] = values.end
+
+            if not self.plot.curves_visible[c] or values.end - start < 2:
+                continue
+
+            curve_x = to_list(curve.x_values(start))
+            curve_y = to_list(curve.y_values(start))
+            path = QPainterPath()
 
-                path.moveTo(curve_x[start], curve_y[start])
+            append_to_path(path, curve_x, curve_y)
 
-                for i in xrange(start + 1, len(curve_x)):
-                    lineTo(curve_x[i], curve_y[i])
+            painter.setPen(self.plot.configs[c][1])
+            painter.drawPath(path)
 
-                painter.setPen(self.plot.configs[c][1])
-                painter.drawPath(path)
+    def get_transform(self, factor_x, factor_y):
+        transform = QTransform()
 
-            painter.restore()
+        transform.translate(0, self.height() - 1 + self.plot.curve_y_offset) # -1 to accommodate the 1px width of the curve
+        transform.scale(factor_x, -factor_y)
+        transform.translate(-self.pixmap_anchor_x, -self.plot.y_scale.value_min)
+
+        return transform
+
+    def redraw_pixmap(self, state, anchor_x, factor_x, factor_y):
+        width = self.width()
+        height = self.height()
+
+        if self.pixmap == None or self.pixmap.size() != self.size():
+            self.pixmap = QPixmap(max(width, 1), max(height, 1))
+
+        self.pixmap_state = state
+        self.pixmap_anchor_x = anchor_x
+        self.drawn_ends = [curve.values.end for curve in self.plot.curves]
+
+        painter = QPainter(self.pixmap)
+
+        if DEBUG:
+            painter.fillRect(0, 0, width, height, Qt.blue)
+        else:
+            painter.fillRect(0, 0, width, height, self.plot.canvas_color)
+
+        if anchor_x == None:
+            return
+
+        painter.setTransform(self.get_transform(factor_x, factor_y))
+
+        for c in range(len(self.plot.curves)):
+            curve = self.plot.curves[c]
+
+            if not self.plot.curves_visible[c] or len(curve) == 0:
+                continue
+
+            values_per_pixel = len(curve) / max((curve.last_x() - curve.first_x()) * factor_x, 1.0)
+            level_x, level_y_min, level_y_max, curve_x, curve_y = curve.decimated_values(curve.level_for(values_per_pixel))
+            path = QPainterPath()
+
+            if level_x != None:
+                append_level_to_path(path, to_list(level_x), to_list(level_y_min), to_list(level_y_max))
+
+                # the tail is drawn as a separate line, to keep it connected
+                # to the envelope start it with the last level entry
+                if len(level_x) > 0:
+                    curve_x = [level_x[-1]] + list(to_list(curve_x))
+                    curve_y = [level_y_max[-1]] + list(to_list(curve_y))
+
+            append_to_path(path, to_list(curve_x), to_list(curve_y))
+
+            painter.setPen(self.plot.configs[c][1])
+            painter.drawPath(path)
 
 class Plot(QWidget):
     def __init__(self, parent, y_scale_title_text, configs, scales_visible=True,
                  curve_outer_border_visible=True, curve_motion_granularity=10,
-                 canvas_color=QColor(245, 245, 245), curve_start='left'):
+                 canvas_color=QColor(245, 245, 245), curve_start='left',
+                 history_length_x=20, history_capacity=1000):
         QWidget.__init__(self, parent)
 
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
         self.configs = configs
         self.scales_visible = scales_visible
-        self.history_length_x = 20 # seconds
+        self.history_length_x = history_length_x # seconds
+        self.history_capacity = history_capacity # values per curve
 
         if curve_outer_border_visible:
             self.curve_outer_border = 5 # px, fixed
@@ -410,8 +893,6 @@ class Plot(QWidget):
         self.curve_to_scale = 8 # px, fixed
         self.canvas_color = canvas_color
         self.curve_start = curve_start
-        self.partial_update_width = 50 # px, initial value, calculated in update
-        self.partial_update_enabled = False
 
         self.tick_text_font = self.font()
 
@@ -427,6 +908,7 @@ class Plot(QWidget):
 
         self.curve_area = CurveArea(self)
         self.y_scale.total_width_changed = self.resize_curve_area
+        self.spill = None
 
         self.clear_graph()
         self.resize_curve_area()
@@ -581,8 +1063,15 @@ class Plot(QWidget):
             else:
                 self.y_max = max(self.y_max, y)
 
-        self.curves_x[c].append(x)
-        self.curves_y[c].append(y)
+        curve = self.curves[c]
+
+        if self.curves_gap_pending[c]:
+            self.curves_gap_pending[c] = False
+
+            if len(curve) > 0:
+                curve.append(x, NAN)
+
+        curve.append(x, y)
 
         if self.curves_x_min[c] == None:
             self.curves_x_min[c] = x
@@ -600,38 +1089,32 @@ class Plot(QWidget):
         else:
             self.curves_y_max[c] = max(self.curves_y_max[c], y)
 
-        if len(self.curves_x[c]) > 0:
-            if (self.curves_x[c][-1] - self.curves_x[c][0]) >= self.history_length_x:
-                self.curves_x[c] = self.curves_x[c][self.curve_motion_granularity:]
-                self.curves_y[c] = self.curves_y[c][self.curve_motion_granularity:]
+        if len(curve) > 0:
+            # also drop values if there is no room for another gap and value
+            # left, before the curve buffer overwrites them unspilled
+            if (curve.last_x() - curve.first_x()) >= self.history_length_x or curve.free_capacity() < 2:
+                count = max(self.curve_motion_granularity, 2)
+                end = curve.values.start + count
 
-                if len(self.curves_x[c]) > 0:
-                    self.curves_x_min[c] = self.curves_x[c][0]
-                else:
-                    self.curves_x_min[c] = None
+                if self.spill != None:
+                    self.spill.put(c, curve.x_values(None, end), curve.y_values(None, end))
 
-                if len(self.curves_x[c]) > 0:
-                    self.curves_x_max[c] = self.curves_x[c][-1]
-                else:
-                    self.curves_x_max[c] = None
+                curve.drop_front(count)
 
-                self.curves_y_min[c] = min(self.curves_y[c])
-                self.curves_y_max[c] = max(self.curves_y[c])
+                self.curves_x_min[c] = curve.first_x()
+                self.curves_x_max[c] = curve.last_x()
+                self.curves_y_min[c] = curve.y_min()
+                self.curves_y_max[c] = curve.y_max()
 
                 self.update_x_min_max_y_min_max()
-
-                self.partial_update_enabled = True
             else:
-                self.curves_x_max[c] = self.curves_x[c][-1]
+                self.curves_x_max[c] = curve.last_x()
                 self.x_max = min(self.curves_x_max)
 
         if self.curves_visible[c] and (last_y_min != self.y_min or last_y_max != self.y_max):
             self.update_y_min_max_scale()
 
-        if self.partial_update_enabled and self.curve_motion_granularity > 1:
-            self.curve_area.update(self.curve_area.width() - self.partial_update_width, 0, self.partial_update_width, self.curve_area.height())
-        else:
-            self.curve_area.update()
+        self.curve_area.update()
 
     def update_x_min_max_y_min_max(self):
         last_x_min, last_x_max, last_y_min, last_y_max = self.x_min, self.x_max, self.y_min, self.y_max
@@ -741,17 +1224,48 @@ class Plot(QWidget):
         self.update()
         self.curve_area.update()
 
+    # the line of curve c is broken between the last and the next value
+    def add_gap(self, c):
+        self.curves_gap_pending[c] = True
+
+    # keep up to max_size bytes of values that dropped out of the history
+    # on disk, so that they are included in get_history()
+    def enable_spill(self, max_size):
+        if self.spill != None:
+            self.spill.clear()
+
+        self.spill = HistorySpill(max_size)
+
+    def get_history_length(self):
+        length = sum([len(curve) for curve in self.curves])
+
+        if self.spill != None:
+            length += len(self.spill)
+
+        return length
+
+    # yields (c, curve_x, curve_y) tuples of at most chunk_size values, first
+    # the spilled values then the values in memory. NaN values mark gaps
+    def get_history(self, chunk_size=4096):
+        if self.spill != None:
+            for chunk in self.spill.iterate(chunk_size):
+                yield chunk
+
+        for c, curve in enumerate(self.curves):
+            curve_x = curve.x_values()
+            curve_y = curve.y_values()
+
+            for i in xrange(0, len(curve_x), chunk_size):
+                yield c, curve_x[i:i + chunk_size], curve_y[i:i + chunk_size]
+
     def clear_graph(self):
         count = len(self.configs)
 
         if not hasattr(self, 'curves_visible'):
             self.curves_visible = [True]*count # per curve visibility
 
-        def new_list():
-            return []
-
-        self.curves_x = [new_list() for i in range(count)] # per curve x values
-        self.curves_y = [new_list() for i in range(count)] # per curve y values
+        self.curves = [CurveBuffer(self.history_capacity) for i in range(count)] # per curve x and y values
+        self.curves_gap_pending = [False]*count # per curve gap before the next value
         self.curves_x_min = [None]*count # per curve minimum x value
         self.curves_x_max = [None]*count # per curve maximum x value
         self.curves_y_min = [None]*count # per curve minimum y value
@@ -761,8 +1275,11 @@ class Plot(QWidget):
         self.y_min = None # minimum y value over all curves
         self.y_max = None # maximum y value over all curves
         self.y_type = None
-        self.partial_update_enabled = False
 
+        if self.spill != None:
+            self.spill.clear()
+
+        self.curve_area.invalidate()
         self.update()
         self.curve_area.update()
 
@@ -794,26 +1311,189 @@ class FixedSizeLabel(QLabel):
 
         return hint
 
+class SampleQueue(object):
+    """
+    Collects timestamped samples for a curve at the point where the values
+    are received, e.g. in a callback or a CallbackEmulator. A config getter
+    of a PlotWidget can return a SampleQueue instead of a single value, then
+    all samples queued since the last update are added to the plot with
+    their own timestamps. put() can be called from any thread.
+
+    If gap_length is given then the line is broken between two samples that
+    are more than gap_length seconds apart. The queue should be bounded by
+    max_length to about the number of samples that fit into the history of
+    the plot, because it is not drained while the plot is not updated, e.g.
+    while it is hidden or stopped. Samples that are older than the history
+    of the plot are dropped on update anyway.
+    """
+
+    def __init__(self, gap_length=None, max_length=100000):
+        self.gap_length = gap_length # seconds
+        self.samples = deque(maxlen=max_length)
+        self.last_value = None
+
+    def put(self, value, timestamp=None):
+        if timestamp == None:
+            timestamp = get_time()
+
+        self.samples.append((timestamp, value))
+        self.last_value = value
+
+    def take(self):
+        samples = []
+
+        try:
+            while True:
+                samples.append(self.samples.popleft())
+        except IndexError:
+            pass
+
+        return samples
+
+class PlotClock(QObject):
+    """
+    Process-wide clock that drives all PlotWidgets without an external
+    timer, so that all plots are updated in a single pass per tick instead
+    of by many unaligned timers. The clock ticks with the smallest update
+    interval of all registered plots, plots with a larger interval are only
+    updated every n-th tick. Plots that are hidden or in a minimized window
+    are skipped. If a pass takes too long or the ticks arrive late, because
+    the main thread is busy, then the tick rate is halved until the main
+    thread keeps up again.
+    """
+
+    MAX_SLOWDOWN = 8
+    RELAXED_TICKS_TO_SPEED_UP = 20
+
+    instance = None
+
+    @staticmethod
+    def get():
+        if PlotClock.instance == None:
+            PlotClock.instance = PlotClock()
+
+        return PlotClock.instance
+
+    def __init__(self):
+        QObject.__init__(self)
+
+        self.widgets = weakref.WeakSet()
+        self.base_interval = None # seconds
+        self.slowdown = 1
+        self.relaxed_ticks = 0
+        self.tick_count = 0
+        self.last_tick_time = None
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+
+    def add_widget(self, widget):
+        self.widgets.add(widget)
+        self.restart_timer()
+
+    def remove_widget(self, widget):
+        self.widgets.discard(widget)
+        self.restart_timer()
+
+    def restart_timer(self):
+        intervals = [widget.update_interval for widget in self.widgets]
+
+        if len(intervals) == 0:
+            self.base_interval = None
+            self.timer.stop()
+            return
+
+        self.base_interval = min(intervals)
+
+        for widget in self.widgets:
+            widget.tick_divider = max(int(round(widget.update_interval / self.base_interval)), 1)
+
+        self.last_tick_time = None
+        self.timer.start(int(self.base_interval * self.slowdown * 1000))
+
+    def tick(self):
+        start = get_time()
+        interval = self.base_interval * self.slowdown
+        lateness = 0
+
+        if self.last_tick_time != None:
+            lateness = start - self.last_tick_time - interval
+
+        self.last_tick_time = start
+        self.tick_count += 1
+
+        for widget in list(self.widgets):
+            if widget.stop or self.tick_count % widget.tick_divider != 0:
+                continue
+
+            try:
+                if not widget.isVisible() or widget.window().isMinimized():
+                    continue
+            except RuntimeError: # underlying C++ object was already deleted
+                self.widgets.discard(widget)
+                continue
+
+            widget.add_new_data(widget.tick_divider * interval)
+
+        duration = get_time() - start
+
+        if duration > interval / 2 or lateness > interval / 2:
+            self.relaxed_ticks = 0
+
+            if self.slowdown < PlotClock.MAX_SLOWDOWN:
+                self.slowdown *= 2
+                self.restart_timer()
+        elif self.slowdown > 1:
+            self.relaxed_ticks += 1
+
+            if self.relaxed_ticks >= PlotClock.RELAXED_TICKS_TO_SPEED_UP:
+                self.relaxed_ticks = 0
+                self.slowdown //= 2
+                self.restart_timer()
+
 class PlotWidget(QWidget):
+    # a value that is sampled on update is considered missing if it is more
+    # than GAP_FACTOR update intervals older than the previous one
+    GAP_FACTOR = 2.5
+
     def __init__(self, y_scale_title_text, configs, clear_button=None, parent=None,
                  scales_visible=True, curve_outer_border_visible=True,
                  curve_motion_granularity=10, canvas_color=QColor(245, 245, 245),
                  external_timer=None, key='top-value', extra_key_widgets=None,
-                 update_interval=0.1, curve_start='left'):
+                 update_interval=0.1, curve_start='left', history_length_x=20,
+                 spill_size=None, history_capacity=None):
         QWidget.__init__(self, parent)
 
         self.setMinimumSize(300, 250)
 
+        # number of values per curve that are kept in memory. by default there
+        # is room for a value and a gap per update within history_length_x.
+        # plots fed by a SampleQueue that receives more than one sample per
+        # update need to specify a larger capacity
+        if history_capacity == None:
+            history_capacity = 2 * int(math.ceil(history_length_x / float(update_interval))) + \
+                               curve_motion_granularity
+
         self.stop = True
         self.plot = Plot(self, y_scale_title_text, configs, scales_visible,
                          curve_outer_border_visible, curve_motion_granularity,
-                         canvas_color, curve_start)
+                         canvas_color, curve_start, history_length_x, history_capacity)
         self.set_fixed_y_scale = self.plot.set_fixed_y_scale
+
+        if spill_size != None:
+            self.plot.enable_spill(spill_size) # bytes
+
+        self.export_action = QAction('Export History...', self)
+        self.export_action.triggered.connect(self.export_clicked)
+
+        self.plot.addAction(self.export_action)
+        self.plot.setContextMenuPolicy(Qt.ActionsContextMenu)
         self.key = key
         self.key_items = []
         self.key_has_values = key.endswith('-value') if key != None else False
         self.first_show = True
-        self.timestamp = 0 # seconds
+        self.time_origin = get_time() # seconds
+        self.last_xs = [None] * len(configs) # per curve x value of the last sample
         self.update_interval = update_interval # seconds
         self.configs = configs
 
@@ -901,9 +1581,8 @@ class PlotWidget(QWidget):
             v2layout.addWidget(self.plot)
 
         if external_timer == None:
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.add_new_data)
-            self.timer.start(self.update_interval * 1000)
+            self.tick_divider = 1
+            PlotClock.get().add_widget(self)
         else:
             # assuming that the external timer runs with the configured interval
             external_timer.timeout.connect(self.add_new_data)
@@ -934,24 +1613,92 @@ class PlotWidget(QWidget):
         return self.key_items[i]
 
     # internal
-    def add_new_data(self):
+    def add_new_data(self, interval=None):
         if self.stop:
             return
 
+        if interval == None:
+            interval = self.update_interval
+
+        now = get_time()
+
         for i, config in enumerate(self.configs):
             value = config[2]()
 
-            if value != None:
-                if len(self.key_items) > 0 and self.key_has_values:
+            if isinstance(value, SampleQueue):
+                # samples that queued up while the plot was not updated are
+                # only added as far as they fit into the history
+                min_timestamp = now - self.plot.history_length_x
+                samples = [sample for sample in value.take() if sample[0] >= min_timestamp]
+                gap_length = value.gap_length
+                value = value.last_value
+            elif value != None:
+                samples = [(now, value)]
+                gap_length = PlotWidget.GAP_FACTOR * interval
+            else:
+                samples = []
+
+            if len(self.key_items) > 0 and self.key_has_values:
+                if value != None:
                     self.key_items[i].setText(config[0] + ': ' + config[3](value))
+                else:
+                    self.key_items[i].setText(config[0])
+
+            for timestamp, sample in samples:
+                x = timestamp - self.time_origin
+
+                if gap_length != None and self.last_xs[i] != None and x - self.last_xs[i] > gap_length:
+                    self.plot.add_gap(i)
+
+                self.plot.add_data(i, x, sample)
+                self.last_xs[i] = x
+
+    # file_format is 'csv', 'npy' or 'binary'. the history is written in
+    # chunks, so it is not copied in memory as a whole
+    def export_history(self, filename, file_format='csv'):
+        names = [config[0] for config in self.configs]
+        chunks = self.plot.get_history()
+
+        if file_format == 'csv':
+            with open(filename, 'wb') as f:
+                export_csv(f, names, chunks)
+        elif file_format == 'npy':
+            with open(filename, 'wb') as f:
+                export_npy(f, self.plot.get_history_length(), chunks)
+        elif file_format == 'binary':
+            with open(filename, 'wb') as f:
+                export_binary(f, names, chunks)
+        else:
+            raise ValueError('Unknown export format: {0}'.format(file_format))
+
+    # internal
+    def export_clicked(self):
+        filename = get_save_file_name(get_main_window(), 'Export History', get_home_path(),
+                                      'CSV Files (*.csv);;NumPy Files (*.npy);;Binary Files (*.bin)')
+
+        if len(filename) == 0:
+            return
+
+        if filename.lower().endswith('.npy'):
+            file_format = 'npy'
+        elif filename.lower().endswith('.bin'):
+            file_format = 'binary'
+        else:
+            file_format = 'csv'
 
-                self.plot.add_data(i, self.timestamp, value)
-            elif len(self.key_items) > 0 and self.key_has_values:
-                self.key_items[i].setText(config[0])
+            if not filename.lower().endswith('.csv'):
+                filename += '.csv'
 
-        self.timestamp += self.update_interval
+        try:
+            self.export_history(filename, file_format)
+        except (IOError, OSError) as e:
+            QMessageBox.critical(get_main_window(), 'Export History',
+                                 u'Could not export history to {0}:\n\n{1}'.format(filename, e),
+                                 QMessageBox.Ok)
 
     # internal
     def clear_clicked(self):
         self.plot.clear_graph()
+        self.time_origin = get_time()
+        self.last_xs = [None] * len(self.configs)
         self.counter = 0
@@ -29,7 +29,7 @@ from PyQt4.QtGui import QVBoxLayout, QWidget, QLinearGradient, \
 from brickv.plugin_system.plugin_base import PluginBase
 from brickv.bindings.bricklet_sound_intensity import BrickletSoundIntensity
 from brickv.async_call import async_call
-from brickv.plot_widget import PlotWidget
+from brickv.plot_widget import PlotWidget, SampleQueue
 from brickv.callback_emulator import CallbackEmulator
 
 class TuningThermo(QWidget):
@@ -75,26 +75,32 @@ class SoundIntensity(PluginBase):
 
         self.si = self.device
 
+        # keep at most the 20 seconds of 25ms samples the plot history can show
+        self.intensity_samples = SampleQueue(gap_length=0.25, max_length=20 * 1000 // 25)
         self.cbe_intensity = CallbackEmulator(self.si.get_intensity,
                                               self.cb_intensity,
-                                              self.increase_error_count)
+                                              self.increase_error_count,
+                                              sample_queue=self.intensity_samples)
 
-        self.current_intensity = None
         self.thermo = TuningThermo()
 
-        plots = [('Intensity Value', Qt.red, lambda: self.current_intensity, str)]
+        plots = [('Intensity Value', Qt.red, lambda: self.intensity_samples, str)]
         self.plot_widget = PlotWidget('Intensity Value', plots, curve_motion_granularity=40,
-                                      update_interval=0.025, extra_key_widgets=[self.thermo])
+                                      update_interval=0.025, extra_key_widgets=[self.thermo],
+                                      history_length_x=20)
 
         layout = QVBoxLayout(self)
         layout.addWidget(self.plot_widget)
 
     def cb_intensity(self, intensity):
         self.thermo.set_value(intensity)
-        self.current_intensity = intensity
+
+    def cb_initial_intensity(self, intensity):
+        self.intensity_samples.put(intensity)
+        self.cb_intensity(intensity)
 
     def start(self):
-        async_call(self.si.get_intensity, None, self.cb_intensity, self.increase_error_count)
+        async_call(self.si.get_intensity, None, self.cb_initial_intensity, self.increase_error_count)
         self.cbe_intensity.set_period(25)
 
         self.plot_widget.stop = False
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+brickv (Brick Viewer)
+Copyright (C) 2026 agent <agent@local>
+
+build_async_function_table.py: Collects the request metadata of the bindings
+                               for the AsyncIPConnection
+
+This program is free software; you can redistribute it and/or
+modify it under the terms of the GNU General Public License
+as published by the Free Software Foundation; either version 2
+of the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public
+License along with this program; if not, write to the
+Free Software Foundation, Inc., 59 Temple Place - Suite 330,
+Boston, MA 02111-1307, USA.
+"""
+
+# Has to be run after the bindings were updated. The table is written to
+# brickv/bindings/ip_connection_async_functions.py, so the AsyncIPConnection
+# doesn't need the source of the bindings at runtime.
+
+import os
+import ast
+
+root = os.path.abspath(__file__).replace(__file__, '')
+bindings = os.path.join(root, 'brickv', 'bindings')
+
+def is_send_request_call(node):
+    # matches self.ipcon.send_request(...)
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and \
+           node.func.attr == 'send_request' and len(node.args) == 5 and not node.keywords
+
+def get_function_entry(constants, definition):
+    body = definition.body
+
+    if ast.get_docstring(definition) is not None:
+        body = body[1:]
+
+    if len(body) != 1 or not isinstance(body[0], (ast.Return, ast.Expr)):
+        return None
+
+    call = body[0].value
+    result_type = None
+
+    if isinstance(body[0], ast.Return) and isinstance(call, ast.Call) and \
+       isinstance(call.func, ast.Name) and not call.keywords:
+        # Result(*self.ipcon.send_request(...)), Python 2 has starargs instead of Starred
+        if len(call.args) == 1 and hasattr(ast, 'Starred') and isinstance(call.args[0], ast.Starred):
+            result_type = call.func.id
+            call = call.args[0].value
+        elif len(call.args) == 0 and getattr(call, 'starargs', None) is not None:
+            result_type = call.func.id
+            call = call.starargs
+
+    if not is_send_request_call(call):
+        return None
+
+    device_arg, function_id_arg, data_arg, form_arg, form_ret_arg = call.args
+
+    if not isinstance(device_arg, ast.Name) or device_arg.id != 'self' or \
+       not isinstance(function_id_arg, ast.Attribute) or function_id_arg.attr not in constants or \
+       not isinstance(data_arg, ast.Tuple) or not all(isinstance(element, ast.Name) for element in data_arg.elts):
+        return None
+
+    data_names = tuple(element.id for element in data_arg.elts)
+    form = ast.literal_eval(form_arg)
+    form_ret = ast.literal_eval(form_ret_arg)
+
+    if isinstance(body[0], ast.Expr) and len(form_ret) > 0:
+        raise Exception('Response of {0} is dropped'.format(definition.name))
+
+    return constants[function_id_arg.attr], data_names, form, form_ret, result_type
+
+def collect_functions(path):
+    with open(path, 'rb') as f:
+        module = ast.parse(f.read())
+
+    classes = []
+
+    for node in module.body:
+        if not isinstance(node, ast.ClassDef) or \
+           not any(isinstance(base, ast.Name) and base.id == 'Device' for base in node.bases):
+            continue
+
+        constants = {}
+        functions = []
+
+        for item in node.body:
+            if isinstance(item, ast.Assign) and len(item.targets) == 1 and isinstance(item.targets[0], ast.Name):
+                try:
+                    value = ast.literal_eval(item.value)
+                except ValueError:
+                    continue
+
+                if isinstance(value, int):
+                    constants[item.targets[0].id] = value
+
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef):
+                entry = get_function_entry(constants, item)
+
+                if entry is not None:
+                    functions.append((item.name, entry))
+
+        classes.append((node.name, functions))
+
+    return classes
+
+lines = []
+count = 0
+
+for name in sorted(os.listdir(bindings)):
+    if not name.startswith('brick') or not name.endswith('.py'):
+        continue
+
+    for class_name, functions in collect_functions(os.path.join(bindings, name)):
+        lines.append('    {0!r}: {{\n'.format(class_name))
+
+        for function_name, entry in functions:
+            lines.append('        {0!r}: {1!r},\n'.format(function_name, entry))
+            count += 1
+
+        lines.append('    },\n')
+
+with open(os.path.join(bindings, 'ip_connection_async_functions.py'), 'wb') as f:
+    f.write(b'# -*- coding: utf-8 -*-\n')
+    f.write(b'# This file was generated by build_async_function_table.py, don\'t edit it.\n')
+    f.write(b'#\n')
+    f.write(b'# device class name -> function name -> (function ID, names of the request\n')
+    f.write(b'# parameters, request format, response format, result namedtuple or None)\n')
+    f.write(b'\n')
+    f.write(b'functions = {\n')
+    f.writelines(map(lambda s: s.encode('utf-8'), lines))
+    f.write(b'}\n')
+
+print('collected {0} functions'.format(count))
@@ -119,6 +119,11 @@ def prepare_manifest(root_path):
         else:
             raise Exception('No bindings found corresponding to plugin {0}'.format(plugin))
 
+    if sys.version_info < (3, 7):
+        # the asyncio based IP Connection uses Python 3.7 syntax and would fail to byte-compile
+        print('excluding Python 3 only binding: ip_connection_async')
+        excluded_patterns.append('exclude brickv/bindings/ip_connection_async.py')
+
     specialize_template('MANIFEST.in.template', 'MANIFEST.in',
                         {'<<EXCLUDES>>': '\n'.join(excluded_patterns)})
 
@@ -26,6 +26,7 @@ import os
 import sys
 import glob
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
 from brickv.config import BRICKV_VERSION
 
 BRICKV_DESCRIPTION = 'Small Qt GUI to control and test all Bricks and Bricklets from Tinkerforge'
@@ -36,6 +37,20 @@ if sys.platform == 'darwin':
 else:
     packages = find_packages(include=['brickv', 'brickv.*'])
 
+# Modules that need a newer Python than the one running setup.py, they would
+# fail to byte-compile
+py3_only_modules = [('brickv.bindings', 'ip_connection_async', (3, 7))]
+
+class BuildPy(build_py):
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+
+        for py3_package, py3_module, version in py3_only_modules:
+            if sys.version_info < version:
+                modules = [module for module in modules if module[:2] != (py3_package, py3_module)]
+
+        return modules
+
 # Collect non-frozen package_data
 package_data = {}
 
@@ -92,7 +107,8 @@ setup_arguments = {
     'description':  BRICKV_DESCRIPTION,
     'packages':     packages,
     'package_data': package_data,
-    'data_files':   data_files
+    'data_files':   data_files,
+    'cmdclass':     {'build_py': BuildPy}
 }
 
 if sys.platform.startswith('linux'):